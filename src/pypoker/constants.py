@@ -11,6 +11,11 @@ class OutsCalculationMethod(Enum):
     ExplicitFull = "explicit_full"
 
 
+class EquityCalculationMethod(Enum):
+    Exact = "exact"
+    MonteCarlo = "monte_carlo"
+
+
 """
 Card Construct Constants
 """
@@ -48,6 +53,17 @@ class CardSuit(Enum):
 
 CARD_SUIT_VALUES = [e.value for e in CardSuit]
 
+"""
+Card Integer Encoding Constants
+cards can be encoded as an integer between 0 and 51 where bits 0-1 hold the suit index and bits 2-5 hold the rank
+index. Ordering card integers is therefore the same as ordering cards by value then suit (Clubs to Spades).
+"""
+CARD_INT_SUIT_BITS = 2
+CARD_INT_SUIT_MASK = 0b11
+CARD_INT_SUITS = [CardSuit.Clubs, CardSuit.Diamonds, CardSuit.Hearts, CardSuit.Spades]
+CARD_INT_RANKS = [rank for rank in CardRank if rank != CardRank.Any]
+CARD_INT_SUIT_INDEXES = {suit: index for index, suit in enumerate(CARD_INT_SUITS)}
+
 """
 Hand Construct Constants
 """
@@ -59,6 +75,16 @@ class HandType(Enum):
     """
 
 
+"""
+Hand Key Constants
+hands are given a single comparable integer key, the hand strength is stored above bit 20 and up to five tiebreaker
+values are stored below it as 4 bit fields, most significant tiebreaker first. None tiebreakers are stored as zero.
+"""
+HAND_KEY_STRENGTH_SHIFT = 20
+HAND_KEY_TIEBREAKER_BITS = 4
+HAND_KEY_MAX_TIEBREAKERS = 5
+
+
 """
 Texas Hold'em Constants
 """
@@ -135,3 +161,32 @@ class GameHandNumCards(Enum):
 
 class GameHandTiebreakerArgs(Enum):
     TexasHoldem = TexasHoldemHandTiebreakerArgs
+
+
+"""
+Flat Hand Type Lookup Constants
+each hand type has a small integer code, its hand strength within its game (1 = weakest). the tuples below are indexed
+by hand type code, with index 0 unused, so hot paths can look up a hand type with a single index instead of going
+through the game Enums above, which remain the readable API.
+"""
+HAND_TYPE_CODES = {
+    hand_type: GameHandStrengths[game.name].value[hand_type.name].value
+    for game in GameTypes
+    for hand_type in GameHandTypes[game.name].value
+}
+
+TEXAS_HOLDEM_HAND_TYPES = (None,) + tuple(
+    sorted(TexasHoldemHandType, key=HAND_TYPE_CODES.__getitem__)
+)
+TEXAS_HOLDEM_TIEBREAKER_ARGS = (0,) + tuple(
+    TexasHoldemHandTiebreakerArgs[hand_type.name].value
+    for hand_type in TEXAS_HOLDEM_HAND_TYPES[1:]
+)
+TEXAS_HOLDEM_NUM_CARDS = ((0, 0),) + tuple(
+    TexasHoldemHandNumCards[hand_type.name].value
+    for hand_type in TEXAS_HOLDEM_HAND_TYPES[1:]
+)
+
+GAME_HAND_TYPES = {GameTypes.TexasHoldem: TEXAS_HOLDEM_HAND_TYPES}
+GAME_HAND_TIEBREAKER_ARGS = {GameTypes.TexasHoldem: TEXAS_HOLDEM_TIEBREAKER_ARGS}
+GAME_HAND_NUM_CARDS = {GameTypes.TexasHoldem: TEXAS_HOLDEM_NUM_CARDS}
@@ -5,9 +5,11 @@ pypoker.deck module
 Basic Dataclasses containing logic to represent a deck of cards as well as individual card objects
 """
 
+import math
 import random
 from dataclasses import dataclass, InitVar, field
-from typing import List
+from statistics import NormalDist
+from typing import List, Dict, Tuple, Union, Iterator
 
 from pypoker.constants import (
     CARD_ANY_VALUE,
@@ -16,21 +18,34 @@ from pypoker.constants import (
     CardSuit,
     CARD_SUIT_VALUES,
     CARD_RANK_VALUES,
+    CARD_INT_SUIT_BITS,
+    CARD_INT_SUIT_MASK,
+    CARD_INT_SUITS,
+    CARD_INT_RANKS,
+    HAND_KEY_TIEBREAKER_BITS,
+    HAND_KEY_MAX_TIEBREAKERS,
+    CARD_INT_SUIT_INDEXES,
     HandType,
     GameTypes,
-    GameHandTypes,
-    GameHandStrengths,
-    GameHandNumCards,
-    GameHandTiebreakerArgs,
+    HAND_TYPE_CODES,
+    GAME_HAND_TYPES,
+    GAME_HAND_NUM_CARDS,
+    GAME_HAND_TIEBREAKER_ARGS,
     OutsCalculationMethod,
 )
 from pypoker.exceptions import InvalidGameError, InvalidHandTypeError, GameMismatchError
+from pypoker.rng import RNG, random_below
 
+# registry of interned card objects keyed by card class and card ID, see Card.__new__
+_INTERNED_CARDS = {}
 
-@dataclass()
+
+@dataclass(frozen=True)
 class Card(object):
     """
-    Construct class used to represent a card within pypoker
+    Construct class used to represent a card within pypoker.
+    Card objects are immutable and interned, creating a card with an ID that has been seen before returns the same
+    shared card object.
     """
 
     card_id: InitVar[str]
@@ -39,12 +54,29 @@ class Card(object):
     value: int = field(init=False, compare=False, repr=False)
     name: str = field(init=False)
 
+    def __new__(cls, card_id: str = ""):
+        card = _INTERNED_CARDS.get((cls, cls._intern_key(card_id)))
+        if card is None:
+            card = super().__new__(cls)
+
+        return card
+
     def __post_init__(self, card_id):
-        self.identity = self._check_card_id(card_id)
-        self.rank = CardRank(card_id[1])
-        self.suit = CardSuit(card_id[0])
-        self.value = self._determine_value(self.rank)
-        self.name = f"{self.rank.name} of {self.suit.name}"
+        if self._is_interned():
+            return
+
+        identity = self._check_card_id(card_id)
+        self._set_card_attributes(
+            card_id, identity, CardRank(card_id[1]), CardSuit(card_id[0])
+        )
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.name == other.name
 
     def __gt__(self, other):
         if any(isinstance(obj, SpecialCard) for obj in [self, other]):
@@ -61,6 +93,80 @@ class Card(object):
     def __hash__(self):
         return hash(self.name)
 
+    def __reduce__(self):
+        return self.__class__, (self._card_id,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def to_int(self) -> int:
+        """
+        encodes the card as an integer between 0 and 51.
+        bits 0-1 hold the suit index and bits 2-5 hold the rank index, see constants.CARD_INT_SUITS
+
+        :return: integer encoding of the card
+        """
+
+        if isinstance(self, SpecialCard):
+            raise ValueError("Cannot encode cards of type SpecialCard as an integer")
+
+        return ((self.value - 2) << CARD_INT_SUIT_BITS) | CARD_INT_SUIT_INDEXES[
+            self.suit
+        ]
+
+    @staticmethod
+    def from_int(card_int: int) -> "Card":
+        """
+        builds the card object represented by an integer encoded card, the reverse of Card.to_int
+
+        :param card_int: integer encoding of a card between 0 and 51
+        :return: card object
+        """
+
+        if not isinstance(card_int, int) or not 0 <= card_int <= 51:
+            raise ValueError("Card integer must be an integer between 0 and 51")
+
+        return CARD_REGISTRY[card_int]
+
+    @classmethod
+    def _intern_key(cls, card_id: str) -> str:
+        """
+        Private method returning the key a card ID is interned under for this card class
+        """
+
+        return card_id
+
+    def _is_interned(self) -> bool:
+        """
+        Private method to check if this card object has already been initialised and interned
+        """
+
+        return "name" in self.__dict__
+
+    def _set_card_attributes(
+        self, card_id: str, identity: str, rank: CardRank, suit: CardSuit
+    ) -> None:
+        """
+        Private method to set the attributes of a new (frozen) card object and add it to the interned card registry
+
+        :param card_id: ID the card was created with
+        :param identity: validated identity of the card
+        :param rank: rank of the card
+        :param suit: suit of the card
+        """
+
+        key = self._intern_key(card_id)
+        object.__setattr__(self, "_card_id", key)
+        object.__setattr__(self, "identity", identity)
+        object.__setattr__(self, "rank", rank)
+        object.__setattr__(self, "suit", suit)
+        object.__setattr__(self, "value", self._determine_value(rank))
+        object.__setattr__(self, "name", f"{rank.name} of {suit.name}")
+        _INTERNED_CARDS[(self.__class__, key)] = self
+
     @staticmethod
     def _check_card_id(card_id: str) -> str:
         """
@@ -111,7 +217,7 @@ class Card(object):
         }[rank.name]
 
 
-@dataclass()
+@dataclass(frozen=True)
 class SpecialCard(Card):
     """
     data class to identify "special" cards
@@ -120,7 +226,7 @@ class SpecialCard(Card):
     """
 
 
-@dataclass()
+@dataclass(frozen=True)
 class AnyValueCard(SpecialCard):
 
     rank: CardRank = field(init=False, compare=False, repr=False)
@@ -129,11 +235,13 @@ class AnyValueCard(SpecialCard):
     name: str = field(init=False)
 
     def __post_init__(self, card_id):
-        self.identity = self._check_card_any_value_id(card_id)
-        self.rank = CardRank(CARD_ANY_VALUE)
-        self.suit = CardSuit(card_id)
-        self.value = self._determine_value(self.rank)
-        self.name = f"{self.rank.name} of {self.suit.name}"
+        if self._is_interned():
+            return
+
+        identity = self._check_card_any_value_id(card_id)
+        self._set_card_attributes(
+            card_id, identity, CardRank(CARD_ANY_VALUE), CardSuit(card_id)
+        )
 
     def __hash__(self):
         return hash(self.name)
@@ -167,7 +275,7 @@ class AnyValueCard(SpecialCard):
         return [card for card in cards if card.suit == self.suit]
 
 
-@dataclass()
+@dataclass(frozen=True)
 class AnySuitCard(SpecialCard):
 
     rank: CardRank = field(init=False, compare=False, repr=False)
@@ -176,11 +284,13 @@ class AnySuitCard(SpecialCard):
     name: str = field(init=False)
 
     def __post_init__(self, card_id):
-        self.identity = self._check_card_any_suit_id(card_id)
-        self.rank = CardRank(card_id)
-        self.suit = CardSuit(CARD_ANY_SUIT)
-        self.value = self._determine_value(self.rank)
-        self.name = f"{self.rank.name} of {self.suit.name}"
+        if self._is_interned():
+            return
+
+        identity = self._check_card_any_suit_id(card_id)
+        self._set_card_attributes(
+            card_id, identity, CardRank(card_id), CardSuit(CARD_ANY_SUIT)
+        )
 
     def __hash__(self):
         return hash(self.name)
@@ -214,7 +324,7 @@ class AnySuitCard(SpecialCard):
         return [card for card in cards if card.value == self.value]
 
 
-@dataclass()
+@dataclass(frozen=True)
 class AnyCard(SpecialCard):
 
     rank: CardRank = field(init=False, compare=False, repr=False)
@@ -223,11 +333,23 @@ class AnyCard(SpecialCard):
     name: str = field(init=False)
 
     def __post_init__(self, card_id):
-        self.identity = f"{CARD_ANY_SUIT}{CARD_ANY_VALUE}"
-        self.rank = CardRank(CARD_ANY_VALUE)
-        self.suit = CardSuit(CARD_ANY_SUIT)
-        self.value = self._determine_value(self.rank)
-        self.name = f"{self.rank.name} of {self.suit.name}"
+        if self._is_interned():
+            return
+
+        self._set_card_attributes(
+            card_id,
+            f"{CARD_ANY_SUIT}{CARD_ANY_VALUE}",
+            CardRank(CARD_ANY_VALUE),
+            CardSuit(CARD_ANY_SUIT),
+        )
+
+    @classmethod
+    def _intern_key(cls, card_id: str) -> str:
+        """
+        Private method returning the key a card ID is interned under, AnyCard ignores its ID so all share one key
+        """
+
+        return ""
 
     def __hash__(self):
         return hash(self.name)
@@ -243,12 +365,34 @@ class AnyCard(SpecialCard):
         return cards
 
 
+# interned card objects indexed by integer encoding (see Card.to_int)
+CARD_REGISTRY = tuple(
+    Card(f"{suit.value}{rank.value}")
+    for rank in CARD_INT_RANKS
+    for suit in CARD_INT_SUITS
+)
+
+# bit of each interned card object in a CardSet mask
+_CARD_BITS = {card: 1 << card_int for card_int, card in enumerate(CARD_REGISTRY)}
+
+# interned card objects in the order a new deck is built
+DECK_CARDS = tuple(
+    Card(f"{suit}{value}") for suit in "HDCS" for value in "23456789TJQKA"
+)
+
+
 class Deck(object):
     """
     Construct class used to represent a deck of cards within pypoker
     """
 
-    def __init__(self):
+    def __init__(self, rng: RNG = None):
+        """
+        :param rng: optional random.Random or numpy Generator used to shuffle and deal the deck, see pypoker.rng.
+            The random module is used if not given.
+        """
+
+        self.rng = rng
         self.cards_all: List[Card] = self._build_all_cards()
         self.cards_available: List[Card] = self.cards_all.copy()
         self.cards_used: List[Card] = []
@@ -261,28 +405,7 @@ class Deck(object):
         :return: list of all 52 playing card objects
         """
 
-        cards = []
-
-        for suit in ["H", "D", "C", "S"]:
-            for value in [
-                "2",
-                "3",
-                "4",
-                "5",
-                "6",
-                "7",
-                "8",
-                "9",
-                "T",
-                "J",
-                "Q",
-                "K",
-                "A",
-            ]:
-                card_id = f"{suit}{value}"
-                cards.append(Card(card_id))
-
-        return cards
+        return list(DECK_CARDS)
 
     def shuffle(self) -> None:
         """
@@ -291,7 +414,29 @@ class Deck(object):
         :return: None
         """
 
-        random.shuffle(self.cards_available)
+        if self.rng is None:
+            random.shuffle(self.cards_available)
+        else:
+            self.rng.shuffle(self.cards_available)
+
+    def deal(self, num: int = 1) -> List[Card]:
+        """
+        deals random cards from the deck. only the dealt cards are shuffled, with the first num steps of a
+        Fisher-Yates shuffle, so dealing a few cards costs far less than shuffling the whole deck.
+
+        :param num: the number of cards to deal
+        :return: the number of card objects specified
+        """
+
+        if num > len(self.cards_available):
+            raise ValueError("Not enough cards left in the deck!")
+
+        cards = self.cards_available
+        for index in range(num):
+            swap_index = index + random_below(self.rng, len(cards) - index)
+            cards[index], cards[swap_index] = cards[swap_index], cards[index]
+
+        return self.draw(num)
 
     def draw(self, num: int = 1) -> List[Card]:
         """
@@ -351,9 +496,201 @@ class Deck(object):
         return ordered_cards
 
 
+class ArrayDeck(object):
+    """
+    Construct class used to represent a deck of cards as a fixed array of integer encoded cards (see Card.to_int)
+    within pypoker. The array is split into three regions by two cursors, drawn cards, then live cards that can still
+    be drawn, then removed cards. Drawing moves the draw cursor forward and removing a card swaps it out of the live
+    region, so neither copies the deck. Resetting only rewinds the draw cursor, cards stay removed until restored.
+    """
+
+    def __init__(self, rng: RNG = None):
+        """
+        :param rng: optional random.Random or numpy Generator used to shuffle and deal the deck, see pypoker.rng.
+            The random module is used if not given.
+        """
+
+        self.rng = rng
+        self._card_ints: List[int] = list(range(len(CARD_REGISTRY)))
+        self._positions: List[int] = list(range(len(CARD_REGISTRY)))
+        self._draw_cursor = 0
+        self._live_end = len(CARD_REGISTRY)
+
+    def __len__(self) -> int:
+        return self._live_end - self._draw_cursor
+
+    @property
+    def cards_available(self) -> List[Card]:
+        """
+        the live cards that can still be drawn, in draw order
+        """
+
+        return self._get_cards(self._draw_cursor, self._live_end)
+
+    @property
+    def cards_used(self) -> List[Card]:
+        """
+        the cards drawn since the deck was last reset, in draw order
+        """
+
+        return self._get_cards(0, self._draw_cursor)
+
+    @property
+    def cards_removed(self) -> List[Card]:
+        """
+        the cards removed from the deck since it was last restored
+        """
+
+        return self._get_cards(self._live_end, len(self._card_ints))
+
+    def shuffle(self) -> None:
+        """
+        shuffles the live cards in place. drawn and removed cards are not moved.
+
+        :return: None
+        """
+
+        live_cards = self._card_ints[self._draw_cursor : self._live_end]
+        if self.rng is None:
+            random.shuffle(live_cards)
+        else:
+            self.rng.shuffle(live_cards)
+        self._card_ints[self._draw_cursor : self._live_end] = live_cards
+
+        # positions are only needed to remove cards, so they are rebuilt when next needed
+        self._positions = None
+
+    def draw(self, num: int = 1) -> List[Card]:
+        """
+        draws the number of cards from the deck as specified by moving the draw cursor forward
+
+        :param num: the number of cards to draw
+        :return: the number of card objects specified
+        """
+
+        start = self._draw_cursor
+        if start + num > self._live_end:
+            raise ValueError("Not enough cards left in the deck!")
+
+        self._draw_cursor += num
+        return list(
+            map(CARD_REGISTRY.__getitem__, self._card_ints[start : start + num])
+        )
+
+    def deal(self, num: int = 1) -> List[Card]:
+        """
+        deals random cards from the live cards. only the dealt cards are shuffled, with the first num steps of a
+        Fisher-Yates shuffle, so dealing a few cards costs far less than shuffling the whole deck.
+
+        :param num: the number of cards to deal
+        :return: the number of card objects specified
+        """
+
+        start = self._draw_cursor
+        if start + num > self._live_end:
+            raise ValueError("Not enough cards left in the deck!")
+
+        for position in range(start, start + num):
+            self._swap(
+                position, position + random_below(self.rng, self._live_end - position)
+            )
+
+        return self.draw(num)
+
+    def draw_ints(self, num: int = 1) -> List[int]:
+        """
+        draws the number of cards from the deck as specified, as integer encoded cards
+
+        :param num: the number of cards to draw
+        :return: the number of integer encoded cards specified
+        """
+
+        if num > self._live_end - self._draw_cursor:
+            raise ValueError("Not enough cards left in the deck!")
+
+        start = self._draw_cursor
+        self._draw_cursor += num
+        return self._card_ints[start : self._draw_cursor]
+
+    def remove(self, cards: List[Card]) -> None:
+        """
+        removes cards known to be out of play (e.g. dealt hole cards or dead cards) from the live cards, by swapping
+        each card to the end of the live region. every card is checked before any are removed, so the deck is left
+        unchanged if any card cannot be removed.
+
+        :param cards: list of card objects to remove
+        :return: None
+        """
+
+        if self._positions is None:
+            self._positions = [0] * len(self._card_ints)
+            for position, card_int in enumerate(self._card_ints):
+                self._positions[card_int] = position
+
+        card_ints = set()
+        for card in cards:
+            card_int = card.to_int()
+            position = self._positions[card_int]
+            if position < self._draw_cursor:
+                raise ValueError(f"Card '{card.name}' has already been drawn")
+            if position >= self._live_end or card_int in card_ints:
+                raise ValueError(f"Card '{card.name}' has already been removed")
+            card_ints.add(card_int)
+
+        for card in cards:
+            self._live_end -= 1
+            self._swap(self._positions[card.to_int()], self._live_end)
+
+    def reset(self) -> None:
+        """
+        returns every drawn card to the deck by rewinding the draw cursor. removed cards stay removed.
+
+        :return: None
+        """
+
+        self._draw_cursor = 0
+
+    def restore(self) -> None:
+        """
+        returns every drawn and removed card to the deck
+
+        :return: None
+        """
+
+        self._draw_cursor = 0
+        self._live_end = len(self._card_ints)
+
+    def _swap(self, first: int, second: int) -> None:
+        """
+        private method to swap the cards at two positions of the array, keeping the card positions up to date
+
+        :param first: position of the first card
+        :param second: position of the second card
+        """
+
+        card_ints = self._card_ints
+        card_ints[first], card_ints[second] = card_ints[second], card_ints[first]
+        if self._positions is not None:
+            self._positions[card_ints[first]] = first
+            self._positions[card_ints[second]] = second
+
+    def _get_cards(self, start: int, end: int) -> List[Card]:
+        """
+        private method to get the card objects between two positions of the array
+
+        :param start: first position
+        :param end: position after the last card
+        :return: list of card objects
+        """
+
+        return list(map(CARD_REGISTRY.__getitem__, self._card_ints[start:end]))
+
+
 class Hand(object):
     """
     Construct class used to represent a hand within pypoker.
+    The hand type, tiebreakers, strength and key are read only, as hands are compared by a key packed from them when
+    the hand is built.
     """
 
     def __init__(
@@ -362,102 +699,130 @@ class Hand(object):
         hand_type: HandType,
         cards: List[Card],
         tiebreakers: List[int],
+        validate: bool = True,
     ):
-        self.game = self._validate_game(game)
-        self.type = self._validate_type(game, hand_type)
-        self.cards = self._validate_cards(game, hand_type, cards)
-        self.tiebreakers = self._validate_tiebreakers(game, hand_type, tiebreakers)
-        self.strength = self._get_hand_strength(game, hand_type)
+        """
+        :param game: type of game the hand is from
+        :param hand_type: the type of hand
+        :param cards: list of card objects making up the hand
+        :param tiebreakers: list of tiebreaker card values (1-14) or None
+        :param validate: Boolean indicating if the game, hand type, cards and tiebreakers should be validated. The
+            engines skip validation for the hands they build, as their arguments are already known to be valid.
+        """
+
+        if validate:
+            game = self._validate_game(game)
+            hand_type = self._validate_type(game, hand_type)
+            cards = self._validate_cards(game, hand_type, cards)
+            tiebreakers = self._validate_tiebreakers(game, hand_type, tiebreakers)
+
+        self.game = game
+        self.cards = cards
+        self._type = hand_type
+        self._tiebreakers = tuple(tiebreakers)
+        self._strength = self._get_hand_strength(game, hand_type)
+        self._key = self.pack_key(self._strength, self._tiebreakers)
+
+    @property
+    def type(self) -> HandType:
+        """
+        the type of hand
+        """
+
+        return self._type
+
+    @property
+    def tiebreakers(self) -> List[int]:
+        """
+        list of tiebreaker card values (1-14) or None, a new list is returned so the hand cannot be changed through it
+        """
+
+        return list(self._tiebreakers)
+
+    @property
+    def strength(self) -> int:
+        """
+        strength of the hand type
+        """
+
+        return self._strength
+
+    @property
+    def key(self) -> int:
+        """
+        integer key packed from the strength and tiebreakers, a higher key is always a better hand. see pack_key
+        """
+
+        return self._key
 
     def __eq__(self, other):
         """
         Tests equality of hands in terms of hand type, strength and tiebreakers.
         equality check does not check that hand.cards are the same.
         """
-        if self.game != other.game:
-            raise GameMismatchError(
-                "Hand comparisons can only occur for hands of the same game type."
-            )
-
-        return self.strength == other.strength and self.tiebreakers == other.tiebreakers
+        self._check_same_game(other)
+        return self._key == other._key
 
     def __gt__(self, other):
         """
         Tests equality of hands in terms of hand type, strength and tiebreakers.
         equality check does not check that hand.cards are the same.
         """
-        if self.game != other.game:
-            raise GameMismatchError(
-                "Hand comparisons can only occur for hands of the same game type."
-            )
-
-        if self.strength > other.strength:
-            return True
-        if self.strength < other.strength:
-            return False
-
-        for self_value, other_value in zip(self.tiebreakers, other.tiebreakers):
-            if self_value is None and other_value is None:
-                continue
-            if self_value is None and other_value is not None:
-                return False
-            if other_value is None and self_value is not None:
-                return True
-            if self_value > other_value:
-                return True
-            if self_value < other_value:
-                return False
-
-        return False
+        self._check_same_game(other)
+        return self._key > other._key
 
     def __lt__(self, other):
         """
         Tests equality of hands in terms of hand type, strength and tiebreakers.
         equality check does not check that hand.cards are the same.
         """
-        if self.game != other.game:
-            raise GameMismatchError(
-                "Hand comparisons can only occur for hands of the same game type."
-            )
-
-        if self.strength > other.strength:
-            return False
-        if self.strength < other.strength:
-            return True
-
-        for self_value, other_value in zip(self.tiebreakers, other.tiebreakers):
-            if self_value is None and other_value is None:
-                continue
-            if self_value is None and other_value is not None:
-                return True
-            if other_value is None and self_value is not None:
-                return False
-            if self_value > other_value:
-                return False
-            if self_value < other_value:
-                return True
-
-        return False
+        self._check_same_game(other)
+        return self._key < other._key
 
     def __ge__(self, other):
         """
         Tests equality of hands in terms of hand type, strength and tiebreakers.
         equality check does not check that hand.cards are the same.
         """
-        if self.__eq__(other) or self.__gt__(other):
-            return True
-
-        return False
+        self._check_same_game(other)
+        return self._key >= other._key
 
     def __le__(self, other):
         """
         Tests equality of hands in terms of hand type, strength and tiebreakers.
         equality check does not check that hand.cards are the same.
         """
-        if self.__eq__(other) or self.__lt__(other):
-            return True
+        self._check_same_game(other)
+        return self._key <= other._key
+
+    @staticmethod
+    def pack_key(strength: int, tiebreakers: List[int]) -> int:
+        """
+        packs a hand strength and its tiebreakers into a single integer key, a higher key is always a better hand.
+        see constants "Hand Key Constants" for the key layout.
+
+        :param strength: strength of the hand type
+        :param tiebreakers: list of tiebreaker card values (1-14) or None
+
+        :return: integer key of the hand
+        """
 
-        return False
+        key = strength
+        for position in range(HAND_KEY_MAX_TIEBREAKERS):
+            value = tiebreakers[position] if position < len(tiebreakers) else None
+            key = (key << HAND_KEY_TIEBREAKER_BITS) | (value or 0)
+
+        return key
+
+    def _check_same_game(self, other):
+        """
+        private method to check that a hand being compared to is from the same game as this hand
+        """
+
+        if self.game != other.game:
+            raise GameMismatchError(
+                "Hand comparisons can only occur for hands of the same game type."
+            )
 
     @staticmethod
     def _validate_game(game: GameTypes) -> GameTypes:
@@ -490,8 +855,7 @@ class Hand(object):
                 "hand_type passed to Hand is not of type HandType"
             )
 
-        hand_types = GameHandTypes[game.name].value
-        if hand_type not in hand_types:
+        if hand_type not in GAME_HAND_TYPES[game]:
             raise InvalidHandTypeError(
                 f"Hand type '{hand_type}' is not part of {game} hand types"
             )
@@ -514,7 +878,7 @@ class Hand(object):
                 "Cards object passed to hand must be a list of Card objects"
             )
 
-        min_cards, max_cards = GameHandNumCards[game.name].value[hand_type.name].value
+        min_cards, max_cards = GAME_HAND_NUM_CARDS[game][HAND_TYPE_CODES[hand_type]]
         if not min_cards <= len(cards) <= max_cards:
             raise ValueError(
                 f"{game} {hand_type} hand required between {min_cards} and {max_cards} cards"
@@ -533,7 +897,7 @@ class Hand(object):
         :return: strength of the hand type for the specific game type
         """
 
-        return GameHandStrengths[game.name].value[hand_type.name].value
+        return HAND_TYPE_CODES[hand_type]
 
     @staticmethod
     def _validate_tiebreakers(
@@ -555,8 +919,300 @@ class Hand(object):
                 "all arguments in tiebreakers must be integers or Nonetype"
             )
 
-        arg_num = GameHandTiebreakerArgs[game.name].value[hand_type.name].value
+        arg_num = GAME_HAND_TIEBREAKER_ARGS[game][HAND_TYPE_CODES[hand_type]]
         if not len(tiebreakers) == arg_num:
             raise ValueError(f"{game} {hand_type} hand requires {arg_num} tiebreakers")
 
         return tiebreakers
+
+
+@dataclass
+class PlayerEquity(object):
+    """
+    Construct class used to represent a players share of the possible outcomes of a hand within pypoker.
+    tied outcomes are also counted by the number of players sharing the pot, so equity can be calculated exactly.
+    """
+
+    wins: int = 0
+    ties: int = 0
+    losses: int = 0
+    tie_counts: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return self.wins + self.ties + self.losses
+
+    @property
+    def win_share(self) -> float:
+        return self.wins / self.total if self.total else 0.0
+
+    @property
+    def tie_share(self) -> float:
+        return self.ties / self.total if self.total else 0.0
+
+    @property
+    def loss_share(self) -> float:
+        return self.losses / self.total if self.total else 0.0
+
+    @property
+    def equity(self) -> float:
+        """
+        the players expected share of the pot, tied pots are split evenly between the players sharing them
+        """
+
+        if not self.total:
+            return 0.0
+
+        tie_equity = sum(count / num for num, count in self.tie_counts.items())
+        return (self.wins + tie_equity) / self.total
+
+    @property
+    def standard_error(self) -> float:
+        """
+        the standard error of the equity when the outcomes counted are a random sample of all possible outcomes
+        """
+
+        if not self.total:
+            return 0.0
+
+        # each outcome is worth 1 for a win, 1/num for a tie shared by num players and 0 for a loss
+        mean_square = (
+            self.wins
+            + sum(count / (num * num) for num, count in self.tie_counts.items())
+        ) / self.total
+        variance = max(mean_square - self.equity * self.equity, 0.0)
+        return math.sqrt(variance / self.total)
+
+    def confidence_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        the normal approximation confidence interval of the equity when the outcomes counted are a random sample
+
+        :param confidence: confidence level of the interval, between 0 and 1
+        :return: tuple of the lower and upper bounds of the interval, clipped to between 0 and 1
+        """
+
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1")
+
+        margin = NormalDist().inv_cdf((1 + confidence) / 2) * self.standard_error
+        return max(self.equity - margin, 0.0), min(self.equity + margin, 1.0)
+
+
+@dataclass
+class OutsCount(object):
+    """
+    Construct class used to represent how many of the possible draws would give a player a hand type within pypoker.
+    """
+
+    hits: int = 0
+    combinations: int = 0
+
+    @property
+    def misses(self) -> int:
+        return self.combinations - self.hits
+
+    @property
+    def probability(self) -> float:
+        """
+        the chance of the remaining draws giving the player the hand type
+        """
+
+        return self.hits / self.combinations if self.combinations else 0.0
+
+
+@dataclass
+class OutsReport(object):
+    """
+    Construct class used to represent a players outs to every hand type within pypoker.
+    outs holds the outs (or OutsCount) of each hand type on its own, so a draw making a full house is also counted in
+    the trips and pair outs. at_least holds the number of draws whose best hand is the hand type or better, it is
+    left empty unless it is asked for.
+    """
+
+    outs: Dict[HandType, Union[List[List[Card]], OutsCount]] = field(
+        default_factory=dict
+    )
+    at_least: Dict[HandType, OutsCount] = field(default_factory=dict)
+
+
+class CardCounts(object):
+    """
+    Construct class used to count a set of cards by value, by suit and by suit and value within pypoker.
+    counts are updated in constant time as single cards are added or removed, so they can be kept up to date as cards
+    are dealt instead of regrouping the cards each time.
+    """
+
+    def __init__(self, cards: List[Card] = None):
+        """
+        :param cards: optional list of normal cards to count
+        """
+
+        self.by_value = [0] * len(CARD_INT_RANKS)
+        self.by_suit = [0] * len(CARD_INT_SUITS)
+        self.by_suit_value = [[0] * len(CARD_INT_RANKS) for _ in CARD_INT_SUITS]
+        self.total = 0
+
+        for card in cards or []:
+            self.add(card)
+
+    def __len__(self) -> int:
+        return self.total
+
+    def add(self, card: Card) -> None:
+        """
+        count a card
+
+        :param card: normal card object to count
+        """
+
+        self._update(card, 1)
+
+    def remove(self, card: Card) -> None:
+        """
+        stop counting a card
+
+        :param card: normal card object to stop counting
+        """
+
+        self._update(card, -1)
+
+    def _update(self, card: Card, change: int) -> None:
+        """
+        private method to change the counts of a cards value and suit
+
+        :param card: normal card object
+        :param change: amount to change the counts by
+        """
+
+        card_int = card.to_int()
+        value_index = card_int >> CARD_INT_SUIT_BITS
+        suit_index = card_int & CARD_INT_SUIT_MASK
+
+        self.by_value[value_index] += change
+        self.by_suit[suit_index] += change
+        self.by_suit_value[suit_index][value_index] += change
+        self.total += change
+
+
+@dataclass(frozen=True)
+class CardSet(object):
+    """
+    Construct class used to represent an immutable set of normal cards as a 52 bit mask within pypoker.
+    bit n of the mask is set when the card with integer encoding n (see Card.to_int) is in the set, so union,
+    intersection, difference and membership tests are single integer operations.
+    cards are iterated in canonical order, lowest integer encoding first.
+    """
+
+    mask: int = 0
+
+    def __post_init__(self):
+        if not isinstance(self.mask, int) or not 0 <= self.mask < 1 << len(
+            CARD_REGISTRY
+        ):
+            raise ValueError(
+                f"CardSet mask must be an integer between 0 and {(1 << len(CARD_REGISTRY)) - 1}"
+            )
+
+    @classmethod
+    def from_cards(cls, cards: List[Card]) -> "CardSet":
+        """
+        builds the card set holding the given cards, duplicate cards are only held once
+
+        :param cards: List of normal card objects
+        :return: CardSet object
+        """
+
+        mask = 0
+        for card in cards:
+            card_bit = _CARD_BITS.get(card)
+            if card_bit is None:
+                raise ValueError("Cannot add cards of type SpecialCard to a CardSet")
+            mask |= card_bit
+
+        return cls(mask)
+
+    @classmethod
+    def from_ints(cls, card_ints: List[int]) -> "CardSet":
+        """
+        builds the card set holding the given integer encoded cards
+
+        :param card_ints: List of integer encoded cards between 0 and 51
+        :return: CardSet object
+        """
+
+        mask = 0
+        for card_int in card_ints:
+            mask |= 1 << card_int
+
+        return cls(mask)
+
+    def to_cards(self) -> List[Card]:
+        """
+        :return: list of the card objects in the set, in canonical order
+        """
+
+        return list(self)
+
+    def to_ints(self) -> List[int]:
+        """
+        :return: list of the integer encoded cards in the set, in ascending order
+        """
+
+        card_ints = []
+        mask = self.mask
+        while mask:
+            low_bit = mask & -mask
+            card_ints.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+
+        return card_ints
+
+    def __iter__(self) -> Iterator[Card]:
+        mask = self.mask
+        while mask:
+            low_bit = mask & -mask
+            yield CARD_REGISTRY[low_bit.bit_length() - 1]
+            mask ^= low_bit
+
+    def __len__(self) -> int:
+        return bin(self.mask).count("1")
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __contains__(self, card: Card) -> bool:
+        return bool(self.mask & _CARD_BITS.get(card, 0))
+
+    def __or__(self, other: "CardSet") -> "CardSet":
+        if not isinstance(other, CardSet):
+            return NotImplemented
+
+        return CardSet(self.mask | other.mask)
+
+    def __and__(self, other: "CardSet") -> "CardSet":
+        if not isinstance(other, CardSet):
+            return NotImplemented
+
+        return CardSet(self.mask & other.mask)
+
+    def __sub__(self, other: "CardSet") -> "CardSet":
+        if not isinstance(other, CardSet):
+            return NotImplemented
+
+        return CardSet(self.mask & ~other.mask)
+
+    def isdisjoint(self, other: "CardSet") -> bool:
+        """
+        :param other: CardSet to test against
+        :return: boolean of True if the sets hold no cards in common
+        """
+
+        return not self.mask & other.mask
+
+    def issubset(self, other: "CardSet") -> bool:
+        """
+        :param other: CardSet to test against
+        :return: boolean of True if every card in this set is also in the other set
+        """
+
+        return not self.mask & ~other.mask
@@ -9,13 +9,19 @@ the following tasks will be handled by the pypoker.engine classes:
     find odds of a player making X hand type from current position
     find odds of each player winning from current position
 """
-import itertools
 from abc import ABCMeta, abstractmethod
-from itertools import groupby, product, combinations
-from typing import List, Dict
-
-from pypoker.constants import HandType, OutsCalculationMethod, CardSuit
-from pypoker.constructs import Card, Hand, Deck
+from itertools import product, combinations
+from typing import List, Dict, Tuple, Union
+
+from pypoker.constants import (
+    HandType,
+    OutsCalculationMethod,
+    CardSuit,
+    CARD_INT_SUIT_BITS,
+    CARD_INT_SUIT_MASK,
+    CARD_INT_SUITS,
+)
+from pypoker.constructs import Card, Hand, Deck, PlayerEquity, CardSet, _CARD_BITS
 from pypoker.player import BasePlayer
 
 
@@ -60,25 +66,68 @@ class BasePokerEngine(object, metaclass=ABCMeta):
         any surplus draw cards not required to make the hand.
         """
 
+    @abstractmethod
+    def calculate_equity(
+        self, players: List[BasePlayer], board: List[Card], dead_cards: List[Card]
+    ) -> List[PlayerEquity]:
+        """
+        abstract method to calculate each players share of the pot if all remaining board cards were dealt out.
+
+        :param players: list of pypoker player objects with their hole cards set
+        :param board: list of the current board cards
+        :param dead_cards: list of cards known to be out of the deck that are not held by any of the players
+
+        :return: list of PlayerEquity objects in the same order as the players list
+        """
+
     # Shared utility methods for all engine classes
     # ---------------------------------------------
     @staticmethod
-    def group_cards_by_suit(cards: List[Card]) -> Dict[str, List[Card]]:
+    def get_card_value(card: Union[Card, int]) -> int:
+        """
+        Shared utility method to get the value of a card object or integer encoded card (see Card.to_int)
+
+        :param card: Card object or integer encoded card
+        :return: card value between 2 and 14 (0 for special cards)
+        """
+
+        if isinstance(card, int):
+            return (card >> CARD_INT_SUIT_BITS) + 2
+
+        return card.value
+
+    @staticmethod
+    def get_card_suit(card: Union[Card, int]) -> CardSuit:
+        """
+        Shared utility method to get the suit of a card object or integer encoded card (see Card.to_int)
+
+        :param card: Card object or integer encoded card
+        :return: CardSuit enum of the card
+        """
+
+        if isinstance(card, int):
+            return CARD_INT_SUITS[card & CARD_INT_SUIT_MASK]
+
+        return card.suit
+
+    @staticmethod
+    def group_cards_by_suit(
+        cards: Union[List[Union[Card, int]], CardSet],
+    ) -> Dict[str, List[Card]]:
         """
         Shared utility method of BasePokerEngine class that will group the given cards by suit.
         return dictionary will contain entries for each suit even if the cardset dosent have any of that suit
 
-        :param cards: List of pypoker.deck.Card objects
+        :param cards: List of pypoker.deck.Card objects, integer encoded cards or a CardSet
         :return: Dictionary of lists of cards by suit "Clubs", "Diamonds", "Hearts", "Spades"
         """
 
-        suit_group = {
-            suit: list(group)
-            for suit, group in groupby(
-                sorted(cards, key=lambda card: card.suit.name),
-                key=lambda card: card.suit.name,
-            )
-        }
+        suit_group = {}
+        for card in cards:
+            suit = BasePokerEngine.get_card_suit(card)
+            suit_group.setdefault(suit.name, []).append(card)
+
+        suit_group = {suit: suit_group[suit] for suit in sorted(suit_group)}
 
         # Add missing suits as empty lists
         for suit in [
@@ -87,41 +136,46 @@ class BasePokerEngine(object, metaclass=ABCMeta):
             CardSuit.Clubs,
             CardSuit.Spades,
         ]:
-            if suit.name not in suit_group.keys():
+            if suit.name not in suit_group:
                 suit_group[suit.name] = []
 
         return suit_group
 
     @staticmethod
-    def group_cards_by_value(cards: List[Card]) -> Dict[int, List[Card]]:
+    def group_cards_by_value(
+        cards: Union[List[Union[Card, int]], CardSet],
+    ) -> Dict[int, List[Card]]:
         """
         Shared utility method of BasePokerEngine class to group the given cards by value.
         return dictionary will contain entries for each value even if the cardset dosen't have any of that value
 
-        :param cards: List of pypoker.deck.Card objects
+        :param cards: List of pypoker.deck.Card objects, integer encoded cards or a CardSet
         :return: Dictionary of lists of cards by card value (2-14)
         """
 
-        values_group = {
-            value: list(group)
-            for value, group in groupby(
-                sorted(cards, key=lambda card: card.value), key=lambda card: card.value
-            )
-        }
+        values_group = {}
+        for card in cards:
+            value = BasePokerEngine.get_card_value(card)
+            values_group.setdefault(value, []).append(card)
+
+        values_group = {value: values_group[value] for value in sorted(values_group)}
 
         for value in range(2, 15):
-            if value not in values_group.keys():
+            if value not in values_group:
                 values_group[value] = []
 
         return values_group
 
     def find_consecutive_value_cards(
-        self, cards: List[Card], treat_ace_low: bool = True, run_size: int = None
+        self,
+        cards: Union[List[Union[Card, int]], CardSet],
+        treat_ace_low: bool = True,
+        run_size: int = None,
     ) -> List[List[Card]]:
         """
         Shared utility method of BasePokerEngine to find consecutive runs of cards based on value.
 
-        :param cards: List of card objects.
+        :param cards: List of card objects, integer encoded cards or a CardSet.
         :param treat_ace_low: boolean indicating if the ace should also be treated as a low card.
         :param run_size: integer indicating what size of run you are looking for. If given, then all overlapping
             runs of this size are returned. If not given then only the longest, non overlapping runs are returned
@@ -170,66 +224,76 @@ class BasePokerEngine(object, metaclass=ABCMeta):
         )
 
     @staticmethod
-    def check_all_card_values_unique(cards: List[Card]) -> bool:
+    def check_all_card_values_unique(
+        cards: Union[List[Union[Card, int]], CardSet],
+    ) -> bool:
         """
         Shared utility method to test if the given cards all have a unique value.
 
-        :param cards: List of Card objects to test
+        :param cards: List of Card objects, integer encoded cards or a CardSet to test
         :returns: boolean of True if all card values are unique or False if there is at least one duplicate value
         """
 
-        values = [card.value for card in cards]
+        values = [BasePokerEngine.get_card_value(card) for card in cards]
         return len(values) == len(set(values))
 
     @staticmethod
-    def check_all_card_values_match(cards: List[Card]) -> bool:
+    def check_all_card_values_match(
+        cards: Union[List[Union[Card, int]], CardSet],
+    ) -> bool:
         """
         Shared utility method to test if the given cards all have the same value.
 
-        :param cards: List of Card objects to test
+        :param cards: List of Card objects, integer encoded cards or a CardSet to test
         :returns: boolean of True if all card values are the same or False if there is any different value cards
         """
 
-        values = [card.value for card in cards]
+        values = [BasePokerEngine.get_card_value(card) for card in cards]
         return len(set(values)) == 1
 
     @staticmethod
-    def check_all_card_suits_unique(cards: List[Card]) -> bool:
+    def check_all_card_suits_unique(
+        cards: Union[List[Union[Card, int]], CardSet],
+    ) -> bool:
         """
         Shared utility method to test if the given cards all have a unique suit.
 
-        :param cards: List of Card objects to test
+        :param cards: List of Card objects, integer encoded cards or a CardSet to test
         :returns: boolean of True if all card values are unique or False if there is at least one duplicate suit
         """
 
-        suits = [card.suit for card in cards]
+        suits = [BasePokerEngine.get_card_suit(card) for card in cards]
         return len(suits) == len(set(suits))
 
     @staticmethod
-    def check_all_card_suits_match(cards: List[Card]) -> bool:
+    def check_all_card_suits_match(
+        cards: Union[List[Union[Card, int]], CardSet],
+    ) -> bool:
         """
         Shared utility method to test if the given cards all have the same suit.
 
-        :param cards: List of Card objects to test
+        :param cards: List of Card objects, integer encoded cards or a CardSet to test
         :returns: boolean of True if all card suits are the same or False if there is any different suited cards
         """
 
-        suits = [card.suit for card in cards]
+        suits = [BasePokerEngine.get_card_suit(card) for card in cards]
         return len(set(suits)) == 1
 
     @staticmethod
-    def check_cards_consecutive(cards: List[Card], treat_ace_low: bool = True) -> bool:
+    def check_cards_consecutive(
+        cards: Union[List[Union[Card, int]], CardSet], treat_ace_low: bool = True
+    ) -> bool:
         """
         Shared utility method to test if a set of cards have consecutive values.
         repeated values will cause this to evaluate false.
         list of cards do not need to be ordered before passing to this method
 
-        :param cards: List of Card objects to test
+        :param cards: List of Card objects, integer encoded cards or a CardSet to test
         :param treat_ace_low: indicates if Aces should also be treated as low cards(value 1)
         :returns: boolean of True if cards are consecutive, False otherwise
         """
 
-        card_vals = [card.value for card in cards]
+        card_vals = [BasePokerEngine.get_card_value(card) for card in cards]
 
         consecutive = sorted(card_vals) == list(
             range(min(card_vals), max(card_vals) + 1)
@@ -246,13 +310,13 @@ class BasePokerEngine(object, metaclass=ABCMeta):
         return consecutive or consecutive_ace_low
 
     @staticmethod
-    def order_cards(cards: List[Card]):
+    def order_cards(cards: Union[List[Card], CardSet]):
         """
         Helper function provided to order cards as one would in a hand.
         Cards provided are sorted by value (High to Low) then by suit (Reverse Alphabetical Order)
         This is mostly done to make analysis of hand outs easy as hand card order will always be the same.
 
-        :param cards: List of card objects to sort
+        :param cards: List of card objects to sort, or a CardSet
         """
 
         ordered = sorted(
@@ -260,23 +324,62 @@ class BasePokerEngine(object, metaclass=ABCMeta):
         )
         return ordered
 
-    def deduplicate_card_sets(self, card_sets: List[List[Card]]):
+    @staticmethod
+    def get_card_set_key(
+        cards: Union[List[Card], CardSet],
+    ) -> Tuple[int, Tuple[str, ...]]:
         """
-        Public helper method
+        Shared utility method to build a hashable key for a set of cards that ignores the order of the cards.
+        normal cards are held in a bitmask of their integer encodings (see Card.to_int) and special cards in a sorted
+        tuple of their names, as a set can hold the same special card more than once.
+        card bits are looked up from the interned card objects, as hashing a card is much cheaper than encoding it.
+
+        :param cards: List of Card objects or a CardSet, whose mask is used as it is
+        :return: tuple of the normal card bitmask and the special card names
         """
 
-        # Order cards in each card set
-        card_sets = [self.order_cards(card_set) for card_set in card_sets]
+        if isinstance(cards, CardSet):
+            return cards.mask, ()
 
-        # sort and deduplicate card sets
-        card_sets.sort(
-            key=lambda cards: (
-                [card.value for card in cards],
-                [card.suit.value for card in cards],
-            ),
-            reverse=True,
-        )
-        return list(k for k, _ in itertools.groupby(card_sets))
+        card_mask = 0
+        special_names = []
+        for card in cards:
+            card_bit = _CARD_BITS.get(card)
+            if card_bit is None:
+                special_names.append(card.name)
+            else:
+                card_mask |= card_bit
+
+        return card_mask, tuple(sorted(special_names))
+
+    def deduplicate_card_sets(
+        self, card_sets: List[List[Card]], keep_order: bool = False
+    ) -> List[List[Card]]:
+        """
+        Public helper method to remove card sets holding the same cards as an earlier set, in any order.
+        duplicates are found by hashing each set with get_card_set_key, so only the unique sets are sorted.
+
+        :param card_sets: List of lists of card objects
+        :param keep_order: Boolean indicating if the unique sets should be returned in the order they were first seen.
+            If False the sets are sorted high to low by their card values, then suits.
+        :return: List of the unique card sets, with the cards in each set ordered by order_cards
+        """
+
+        unique_sets = {}
+        for card_set in card_sets:
+            unique_sets.setdefault(self.get_card_set_key(card_set), card_set)
+
+        card_sets = [self.order_cards(card_set) for card_set in unique_sets.values()]
+        if not keep_order:
+            card_sets.sort(
+                key=lambda cards: (
+                    [card.value for card in cards],
+                    [card.suit.value for card in cards],
+                ),
+                reverse=True,
+            )
+
+        return card_sets
 
     # Private Method Implementations
     # ------------------------------
@@ -0,0 +1,401 @@
+"""
+pypoker.engine.cache module
+---------------------------
+
+opt-in memoisation of poker engine results.
+the CachedPokerEngine wraps any BasePokerEngine subclass and stores the results of find_player_best_hand,
+find_player_outs and exact calculate_equity calls in a bounded least recently used store. keys are built from the
+integer encoded cards of each call (see Card.to_int), so the order cards are given in does not change which entry
+is used. the cards held by a stored result (e.g. Hand.cards and each out) keep the order of the call that filled the
+entry, so a later call giving the same cards in another order gets them in the first calls order.
+
+stored results are frozen. card set results are returned as tuples and any mutable objects held in a result (hands,
+equities, outs counts) are copied on the way out, so callers cannot change a stored result.
+"""
+
+import inspect
+import sys
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from enum import Enum
+from typing import List, Any, Hashable, Callable, Tuple, Union, Dict
+
+from pypoker.constants import HandType, EquityCalculationMethod
+from pypoker.constructs import Card, Hand, PlayerEquity, OutsCount
+from pypoker.engine import BasePokerEngine
+from pypoker.player import BasePlayer
+
+DEFAULT_MAX_ENTRIES = 10000
+
+# keyword arguments that change how a result is found but not the result itself
+_UNKEYED_ARGS = {"workers"}
+
+
+@dataclass(frozen=True)
+class CacheStats(object):
+    """
+    snapshot of the counters of a CachedPokerEngine
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUResultStore(object):
+    """
+    least recently used store of frozen results, bounded by a number of entries and/or an estimated size in bytes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = None,
+        freeze: bool = True,
+    ):
+        """
+        :param max_entries: maximum number of results to store, unbounded if None
+        :param max_bytes: maximum estimated size in bytes of the stored results, unbounded if None
+        :param freeze: Boolean indicating if results should be frozen before they are stored. Only turn this off if
+            every caller copies results before handing them out.
+        """
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.freeze = freeze
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        find the stored result of a key, computing and storing it if it is not stored.
+        the result is marked as most recently used.
+
+        :param key: hashable key of the result
+        :param compute: function returning the result if it is not stored
+        :return: the stored result
+        """
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        result = compute()
+        if self.freeze:
+            result = freeze_result(result)
+        size_bytes = estimate_size(key) + estimate_size(result)
+
+        if self.max_bytes is None or size_bytes <= self.max_bytes:
+            self._entries[key] = (result, size_bytes)
+            self._size_bytes += size_bytes
+            self._evict()
+
+        return result
+
+    def clear(self) -> None:
+        """
+        remove every stored result and reset the counters
+        """
+
+        self._entries.clear()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self) -> CacheStats:
+        """
+        :return: CacheStats snapshot of the stores counters
+        """
+
+        return CacheStats(
+            self.hits, self.misses, self.evictions, len(self._entries), self._size_bytes
+        )
+
+    def _evict(self) -> None:
+        """
+        private method to remove least recently used results until the store is within its limits
+        """
+
+        while (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ) or (self.max_bytes is not None and self._size_bytes > self.max_bytes):
+            _, (_, size_bytes) = self._entries.popitem(last=False)
+            self._size_bytes -= size_bytes
+            self.evictions += 1
+
+
+class CachedPokerEngine(BasePokerEngine):
+    """
+    wrapper of a poker engine that memoises its results in an LRUResultStore.
+    find_player_best_hand, find_player_outs and exact calculate_equity results are cached, every other method is
+    passed through to the wrapped engine.
+    """
+
+    def __init__(
+        self,
+        engine: BasePokerEngine,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = None,
+    ):
+        """
+        :param engine: the poker engine to wrap
+        :param max_entries: maximum number of results to store, unbounded if None
+        :param max_bytes: maximum estimated size in bytes of the stored results, unbounded if None
+        """
+
+        if not isinstance(engine, BasePokerEngine):
+            raise ValueError("engine must be a BasePokerEngine object")
+
+        self.engine = engine
+        self.store = LRUResultStore(max_entries, max_bytes)
+        self._signatures = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "engine":
+            raise AttributeError(name)
+
+        return getattr(self.engine, name)
+
+    def find_player_best_hand(
+        self, player: BasePlayer, board: List[Card], *args, **kwargs
+    ) -> Tuple[Hand, ...]:
+        """
+        find the players best possible hands with the wrapped engine, see the wrapped engines find_player_best_hand.
+        options are passed to the wrapped engine as given, positionally or by keyword.
+        the cards of each hand are in the order found by the call that filled the cache entry.
+
+        :return: tuple of the best hands
+        """
+
+        options = self._bind_options("find_player_best_hand", 2, args, kwargs)
+        key = (
+            "find_player_best_hand",
+            self.get_card_set_key(player.hole_cards),
+            self.get_card_set_key(board),
+            self._get_options_key(options),
+        )
+        result = self.store.get_or_compute(
+            key,
+            lambda: self.engine.find_player_best_hand(player, board, *args, **kwargs),
+        )
+
+        return copy_result(result)
+
+    def rank_player_hands(self, players: List[BasePlayer]):
+        """
+        rank the players hands with the wrapped engine, results are not cached as they hold the player objects given
+        """
+
+        return self.engine.rank_player_hands(players)
+
+    def find_player_outs(
+        self,
+        player: BasePlayer,
+        hand_type: HandType,
+        board: List[Card],
+        possible_cards: List[Card],
+        *args,
+        **kwargs,
+    ) -> Union[Tuple[Tuple[Card, ...], ...], OutsCount]:
+        """
+        find the players outs with the wrapped engine, see the wrapped engines find_player_outs.
+        options are passed to the wrapped engine as given, positionally or by keyword.
+        the outs and their cards are in the order found by the call that filled the cache entry.
+
+        :return: tuple of each out as a tuple of cards, or the outs count if count_only is set
+        """
+
+        options = self._bind_options("find_player_outs", 4, args, kwargs)
+        key = (
+            "find_player_outs",
+            hand_type,
+            self.get_card_set_key(player.hole_cards),
+            self.get_card_set_key(board),
+            self.get_card_set_key(possible_cards),
+            self._get_options_key(options),
+        )
+        result = self.store.get_or_compute(
+            key,
+            lambda: self.engine.find_player_outs(
+                player, hand_type, board, possible_cards, *args, **kwargs
+            ),
+        )
+
+        return copy_result(result)
+
+    def calculate_equity(
+        self,
+        players: List[BasePlayer],
+        board: List[Card],
+        dead_cards: List[Card] = None,
+        *args,
+        **kwargs,
+    ) -> Tuple[PlayerEquity, ...]:
+        """
+        calculate each players equity with the wrapped engine, see the wrapped engines calculate_equity.
+        only exact equities are cached, sampled equities are passed straight through.
+
+        :return: tuple of PlayerEquity objects in the same order as the players list
+        """
+
+        options = self._bind_options("calculate_equity", 3, args, kwargs)
+        if options.get("method", EquityCalculationMethod.Exact) != (
+            EquityCalculationMethod.Exact
+        ):
+            return self.engine.calculate_equity(
+                players, board, dead_cards, *args, **kwargs
+            )
+
+        key = (
+            "calculate_equity",
+            tuple(self.get_card_set_key(player.hole_cards) for player in players),
+            self.get_card_set_key(board),
+            self.get_card_set_key(dead_cards or []),
+            self._get_options_key(options),
+        )
+        result = self.store.get_or_compute(
+            key,
+            lambda: self.engine.calculate_equity(
+                players, board, dead_cards, *args, **kwargs
+            ),
+        )
+
+        return copy_result(result)
+
+    def get_cache_stats(self) -> CacheStats:
+        """
+        :return: CacheStats snapshot of the hit, miss and eviction counters and the current size of the cache
+        """
+
+        return self.store.get_stats()
+
+    def clear_cache(self) -> None:
+        """
+        remove every cached result and reset the counters
+        """
+
+        self.store.clear()
+
+    def _bind_options(
+        self, method_name: str, num_card_args: int, args: tuple, kwargs: dict
+    ) -> Dict[str, Any]:
+        """
+        private method to resolve the options of a call against the wrapped engine methods signature, so options
+        given positionally, by keyword or left to their defaults all resolve to the same values.
+        arguments the wrapped engine would reject raise the same TypeError it would.
+
+        :param method_name: name of the wrapped engine method
+        :param num_card_args: number of leading arguments holding the cards, players and hand type of the call
+        :param args: positional options passed after the leading arguments
+        :param kwargs: keyword options
+        :return: dictionary of every option of the method by name, in signature order
+        """
+
+        signature = self._signatures.get(method_name)
+        if signature is None:
+            signature = inspect.signature(getattr(self.engine, method_name))
+            self._signatures[method_name] = signature
+
+        bound = signature.bind(*([None] * num_card_args), *args, **kwargs)
+        bound.apply_defaults()
+
+        return dict(list(bound.arguments.items())[num_card_args:])
+
+    @staticmethod
+    def _get_options_key(options: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        """
+        private method to build the part of a key describing the resolved options of a call
+
+        :param options: dictionary of every option of the call, see _bind_options
+        :return: tuple of the options that can change the result, in signature order
+        """
+
+        key = []
+        for name, value in options.items():
+            if name in _UNKEYED_ARGS:
+                continue
+            if isinstance(value, dict):
+                value = tuple(sorted(value.items()))
+            key.append((name, freeze_result(value)))
+
+        return tuple(key)
+
+
+def freeze_result(result: Any) -> Any:
+    """
+    convert a result to its frozen form, lists are converted to tuples
+
+    :param result: engine result
+    :return: frozen result
+    """
+
+    if isinstance(result, (list, tuple)):
+        return tuple(freeze_result(item) for item in result)
+
+    return result
+
+
+def copy_result(result: Any) -> Any:
+    """
+    copy any mutable objects held in a frozen result so it can be handed to a caller.
+    tuples and cards are immutable and are shared.
+
+    :param result: frozen result
+    :return: result safe to hand to a caller
+    """
+
+    if isinstance(result, Card):
+        return result
+
+    if isinstance(result, tuple):
+        if all(isinstance(item, Card) for item in result):
+            return result
+        return tuple(copy_result(item) for item in result)
+
+    return deepcopy(result)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    estimate the memory held by a key or frozen result in bytes.
+    cards and enums are shared, so only the reference to them is counted.
+
+    :param value: key or frozen result
+    :return: estimated size in bytes
+    """
+
+    if isinstance(value, (Card, Enum)):
+        return 0
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(estimate_size(item) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += sum(estimate_size(item) for item in vars(value).values())
+    elif isinstance(value, dict):
+        size += sum(estimate_size(item) for item in value.items())
+
+    return size
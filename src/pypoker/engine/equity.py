@@ -0,0 +1,610 @@
+"""
+pypoker.engine.equity module
+----------------------------
+
+equity calculations for the texas holdem game type.
+all calculations work on integer encoded cards (see Card.to_int) and the lookup evaluator tables so that board only
+work is done once per runout and shared between every player.
+
+calculations can be split across a pool of worker processes. only integer encoded cards are sent to the workers and
+their tallies are merged back in a fixed order, so results do not depend on the number of workers.
+
+range against range equity requires numpy (pip install pypoker[numpy]).
+"""
+
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import List, Iterable, Iterator, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pypoker.constants import HAND_KEY_STRENGTH_SHIFT
+from pypoker.constructs import PlayerEquity
+from pypoker.engine.evaluator import (
+    get_lookup_tables,
+    get_lookup_arrays,
+    CARD_INT_RANK_COUNT_KEYS,
+    CARD_INT_SUIT_COUNT_KEYS,
+    CARD_INT_SUITED_RANK_BITS,
+    SUIT_COUNT_FLUSH_OFFSET,
+    SUIT_COUNT_FLUSH_MASK,
+)
+
+BOARD_SIZE = 5
+RANGE_RANK_BITS = 24
+SAMPLE_BATCH_SIZE = 10000
+DEFAULT_MAX_SAMPLES = 1000000
+
+
+def calculate_exact_equity(
+    hole_card_ints: List[List[int]],
+    board_ints: List[int],
+    available_ints: List[int],
+    workers: int = None,
+) -> List[PlayerEquity]:
+    """
+    calculate each players equity by enumerating every possible runout of the board from the available cards.
+
+    :param hole_card_ints: list of each players integer encoded hole cards
+    :param board_ints: integer encoded cards currently on the board
+    :param available_ints: integer encoded cards that could still be dealt to the board
+    :param workers: number of worker processes to split the runouts across, runs in this process if not given
+    :return: list of PlayerEquity objects in the same order as hole_card_ints
+    """
+
+    draws = BOARD_SIZE - len(board_ints)
+
+    # with less than 3 draws there are too few runouts to be worth sending to other processes
+    if not workers or workers <= 1 or draws < 3:
+        runouts = combinations(available_ints, draws)
+        return tally_runouts(hole_card_ints, board_ints, runouts)
+
+    # split the runouts by their first two cards into many small chunks so the workers stay evenly loaded
+    prefixes = list(combinations(range(len(available_ints)), 2))
+
+    # build the tables before the pool starts so forked workers share them
+    get_lookup_tables()
+
+    equities = [PlayerEquity() for _ in hole_card_ints]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_equities = executor.map(
+            _tally_runout_chunk,
+            [hole_card_ints] * len(prefixes),
+            [board_ints] * len(prefixes),
+            [available_ints] * len(prefixes),
+            prefixes,
+            chunksize=max(1, len(prefixes) // (workers * 8)),
+        )
+        for chunk in chunk_equities:
+            equities = merge_equities(equities, chunk)
+
+    return equities
+
+
+def calculate_sampled_equity(
+    hole_card_ints: List[List[int]],
+    board_ints: List[int],
+    available_ints: List[int],
+    seed: int = None,
+    target_standard_error: float = None,
+    time_budget: float = None,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    batch_size: int = SAMPLE_BATCH_SIZE,
+    workers: int = None,
+) -> List[PlayerEquity]:
+    """
+    estimate each players equity by sampling random runouts of the board from the available cards.
+    runouts are sampled in batches, each batch has its own random generator seeded from the seed and batch number
+    so the samples drawn for a seed never change. sampling stops early after the first batch where every player has
+    reached the target standard error or the time budget has been used.
+
+    :param hole_card_ints: list of each players integer encoded hole cards
+    :param board_ints: integer encoded cards currently on the board
+    :param available_ints: integer encoded cards that could still be dealt to the board
+    :param seed: seed for the random runouts, a random seed is used if not given
+    :param target_standard_error: stop once every players equity standard error is at or below this value
+    :param time_budget: stop once this many seconds have been spent sampling. results stopped by time are not
+        reproducible as the number of batches sampled depends on the machine.
+    :param max_samples: the maximum number of runouts to sample
+    :param batch_size: number of runouts sampled between each check of the stopping conditions
+    :param workers: number of worker processes to sample batches with, runs in this process if not given.
+        batches are merged and checked in batch order so the result for a seed is the same for any number of workers
+    :return: list of PlayerEquity objects in the same order as hole_card_ints
+    """
+
+    draws = BOARD_SIZE - len(board_ints)
+    if draws == 0:
+        return calculate_exact_equity(hole_card_ints, board_ints, available_ints)
+
+    if seed is None:
+        seed = random.randrange(1 << 32)
+
+    batch_sizes = [batch_size] * (max_samples // batch_size)
+    if max_samples % batch_size:
+        batch_sizes.append(max_samples % batch_size)
+
+    start_time = time.perf_counter()
+    equities = [PlayerEquity() for _ in hole_card_ints]
+    batches = _tally_sample_batches(
+        hole_card_ints, board_ints, available_ints, seed, batch_sizes, workers
+    )
+
+    try:
+        for batch_equities in batches:
+            equities = merge_equities(equities, batch_equities)
+
+            if target_standard_error is not None and all(
+                equity.standard_error <= target_standard_error for equity in equities
+            ):
+                break
+
+            if (
+                time_budget is not None
+                and time.perf_counter() - start_time >= time_budget
+            ):
+                break
+    finally:
+        batches.close()
+
+    return equities
+
+
+def calculate_range_equity(
+    hole_card_ranges: List[List[List[int]]],
+    range_weights: List[List[float]],
+    board_ints: List[int],
+    available_ints: List[int],
+) -> List[PlayerEquity]:
+    """
+    calculate the equity of two hand ranges against each other by enumerating every possible runout of the board.
+    each matchup of a combo from each range is weighted by the product of the combo weights. combos holding a card
+    that is not available are dropped, as are matchups where both combos or a runout share a card.
+
+    every combo of both ranges is evaluated against each runout with vectorised lookups, then the weight of the
+    opposing combos each combo beats or ties is found by searching the sorted opposing ranks. matchups sharing a card
+    are removed by also searching the opposing ranks grouped by each card they hold, so no combo by combo matrix is
+    ever built.
+
+    :param hole_card_ranges: list of the two ranges, each a list of integer encoded hole card pairs
+    :param range_weights: list of the two ranges combo weights, in the same order as the combos
+    :param board_ints: integer encoded cards currently on the board
+    :param available_ints: integer encoded cards that are not on the board or dead
+    :return: list of two PlayerEquity objects, one per range. outcome counts are the sum of the matchup weights
+    """
+
+    if numpy is None:
+        raise ImportError(
+            "numpy is required to calculate range equity, install it with pip install pypoker[numpy]"
+        )
+
+    flush_ranks, count_keys, nonflush_ranks = get_lookup_arrays()
+    card_count_keys = numpy.asarray(CARD_INT_RANK_COUNT_KEYS, dtype=numpy.int64)
+    card_suited_bits = numpy.asarray(CARD_INT_SUITED_RANK_BITS, dtype=numpy.int64)
+
+    available = set(available_ints)
+    ranges = []
+    for combos, weights in zip(hole_card_ranges, range_weights):
+        kept = [
+            index
+            for index, cards in enumerate(combos)
+            if all(card in available for card in cards)
+        ]
+        cards = numpy.asarray([combos[index] for index in kept], dtype=numpy.int64)
+        cards = cards.reshape(-1, 2)
+        ranges.append(
+            (
+                cards,
+                numpy.asarray([weights[index] for index in kept], dtype=numpy.float64),
+                card_count_keys[cards].sum(axis=1),
+                card_suited_bits[cards].sum(axis=1),
+                (numpy.int64(1) << cards).sum(axis=1),
+            )
+        )
+
+    cards_a, weights_a, keys_a, bits_a, masks_a = ranges[0]
+    cards_b, weights_b, keys_b, bits_b, masks_b = ranges[1]
+
+    # position of the identical combo in range b for every combo in range a, these always tie
+    positions_b = {
+        tuple(sorted(cards)): index for index, cards in enumerate(cards_b.tolist())
+    }
+    same_b = numpy.asarray(
+        [positions_b.get(tuple(sorted(cards)), -1) for cards in cards_a.tolist()],
+        dtype=numpy.int64,
+    )
+    has_same = same_b >= 0
+
+    wins = ties = losses = 0.0
+    for runout in combinations(available_ints, BOARD_SIZE - len(board_ints)):
+        full_board = list(board_ints) + list(runout)
+        runout_mask = sum(1 << card for card in runout)
+
+        valid_a = (masks_a & runout_mask) == 0
+        valid_b = (masks_b & runout_mask) == 0
+        ranks_a = _rank_range_on_board(
+            full_board, keys_a, bits_a, flush_ranks, count_keys, nonflush_ranks
+        )
+        ranks_b = _rank_range_on_board(
+            full_board, keys_b, bits_b, flush_ranks, count_keys, nonflush_ranks
+        )
+        live_weights_b = numpy.where(valid_b, weights_b, 0.0)
+
+        # all of range b
+        order = numpy.argsort(ranks_b, kind="stable")
+        sorted_ranks = ranks_b[order]
+        cumulative = numpy.concatenate(([0.0], numpy.cumsum(live_weights_b[order])))
+        less = cumulative[numpy.searchsorted(sorted_ranks, ranks_a, side="left")]
+        less_equal = cumulative[numpy.searchsorted(sorted_ranks, ranks_a, side="right")]
+        total = numpy.full(len(ranks_a), cumulative[-1])
+
+        # range b grouped by each card it holds, removed for the matching cards of range a
+        card_keys = (cards_b << RANGE_RANK_BITS) | ranks_b[:, None]
+        order = numpy.argsort(card_keys, axis=None, kind="stable")
+        sorted_keys = card_keys.ravel()[order]
+        cumulative = numpy.concatenate(
+            ([0.0], numpy.cumsum(numpy.repeat(live_weights_b, 2)[order]))
+        )
+        for card_a in (cards_a[:, 0], cards_a[:, 1]):
+            card_base = card_a << RANGE_RANK_BITS
+            start = cumulative[numpy.searchsorted(sorted_keys, card_base)]
+            less -= (
+                cumulative[numpy.searchsorted(sorted_keys, card_base | ranks_a)] - start
+            )
+            less_equal -= (
+                cumulative[
+                    numpy.searchsorted(sorted_keys, card_base | ranks_a, side="right")
+                ]
+                - start
+            )
+            total -= (
+                cumulative[
+                    numpy.searchsorted(sorted_keys, card_base + (1 << RANGE_RANK_BITS))
+                ]
+                - start
+            )
+
+        # the identical combo was removed for both cards, add it back once
+        same_weights = numpy.where(has_same, live_weights_b[same_b], 0.0)
+        less_equal += same_weights
+        total += same_weights
+
+        live_weights_a = numpy.where(valid_a, weights_a, 0.0)
+        wins += float(live_weights_a @ less)
+        ties += float(live_weights_a @ (less_equal - less))
+        losses += float(live_weights_a @ (total - less_equal))
+
+    return [
+        PlayerEquity(wins=wins, ties=ties, losses=losses, tie_counts={2: ties}),
+        PlayerEquity(wins=losses, ties=ties, losses=wins, tie_counts={2: ties}),
+    ]
+
+
+def sample_runouts(
+    available_ints: List[int],
+    draws: int,
+    seed: int,
+    batch_index: int,
+    num_samples: int,
+) -> Iterator[Tuple[int, ...]]:
+    """
+    generate a batch of random board runouts. the same seed and batch index always generate the same runouts.
+
+    :param available_ints: integer encoded cards that could still be dealt to the board
+    :param draws: number of cards in each runout
+    :param seed: seed for the random runouts
+    :param batch_index: number of the batch being sampled
+    :param num_samples: number of runouts to generate
+    :return: iterator of tuples of integer encoded cards
+    """
+
+    rng = random.Random(f"{seed}:{batch_index}")
+    for _ in range(num_samples):
+        yield tuple(rng.sample(available_ints, draws))
+
+
+def merge_equities(
+    equities_a: List[PlayerEquity], equities_b: List[PlayerEquity]
+) -> List[PlayerEquity]:
+    """
+    merge two sets of player equity tallies for the same players into a single set
+
+    :param equities_a: list of PlayerEquity objects
+    :param equities_b: list of PlayerEquity objects for the same players in the same order
+    :return: list of merged PlayerEquity objects
+    """
+
+    merged = []
+    for equity_a, equity_b in zip(equities_a, equities_b):
+        tie_counts = dict(equity_a.tie_counts)
+        for num, count in equity_b.tie_counts.items():
+            tie_counts[num] = tie_counts.get(num, 0) + count
+
+        merged.append(
+            PlayerEquity(
+                wins=equity_a.wins + equity_b.wins,
+                ties=equity_a.ties + equity_b.ties,
+                losses=equity_a.losses + equity_b.losses,
+                tie_counts=dict(sorted(tie_counts.items())),
+            )
+        )
+
+    return merged
+
+
+def tally_runouts(
+    hole_card_ints: List[List[int]],
+    board_ints: List[int],
+    runouts: Iterable[Tuple[int, ...]],
+) -> List[PlayerEquity]:
+    """
+    evaluate every player for each of the given board runouts and tally the wins, ties and losses of each player.
+
+    :param hole_card_ints: list of each players integer encoded hole cards
+    :param board_ints: integer encoded cards currently on the board
+    :param runouts: iterable of the integer encoded cards completing the board for each runout
+    :return: list of PlayerEquity objects in the same order as hole_card_ints
+    """
+
+    flush_ranks, nonflush_ranks = get_lookup_tables()
+    count_keys = CARD_INT_RANK_COUNT_KEYS
+    suit_keys = CARD_INT_SUIT_COUNT_KEYS
+    suited_bits = CARD_INT_SUITED_RANK_BITS
+
+    players = range(len(hole_card_ints))
+    player_keys = [sum(count_keys[card] for card in cards) for cards in hole_card_ints]
+    player_suits = [sum(suit_keys[card] for card in cards) for cards in hole_card_ints]
+    player_bits = [sum(suited_bits[card] for card in cards) for cards in hole_card_ints]
+
+    board_key = sum(count_keys[card] for card in board_ints)
+    board_suits = sum(suit_keys[card] for card in board_ints)
+    board_bits = sum(suited_bits[card] for card in board_ints)
+
+    wins = [0] * len(players)
+    ties = [{} for _ in players]
+    total = 0
+
+    for runout in runouts:
+        key = board_key
+        suits = board_suits
+        bits = board_bits
+        for card in runout:
+            key += count_keys[card]
+            suits += suit_keys[card]
+            bits += suited_bits[card]
+
+        best_rank = -1
+        winners = []
+        for player in players:
+            player_suit_count = suits + player_suits[player]
+            if (player_suit_count + SUIT_COUNT_FLUSH_OFFSET) & SUIT_COUNT_FLUSH_MASK:
+                rank = _flush_rank(
+                    flush_ranks, player_suit_count, bits + player_bits[player]
+                )
+            else:
+                rank = nonflush_ranks[key + player_keys[player]]
+
+            if rank > best_rank:
+                best_rank = rank
+                winners = [player]
+            elif rank == best_rank:
+                winners.append(player)
+
+        total += 1
+        if len(winners) == 1:
+            wins[winners[0]] += 1
+        else:
+            for player in winners:
+                ties[player][len(winners)] = ties[player].get(len(winners), 0) + 1
+
+    return [
+        PlayerEquity(
+            wins=wins[player],
+            ties=sum(ties[player].values()),
+            losses=total - wins[player] - sum(ties[player].values()),
+            tie_counts=dict(sorted(ties[player].items())),
+        )
+        for player in players
+    ]
+
+
+def tally_draw_hand_strengths(
+    card_ints: List[int], available_ints: List[int], draws: int
+) -> List[int]:
+    """
+    evaluate the given cards with every combination of draws from the available cards and tally the strength of the
+    best hand each draw makes. every draw is enumerated, so this is best used once the flop has been dealt.
+
+    :param card_ints: integer encoded cards currently held, e.g. a players hole cards and the board
+    :param available_ints: integer encoded cards that could be drawn
+    :param draws: number of cards to draw
+    :return: list of the number of draws making each hand strength, indexed by TexasHoldemHandStrength value
+    """
+
+    flush_ranks, nonflush_ranks = get_lookup_tables()
+    count_keys = CARD_INT_RANK_COUNT_KEYS
+    suit_keys = CARD_INT_SUIT_COUNT_KEYS
+    suited_bits = CARD_INT_SUITED_RANK_BITS
+
+    held_key = sum(count_keys[card] for card in card_ints)
+    held_suits = sum(suit_keys[card] for card in card_ints)
+    held_bits = sum(suited_bits[card] for card in card_ints)
+
+    strengths = {}
+    for draw in combinations(available_ints, draws):
+        key = held_key
+        suits = held_suits
+        bits = held_bits
+        for card in draw:
+            key += count_keys[card]
+            suits += suit_keys[card]
+            bits += suited_bits[card]
+
+        if (suits + SUIT_COUNT_FLUSH_OFFSET) & SUIT_COUNT_FLUSH_MASK:
+            rank = _flush_rank(flush_ranks, suits, bits)
+        else:
+            rank = nonflush_ranks[key]
+
+        strength = rank >> HAND_KEY_STRENGTH_SHIFT
+        strengths[strength] = strengths.get(strength, 0) + 1
+
+    return [strengths.get(strength, 0) for strength in range(10)]
+
+
+def _flush_rank(flush_ranks: List[int], suit_counts: int, suited_bits: int) -> int:
+    """
+    private method to find the packed rank of the flush held within the given cards
+
+    :param flush_ranks: flush lookup table
+    :param suit_counts: 4 bit counter of cards held for each suit
+    :param suited_bits: 13 bit rank mask of cards held for each suit
+    :return: packed rank of the flush or straight flush
+    """
+
+    for suit_index in range(4):
+        if (suit_counts >> (4 * suit_index)) & 0xF >= 5:
+            return flush_ranks[(suited_bits >> (13 * suit_index)) & 0x1FFF]
+
+
+def _tally_runout_chunk(
+    hole_card_ints: List[List[int]],
+    board_ints: List[int],
+    available_ints: List[int],
+    prefix: Tuple[int, int],
+) -> List[PlayerEquity]:
+    """
+    private method to tally every runout that starts with the two available cards at the given prefix positions.
+    runs within a worker process.
+
+    :param hole_card_ints: list of each players integer encoded hole cards
+    :param board_ints: integer encoded cards currently on the board
+    :param available_ints: integer encoded cards that could still be dealt to the board
+    :param prefix: positions within available_ints of the first two cards of each runout
+    :return: list of PlayerEquity objects in the same order as hole_card_ints
+    """
+
+    first, second = prefix
+    start_cards = (available_ints[first], available_ints[second])
+    runouts = (
+        start_cards + rest
+        for rest in combinations(
+            available_ints[second + 1 :], BOARD_SIZE - len(board_ints) - 2
+        )
+    )
+    return tally_runouts(hole_card_ints, board_ints, runouts)
+
+
+def _tally_sample_batch(
+    hole_card_ints: List[List[int]],
+    board_ints: List[int],
+    available_ints: List[int],
+    seed: int,
+    batch_index: int,
+    num_samples: int,
+) -> List[PlayerEquity]:
+    """
+    private method to sample and tally a single batch of random runouts. can run within a worker process.
+
+    :param hole_card_ints: list of each players integer encoded hole cards
+    :param board_ints: integer encoded cards currently on the board
+    :param available_ints: integer encoded cards that could still be dealt to the board
+    :param seed: seed for the random runouts
+    :param batch_index: number of the batch being sampled
+    :param num_samples: number of runouts to sample
+    :return: list of PlayerEquity objects in the same order as hole_card_ints
+    """
+
+    draws = BOARD_SIZE - len(board_ints)
+    runouts = sample_runouts(available_ints, draws, seed, batch_index, num_samples)
+    return tally_runouts(hole_card_ints, board_ints, runouts)
+
+
+def _tally_sample_batches(
+    hole_card_ints: List[List[int]],
+    board_ints: List[int],
+    available_ints: List[int],
+    seed: int,
+    batch_sizes: List[int],
+    workers: int = None,
+) -> Iterator[List[PlayerEquity]]:
+    """
+    private generator to tally batches of random runouts in batch order. with workers, batches are sampled a round
+    at a time with one batch per worker, so at most one round of work is wasted when sampling stops early.
+
+    :param hole_card_ints: list of each players integer encoded hole cards
+    :param board_ints: integer encoded cards currently on the board
+    :param available_ints: integer encoded cards that could still be dealt to the board
+    :param seed: seed for the random runouts
+    :param batch_sizes: number of runouts to sample in each batch
+    :param workers: number of worker processes to sample batches with
+    :return: iterator of lists of PlayerEquity objects, one list per batch
+    """
+
+    if not workers or workers <= 1:
+        for batch_index, num_samples in enumerate(batch_sizes):
+            yield _tally_sample_batch(
+                hole_card_ints,
+                board_ints,
+                available_ints,
+                seed,
+                batch_index,
+                num_samples,
+            )
+        return
+
+    # build the tables before the pool starts so forked workers share them
+    get_lookup_tables()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for round_start in range(0, len(batch_sizes), workers):
+            round_sizes = batch_sizes[round_start : round_start + workers]
+            yield from executor.map(
+                _tally_sample_batch,
+                [hole_card_ints] * len(round_sizes),
+                [board_ints] * len(round_sizes),
+                [available_ints] * len(round_sizes),
+                [seed] * len(round_sizes),
+                range(round_start, round_start + len(round_sizes)),
+                round_sizes,
+            )
+
+
+def _rank_range_on_board(
+    board_ints: List[int],
+    hole_keys: "numpy.ndarray",
+    hole_bits: "numpy.ndarray",
+    flush_ranks: "numpy.ndarray",
+    count_keys: "numpy.ndarray",
+    nonflush_ranks: "numpy.ndarray",
+) -> "numpy.ndarray":
+    """
+    private method to find the packed rank of every combo of a range on a complete board
+
+    :param board_ints: the 5 integer encoded board cards
+    :param hole_keys: rank count key of each combos hole cards
+    :param hole_bits: suited rank mask of each combos hole cards
+    :param flush_ranks: flush lookup array
+    :param count_keys: sorted non-flush rank count keys
+    :param nonflush_ranks: non-flush ranks matching count_keys
+    :return: array of packed ranks, one per combo
+    """
+
+    board_key = sum(CARD_INT_RANK_COUNT_KEYS[card] for card in board_ints)
+    board_suits = sum(CARD_INT_SUIT_COUNT_KEYS[card] for card in board_ints)
+    board_bits = sum(CARD_INT_SUITED_RANK_BITS[card] for card in board_ints)
+
+    # combos sharing a card with the board are ranked too but carry no weight, clip their impossible keys in bounds
+    positions = numpy.searchsorted(count_keys, hole_keys + board_key)
+    ranks = nonflush_ranks[numpy.minimum(positions, len(count_keys) - 1)]
+
+    # hole cards can add at most 2 cards to a suit, so only suits with 3 board cards can make a flush
+    for suit_index in range(4):
+        if (board_suits >> (4 * suit_index)) & 0xF >= 3:
+            suit_masks = ((hole_bits + board_bits) >> (13 * suit_index)) & 0x1FFF
+            ranks = numpy.maximum(ranks, flush_ranks[suit_masks])
+
+    return ranks.astype(numpy.int64)
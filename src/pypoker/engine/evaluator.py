@@ -0,0 +1,526 @@
+"""
+pypoker.engine.evaluator module
+-------------------------------
+
+lookup table based hand evaluator for the texas holdem hand types.
+any set of 1 to 7 cards is reduced to a single packed rank integer using precomputed tables, where a higher rank
+integer always represents a stronger hand.
+
+packed ranks use the same layout as Hand.key (24 bits):
+    bits 20-23: hand strength (TexasHoldemHandStrength value)
+    bits 0-19:  up to five tiebreaker values stored as 4 bit fields, most significant tiebreaker first.
+                missing (None) tiebreakers are stored as zero so they always rank below a real value.
+
+batches of integer encoded hands can be evaluated with numpy if it is installed (pip install pypoker[numpy]).
+"""
+
+from typing import List, Tuple, Optional
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pypoker.constants import (
+    HAND_KEY_STRENGTH_SHIFT,
+    HAND_KEY_TIEBREAKER_BITS,
+    HAND_KEY_MAX_TIEBREAKERS,
+    CARD_INT_SUIT_BITS,
+    CARD_INT_SUIT_MASK,
+    CARD_INT_SUIT_INDEXES,
+    TexasHoldemHandType,
+    HAND_TYPE_CODES,
+    TEXAS_HOLDEM_HAND_TYPES,
+    TEXAS_HOLDEM_TIEBREAKER_ARGS,
+)
+from pypoker.constructs import Card, Hand, CARD_REGISTRY
+from pypoker.exceptions import InvalidHandError
+
+# packed ranks share their layout with Hand.key
+RANK_STRENGTH_SHIFT = HAND_KEY_STRENGTH_SHIFT
+TIEBREAKER_BITS = HAND_KEY_TIEBREAKER_BITS
+MAX_TIEBREAKERS = HAND_KEY_MAX_TIEBREAKERS
+
+# bit for each card value within a 13 bit rank mask (value 2 = bit 0, value 14 = bit 12)
+RANK_BITS = [0, 0] + [1 << (value - 2) for value in range(2, 15)]
+
+# 3 bit counter for each card value, summing these gives a unique key for any multiset of card values
+RANK_COUNT_KEYS = [0, 0] + [1 << (3 * (value - 2)) for value in range(2, 15)]
+
+# the same tables indexed by integer encoded card (see Card.to_int)
+CARD_INT_RANK_BITS = [
+    RANK_BITS[(card_int >> CARD_INT_SUIT_BITS) + 2] for card_int in range(52)
+]
+CARD_INT_RANK_COUNT_KEYS = [
+    RANK_COUNT_KEYS[(card_int >> CARD_INT_SUIT_BITS) + 2] for card_int in range(52)
+]
+
+# integer encoding of each interned card object, a dictionary lookup is cheaper than Card.to_int
+CARD_INTS = {card: card_int for card_int, card in enumerate(CARD_REGISTRY)}
+
+# bit for each card within a 52 bit mask holding a 13 bit rank mask per suit
+CARD_INT_SUITED_RANK_BITS = [
+    CARD_INT_RANK_BITS[card_int] << (13 * (card_int & CARD_INT_SUIT_MASK))
+    for card_int in range(52)
+]
+
+# 4 bit counter for each suit, a flush is possible when any counter reaches 5
+CARD_INT_SUIT_COUNT_KEYS = [
+    1 << (4 * (card_int & CARD_INT_SUIT_MASK)) for card_int in range(52)
+]
+SUIT_COUNT_FLUSH_OFFSET = 0x3333
+SUIT_COUNT_FLUSH_MASK = 0x8888
+
+# number of cards of each tiebreaker value that make up a hand, straights are picked from their high card instead
+SELECT_VALUE_COUNTS = {
+    TexasHoldemHandType.Quads: (4, 1),
+    TexasHoldemHandType.FullHouse: (3, 2),
+    TexasHoldemHandType.Flush: (1, 1, 1, 1, 1),
+    TexasHoldemHandType.Trips: (3, 1, 1),
+    TexasHoldemHandType.TwoPair: (2, 2, 1),
+    TexasHoldemHandType.Pair: (2, 1, 1, 1),
+    TexasHoldemHandType.HighCard: (1, 1, 1, 1, 1),
+}
+SELECT_SUITED_HAND_TYPES = (
+    TexasHoldemHandType.StraightFlush,
+    TexasHoldemHandType.Flush,
+)
+
+
+def pack_rank(hand_type: TexasHoldemHandType, tiebreakers: List[Optional[int]]) -> int:
+    """
+    pack a hand type and its tiebreakers into a single comparable rank integer
+
+    :param hand_type: the type of hand
+    :param tiebreakers: list of tiebreaker values, None values are packed as zero
+    :return: packed rank integer
+    """
+
+    return Hand.pack_key(HAND_TYPE_CODES[hand_type], tiebreakers)
+
+
+def unpack_rank(rank: int) -> Tuple[TexasHoldemHandType, List[Optional[int]]]:
+    """
+    unpack a rank integer back into its hand type and tiebreaker list
+
+    :param rank: packed rank integer
+    :return: tuple of the hand type and the list of tiebreakers for that hand type
+    """
+
+    hand_type_code = rank >> RANK_STRENGTH_SHIFT
+    hand_type = TEXAS_HOLDEM_HAND_TYPES[hand_type_code]
+    arg_num = TEXAS_HOLDEM_TIEBREAKER_ARGS[hand_type_code]
+
+    tiebreakers = []
+    for position in range(arg_num):
+        shift = TIEBREAKER_BITS * (MAX_TIEBREAKERS - 1 - position)
+        value = (rank >> shift) & 0xF
+        tiebreakers.append(value or None)
+
+    return hand_type, tiebreakers
+
+
+def evaluate_cards(cards: List[Card]) -> int:
+    """
+    evaluate between 1 and 7 cards and return the packed rank of the best hand they make.
+
+    :param cards: list of card objects to evaluate
+    :return: packed rank integer of the best hand
+    """
+
+    return evaluate_card_ints([CARD_INTS[card] for card in cards])
+
+
+def evaluate_card_ints(card_ints: List[int]) -> int:
+    """
+    evaluate between 1 and 7 integer encoded cards (see Card.to_int) and return the packed rank of the best hand they
+    make. This avoids creating card objects for callers that already hold integer encoded cards.
+
+    :param card_ints: list of integer encoded cards to evaluate
+    :return: packed rank integer of the best hand
+    """
+
+    if not 1 <= len(card_ints) <= 7:
+        raise InvalidHandError("Lookup evaluator requires between 1 and 7 cards")
+
+    flush_ranks, nonflush_ranks = get_lookup_tables()
+
+    count_key = 0
+    suit_masks = [0, 0, 0, 0]
+    for card_int in card_ints:
+        count_key += CARD_INT_RANK_COUNT_KEYS[card_int]
+        suit_masks[card_int & CARD_INT_SUIT_MASK] |= CARD_INT_RANK_BITS[card_int]
+
+    # with 7 or less cards a flush can never be beaten by quads or a full house so the flush table wins outright
+    if len(card_ints) >= 5:
+        for suit_mask in suit_masks:
+            if flush_ranks[suit_mask]:
+                return flush_ranks[suit_mask]
+
+    return nonflush_ranks[count_key]
+
+
+def evaluate_card_int_array(
+    card_ints: "numpy.ndarray",
+) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    """
+    evaluate a batch of hands held in an (N, C) array of integer encoded cards (see Card.to_int), where C is between
+    1 and 7. The hands are evaluated with vectorised table lookups, no python loop runs per hand.
+    cards in each row are not checked for duplicates.
+
+    :param card_ints: numpy integer array of shape (N, C) holding one hand per row
+    :return: tuple of an (N,) array of packed ranks and an (N,) array of hand type codes. hand type codes are the
+        TexasHoldemHandStrength value of each hand type (HighCard = 1 to StraightFlush = 9)
+    """
+
+    if numpy is None:
+        raise ImportError(
+            "numpy is required to evaluate card arrays, install it with pip install pypoker[numpy]"
+        )
+
+    card_ints = numpy.asarray(card_ints)
+    if card_ints.ndim != 2 or not 1 <= card_ints.shape[1] <= 7:
+        raise InvalidHandError(
+            "Lookup evaluator requires an (N, C) array with between 1 and 7 cards per row"
+        )
+    if not numpy.issubdtype(card_ints.dtype, numpy.integer):
+        raise ValueError("Card integers must be integers between 0 and 51")
+    if card_ints.size and (card_ints.min() < 0 or card_ints.max() > 51):
+        raise ValueError("Card integers must be integers between 0 and 51")
+
+    flush_ranks, count_keys, nonflush_ranks = get_lookup_arrays()
+
+    # each card value has a 3 bit counter so summing the keys can never carry between values
+    count_key = numpy.asarray(CARD_INT_RANK_COUNT_KEYS, dtype=numpy.int64)[
+        card_ints
+    ].sum(axis=1)
+    ranks = nonflush_ranks[numpy.searchsorted(count_keys, count_key)]
+
+    if card_ints.shape[1] >= 5:
+        # every card has its own bit, so summing gives all four 13 bit suit rank masks in one integer
+        suit_masks = numpy.asarray(CARD_INT_SUITED_RANK_BITS, dtype=numpy.int64)[
+            card_ints
+        ].sum(axis=1)
+        for suit_index in range(len(CARD_INT_SUIT_INDEXES)):
+            suit_mask = (suit_masks >> (13 * suit_index)) & 0x1FFF
+            numpy.maximum(ranks, flush_ranks[suit_mask], out=ranks)
+
+    return ranks, (ranks >> RANK_STRENGTH_SHIFT).astype(numpy.uint8)
+
+
+def select_hand_cards(
+    cards: List[Card], hand_type: TexasHoldemHandType, tiebreakers: List[int]
+) -> List[Card]:
+    """
+    pick the cards from the given list that make up the hand described by the hand type and tiebreakers
+
+    :param cards: list of card objects the hand was evaluated from
+    :param hand_type: hand type of the evaluated hand
+    :param tiebreakers: tiebreakers of the evaluated hand
+    :return: list of card objects making up the hand
+    """
+
+    value_counts = SELECT_VALUE_COUNTS.get(hand_type)
+    if value_counts is None:
+        # straights hold one card of each value up to the high card, an ace is low in a five high straight
+        high = tiebreakers[0]
+        values = [14 if value == 1 else value for value in range(high - 4, high + 1)]
+        value_counts = (1,) * len(values)
+    else:
+        values = [value for value in tiebreakers if value is not None]
+    required = list(zip(values, value_counts))
+
+    suit = None
+    if hand_type in SELECT_SUITED_HAND_TYPES:
+        suit_counts = {}
+        for card in cards:
+            suit_counts[card.suit] = suit_counts.get(card.suit, 0) + 1
+        suit = max(suit_counts, key=suit_counts.get)
+
+    # pick the cards of every required value in a single pass, keeping the order they were given in
+    counts = dict(required)
+    value_cards = {value: [] for value in counts}
+    for card in cards:
+        picked = value_cards.get(card.value)
+        if (
+            picked is not None
+            and len(picked) < counts[card.value]
+            and (suit is None or card.suit == suit)
+        ):
+            picked.append(card)
+
+    return [card for value, _ in required for card in value_cards[value]]
+
+
+def get_rank_mask(values: List[int]) -> int:
+    """
+    build the 13 bit rank mask of a list of card values, bit n is set when the value n + 2 is present
+
+    :param values: list of card values between 2 and 14, repeated values are allowed
+    :return: rank mask of the values
+    """
+
+    mask = 0
+    for value in values:
+        mask |= RANK_BITS[value]
+
+    return mask
+
+
+def find_straight_windows(mask: int) -> List[Tuple[int, int, Tuple[int, ...]]]:
+    """
+    find every straight held by a rank mask, best first. masks holding no straight are rejected with a single
+    STRAIGHT_HIGHS lookup.
+
+    :param mask: 13 bit rank mask, see get_rank_mask
+    :return: list of the (high card value, rank mask, values) of each straight, see STRAIGHT_WINDOWS
+    """
+
+    if not STRAIGHT_HIGHS[mask]:
+        return []
+
+    return [window for window in STRAIGHT_WINDOWS if mask & window[1] == window[1]]
+
+
+def find_straight_draws(
+    current_mask: int, available_mask: int, draws: int
+) -> List[int]:
+    """
+    find the missing values that would complete each straight, where every missing value could be drawn.
+    single draws are found with one STRAIGHT_COMPLETIONS lookup.
+
+    :param current_mask: 13 bit rank mask of the values held
+    :param available_mask: 13 bit rank mask of the values that could be drawn
+    :param draws: the most values that can be drawn
+    :return: list of the unique rank masks of missing values completing a straight, fewest values first and then
+        ordered by value, lowest first. a zero mask is included first if a straight is already held.
+    """
+
+    if draws == 1:
+        completing = STRAIGHT_COMPLETIONS[current_mask] & available_mask
+        missing_masks = [RANK_BITS[value] for value in _mask_values(completing)[::-1]]
+    else:
+        missing_masks = set()
+        for _, window, _ in STRAIGHT_WINDOWS:
+            missing = window & ~current_mask
+            if missing and not missing & ~available_mask:
+                if bin(missing).count("1") <= draws:
+                    missing_masks.add(missing)
+        missing_masks = sorted(
+            missing_masks,
+            key=lambda mask: (len(_mask_values(mask)), _mask_values(mask)[::-1]),
+        )
+
+    if STRAIGHT_HIGHS[current_mask]:
+        missing_masks.insert(0, 0)
+
+    return missing_masks
+
+
+# Lookup table generation
+# -----------------------
+_TABLES = None
+
+
+def get_lookup_tables() -> Tuple[List[int], dict]:
+    """
+    return the flush and non-flush lookup tables, building them on first use.
+
+    :return: tuple of the flush rank list (indexed by suited rank mask) and non-flush rank dictionary
+        (keyed by rank count key)
+    """
+
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = (_build_flush_ranks(), _build_nonflush_ranks())
+
+    return _TABLES
+
+
+_ARRAY_TABLES = None
+
+
+def get_lookup_arrays() -> Tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """
+    return the lookup tables as numpy arrays, building them on first use.
+    the non-flush table is stored as sorted rank count keys with their ranks so it can be searched in bulk.
+
+    :return: tuple of the flush rank array, the sorted rank count key array and the matching non-flush rank array
+    """
+
+    global _ARRAY_TABLES
+    if _ARRAY_TABLES is None:
+        flush_ranks, nonflush_ranks = get_lookup_tables()
+        count_keys = sorted(nonflush_ranks)
+        _ARRAY_TABLES = (
+            numpy.asarray(flush_ranks, dtype=numpy.int32),
+            numpy.asarray(count_keys, dtype=numpy.int64),
+            numpy.asarray(
+                [nonflush_ranks[key] for key in count_keys], dtype=numpy.int32
+            ),
+        )
+
+    return _ARRAY_TABLES
+
+
+def _mask_values(mask: int) -> List[int]:
+    """
+    private method to list the card values in a rank mask, highest first
+    """
+
+    return [value for value in range(14, 1, -1) if mask & RANK_BITS[value]]
+
+
+def _build_straight_windows() -> List[Tuple[int, int, Tuple[int, ...]]]:
+    """
+    private method to list every straight as its high card value, its rank mask and its card values in run order,
+    best first. The ace low straight is last with a high card value of 5 and the ace leading its values.
+    """
+
+    runs = [list(range(high - 4, high + 1)) for high in range(14, 5, -1)]
+    runs.append([14, 2, 3, 4, 5])
+
+    return [
+        (
+            5 if run[0] == 14 else run[-1],
+            sum(RANK_BITS[value] for value in run),
+            tuple(run),
+        )
+        for run in runs
+    ]
+
+
+def _build_straight_highs() -> List[int]:
+    """
+    private method to build a table mapping every 13 bit rank mask to the high card value of the best straight it
+    contains, or zero if it contains no straight. The ace low straight has a high card value of 5.
+    """
+
+    straight_highs = []
+    for mask in range(1 << 13):
+        straight_highs.append(
+            next(
+                (
+                    high
+                    for high, window, _ in STRAIGHT_WINDOWS
+                    if mask & window == window
+                ),
+                0,
+            )
+        )
+
+    return straight_highs
+
+
+def _build_straight_completions() -> List[int]:
+    """
+    private method to build a table mapping every 13 bit rank mask to the rank mask of the values that would each
+    complete a straight on their own if added to it.
+    """
+
+    straight_completions = []
+    for mask in range(1 << 13):
+        completing = 0
+        for _, window, _ in STRAIGHT_WINDOWS:
+            missing = window & ~mask
+            if missing and not missing & (missing - 1):
+                completing |= missing
+        straight_completions.append(completing)
+
+    return straight_completions
+
+
+# (high card value, rank mask, values) of every straight, best first
+STRAIGHT_WINDOWS = _build_straight_windows()
+STRAIGHT_HIGHS = _build_straight_highs()
+STRAIGHT_COMPLETIONS = _build_straight_completions()
+
+
+def _build_flush_ranks() -> List[int]:
+    """
+    private method to build a table mapping every suited 13 bit rank mask to the packed rank of the best straight
+    flush or flush it makes, or zero if the mask holds less than 5 cards.
+    """
+
+    flush_ranks = []
+    for mask in range(1 << 13):
+        values = _mask_values(mask)
+        if len(values) < 5:
+            flush_ranks.append(0)
+        elif STRAIGHT_HIGHS[mask]:
+            flush_ranks.append(
+                pack_rank(TexasHoldemHandType.StraightFlush, [STRAIGHT_HIGHS[mask]])
+            )
+        else:
+            flush_ranks.append(pack_rank(TexasHoldemHandType.Flush, values[:5]))
+
+    return flush_ranks
+
+
+def _build_nonflush_ranks() -> dict:
+    """
+    private method to build a dictionary mapping the rank count key of every multiset of 1 to 7 card values to the
+    packed rank of the best non-flush hand it makes.
+    """
+
+    nonflush_ranks = {}
+
+    def _add_counts(value: int, counts: List[int], num_cards: int, count_key: int):
+        if value < 2:
+            if num_cards:
+                nonflush_ranks[count_key] = _rank_value_counts(counts)
+            return
+
+        for count in range(0, min(4, 7 - num_cards) + 1):
+            counts[value] = count
+            _add_counts(
+                value - 1,
+                counts,
+                num_cards + count,
+                count_key + count * RANK_COUNT_KEYS[value],
+            )
+        counts[value] = 0
+
+    _add_counts(14, [0] * 15, 0, 0)
+    return nonflush_ranks
+
+
+def _rank_value_counts(counts: List[int]) -> int:
+    """
+    private method to find the packed rank of the best non-flush hand for the given card value counts
+
+    :param counts: list indexed by card value holding the number of cards of that value
+    :return: packed rank integer
+    """
+
+    values = [value for value in range(14, 1, -1) if counts[value]]
+    quads = [value for value in values if counts[value] >= 4]
+    trips = [value for value in values if counts[value] >= 3]
+    pairs = [value for value in values if counts[value] >= 2]
+    straight_high = STRAIGHT_HIGHS[sum(RANK_BITS[value] for value in values)]
+
+    def _others(*excluded: int) -> List[int]:
+        return [value for value in values if value not in excluded]
+
+    if quads:
+        return pack_rank(TexasHoldemHandType.Quads, [quads[0]] + _others(quads[0])[:1])
+
+    if trips and len(pairs) >= 2:
+        pair_value = [value for value in pairs if value != trips[0]][0]
+        return pack_rank(TexasHoldemHandType.FullHouse, [trips[0], pair_value])
+
+    if straight_high:
+        return pack_rank(TexasHoldemHandType.Straight, [straight_high])
+
+    if trips:
+        return pack_rank(TexasHoldemHandType.Trips, [trips[0]] + _others(trips[0])[:2])
+
+    if len(pairs) >= 2:
+        return pack_rank(
+            TexasHoldemHandType.TwoPair, pairs[:2] + _others(*pairs[:2])[:1]
+        )
+
+    if pairs:
+        return pack_rank(TexasHoldemHandType.Pair, [pairs[0]] + _others(pairs[0])[:3])
+
+    return pack_rank(TexasHoldemHandType.HighCard, values[:5])
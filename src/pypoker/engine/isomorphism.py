@@ -0,0 +1,245 @@
+"""
+pypoker.engine.isomorphism module
+---------------------------------
+
+suit isomorphism helpers for the poker engines.
+two situations that only differ by a relabelling of the suits (e.g. AhKh on 7h8h2c and AsKs on 7s8s2d) have the same
+best hands, outs and equity once the suits of the results are relabelled back. situations are canonicalised by
+sorting the suits on the ranks they hold in each group of cards, so every isomorphic situation maps to the same key.
+
+the IsomorphicResultCache stores engine results against these keys, so a result only has to be found once for
+every suit relabelling of a situation.
+"""
+
+from copy import deepcopy
+from typing import List, Tuple, Callable, Any, Hashable
+
+from pypoker.constants import (
+    CARD_INT_SUIT_BITS,
+    CARD_INT_SUIT_MASK,
+    CARD_INT_SUITS,
+    CARD_INT_SUIT_INDEXES,
+)
+from pypoker.constructs import Card, Hand, SpecialCard, AnyValueCard
+from pypoker.engine.cache import LRUResultStore, CacheStats, DEFAULT_MAX_ENTRIES
+
+NUM_SUITS = 4
+
+_SHARED_CACHE = None
+
+
+def canonicalise_suits(
+    card_groups: List[List[int]],
+) -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[int, ...]]:
+    """
+    find the canonical suit relabelling of a situation made of groups of integer encoded cards (see Card.to_int),
+    for example each players hole cards, then the board, then the dead cards.
+    each suit is described by the rank bitmask it holds in every group and the suits are relabelled in descending
+    order of these descriptions. suits with the same description hold the same ranks in every group, so the order
+    they are relabelled in does not change the situation.
+
+    :param card_groups: list of groups of integer encoded cards. the order of cards within a group is ignored
+    :return: tuple of the canonical key shared by every isomorphic situation and the permutation used, where
+        permutation[suit_index] is the canonical suit index of that suit
+    """
+
+    suit_masks = [[0] * len(card_groups) for _ in range(NUM_SUITS)]
+    for group_index, card_ints in enumerate(card_groups):
+        for card_int in card_ints:
+            suit_masks[card_int & CARD_INT_SUIT_MASK][group_index] |= 1 << (
+                card_int >> CARD_INT_SUIT_BITS
+            )
+
+    signatures = [tuple(masks) for masks in suit_masks]
+    suit_order = sorted(range(NUM_SUITS), key=signatures.__getitem__, reverse=True)
+
+    permutation = [0] * NUM_SUITS
+    for canonical_suit, suit in enumerate(suit_order):
+        permutation[suit] = canonical_suit
+
+    return tuple(signatures[suit] for suit in suit_order), tuple(permutation)
+
+
+def invert_suit_permutation(permutation: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    find the permutation that reverses a suit permutation
+
+    :param permutation: suit permutation where permutation[suit_index] is the new suit index
+    :return: the inverse suit permutation
+    """
+
+    inverse = [0] * NUM_SUITS
+    for suit, new_suit in enumerate(permutation):
+        inverse[new_suit] = suit
+
+    return tuple(inverse)
+
+
+def permute_card_ints(card_ints: List[int], permutation: Tuple[int, ...]) -> List[int]:
+    """
+    relabel the suits of integer encoded cards
+
+    :param card_ints: list of integer encoded cards
+    :param permutation: suit permutation where permutation[suit_index] is the new suit index
+    :return: list of the relabelled integer encoded cards, in the same order
+    """
+
+    return [
+        (card_int & ~CARD_INT_SUIT_MASK) | permutation[card_int & CARD_INT_SUIT_MASK]
+        for card_int in card_ints
+    ]
+
+
+def permute_cards(cards: List[Card], permutation: Tuple[int, ...]) -> List[Card]:
+    """
+    relabel the suits of card objects. AnyValueCard special cards are relabelled to the new suit, other special cards
+    are not tied to a suit and are returned unchanged.
+
+    :param cards: list of card objects
+    :param permutation: suit permutation where permutation[suit_index] is the new suit index
+    :return: list of the relabelled cards, in the same order
+    """
+
+    permuted = []
+    for card in cards:
+        if isinstance(card, AnyValueCard):
+            suit = CARD_INT_SUITS[permutation[CARD_INT_SUIT_INDEXES[card.suit]]]
+            permuted.append(AnyValueCard(suit.value))
+        elif isinstance(card, SpecialCard):
+            permuted.append(card)
+        else:
+            permuted.append(
+                Card.from_int(permute_card_ints([card.to_int()], permutation)[0])
+            )
+
+    return permuted
+
+
+def permute_card_sets(
+    card_sets: List[List[Card]], permutation: Tuple[int, ...]
+) -> List[List[Card]]:
+    """
+    relabel the suits of each card set in a list, such as a list of outs
+
+    :param card_sets: list of lists of card objects
+    :param permutation: suit permutation where permutation[suit_index] is the new suit index
+    :return: list of the relabelled card sets
+    """
+
+    return [permute_cards(card_set, permutation) for card_set in card_sets]
+
+
+def permute_hands(hands: List[Hand], permutation: Tuple[int, ...]) -> List[Hand]:
+    """
+    relabel the suits of the cards in each hand. hand types and tiebreakers do not depend on suits so are kept.
+
+    :param hands: list of hand objects
+    :param permutation: suit permutation where permutation[suit_index] is the new suit index
+    :return: list of new hand objects holding the relabelled cards
+    """
+
+    return [
+        Hand(
+            hand.game,
+            hand.type,
+            permute_cards(hand.cards, permutation),
+            hand.tiebreakers,
+            validate=False,
+        )
+        for hand in hands
+    ]
+
+
+class IsomorphicResultCache(object):
+    """
+    cache of engine results keyed on the canonical suit relabelling of the situation they were found for.
+    results are found and stored for the canonical situation and relabelled back to the callers suits on the way out,
+    so up to 24 isomorphic situations share a single entry. results are held in a least recently used store, so the
+    cache stays within its limits however long it is used for.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = None):
+        """
+        :param max_entries: maximum number of results to store, unbounded if None
+        :param max_bytes: maximum estimated size in bytes of the stored results, unbounded if None
+        """
+
+        # results are copied or relabelled on the way out, so are stored as they are
+        self.store = LRUResultStore(max_entries, max_bytes, freeze=False)
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    @property
+    def hits(self) -> int:
+        return self.store.hits
+
+    @property
+    def misses(self) -> int:
+        return self.store.misses
+
+    def get_stats(self) -> CacheStats:
+        """
+        :return: CacheStats snapshot of the hit, miss and eviction counters and the current size of the cache
+        """
+
+        return self.store.get_stats()
+
+    def clear(self) -> None:
+        """
+        remove every stored result and reset the counters
+        """
+
+        self.store.clear()
+
+    def get_or_compute(
+        self,
+        query: Hashable,
+        card_groups: List[List[Card]],
+        compute: Callable[[List[List[int]]], Any],
+        unpermute: Callable[[Any, Tuple[int, ...]], Any] = None,
+    ) -> Any:
+        """
+        find the result of a query for a situation, computing it for the canonical situation if it is not stored.
+
+        :param query: hashable description of the query, e.g. the method name and any arguments that are not cards
+        :param card_groups: list of groups of cards describing the situation, e.g. hole cards, board and dead cards
+        :param compute: function computing the result from the canonical situation, given as groups of integer
+            encoded cards in the same order as card_groups
+        :param unpermute: function relabelling a result found for the canonical situation with a suit permutation.
+            if not given the result is assumed to not depend on suits and is copied.
+        :return: the result of the query for the given situation
+        """
+
+        card_int_groups = [[card.to_int() for card in cards] for cards in card_groups]
+        canonical_key, permutation = canonicalise_suits(card_int_groups)
+
+        result = self.store.get_or_compute(
+            (query, canonical_key),
+            lambda: compute(
+                [
+                    sorted(permute_card_ints(card_ints, permutation))
+                    for card_ints in card_int_groups
+                ]
+            ),
+        )
+
+        if unpermute is None:
+            return deepcopy(result)
+
+        return unpermute(result, invert_suit_permutation(permutation))
+
+
+def get_shared_result_cache() -> IsomorphicResultCache:
+    """
+    get the result cache shared across the process, pass it as the result_cache of each engine that should share
+    its results
+
+    :return: IsomorphicResultCache object
+    """
+
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        _SHARED_CACHE = IsomorphicResultCache()
+
+    return _SHARED_CACHE
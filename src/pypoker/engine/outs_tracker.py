@@ -0,0 +1,189 @@
+"""
+pypoker.engine.outs_tracker module
+----------------------------------
+
+stateful outs tracking for a single player as a texas holdem hand is dealt street by street.
+the players current cards and the possible cards are counted by value and suit once, then each dealt or removed card
+only updates the counts of its own value and suit. outs counts are found from these counts directly, so the cards are
+never regrouped. ExplicitFull outs already found are carried to the next street when a card is dealt, by keeping the
+outs the dealt card is part of, so they are not found again from the full card lists. other outs are found again.
+"""
+
+from typing import List
+
+from pypoker.constants import TexasHoldemHandType, OutsCalculationMethod
+from pypoker.constructs import Card, CardCounts, OutsCount
+from pypoker.engine.texas_holdem import TexasHoldemPokerEngine
+from pypoker.exceptions import OutsError
+from pypoker.player import BasePlayer
+
+BOARD_SIZE = 5
+
+
+class OutsTracker(object):
+    """
+    tracks a players outs as board cards are dealt and possible cards are removed.
+    outs are found when first asked for and dropped when the cards change, unless they can be updated in place.
+    dealing a board card keeps any ExplicitFull outs already found, reduced to the outs the dealt card is part of.
+    removing a possible card keeps any explicit outs already found, dropping only the outs that needed the removed card.
+    """
+
+    def __init__(
+        self,
+        player: BasePlayer,
+        board: List[Card],
+        possible_cards: List[Card],
+        engine: TexasHoldemPokerEngine = None,
+    ):
+        """
+        :param player: pypoker player object representing the player we are tracking outs for
+        :param board: list containing the current board cards. If preflop then this list should be empty
+        :param possible_cards: List of card objects that could be drawn
+        :param engine: optional engine used to find the outs
+        """
+
+        if len(board) > BOARD_SIZE:
+            raise OutsError(f"The board cannot hold more than {BOARD_SIZE} cards")
+
+        self.engine = engine or TexasHoldemPokerEngine()
+        self.hole_cards = list(player.hole_cards)
+        self.board = list(board)
+        self.current_counts = CardCounts(self.hole_cards + self.board)
+        self.possible_counts = CardCounts(possible_cards)
+
+        # dictionary keys keep the possible cards in order with constant time removal
+        self._possible_cards = dict.fromkeys(possible_cards)
+        self._outs = {}
+        self._outs_counts = {}
+
+    @property
+    def current_cards(self) -> List[Card]:
+        """
+        the players hole cards and the current board cards
+        """
+
+        return self.hole_cards + self.board
+
+    @property
+    def possible_cards(self) -> List[Card]:
+        """
+        the cards that could still be drawn
+        """
+
+        return list(self._possible_cards)
+
+    @property
+    def draws_remaining(self) -> int:
+        """
+        the number of board cards still to be dealt
+        """
+
+        return BOARD_SIZE - len(self.board)
+
+    def add_board_card(self, card: Card) -> None:
+        """
+        deal a card to the board. the card is no longer a possible card. ExplicitFull outs already found keep only the
+        outs the dealt card is part of, with the dealt card taken out. ExplicitPartial outs only hold the cards each
+        out needs, which do not always carry to the next street, so they are found again when next asked for along
+        with implicit outs, outs counts and any outs once the board is complete.
+
+        :param card: card object dealt to the board
+        """
+
+        if self.draws_remaining == 0:
+            raise OutsError(f"The board cannot hold more than {BOARD_SIZE} cards")
+
+        if card in self.hole_cards or card in self.board:
+            raise OutsError(
+                f"Card '{card.name}' is already held by the player or board"
+            )
+
+        self.board.append(card)
+        self.current_counts.add(card)
+        if card not in self._possible_cards:
+            # stored outs never drew the card, so cannot be carried to the next street
+            self._outs.clear()
+            self._outs_counts.clear()
+            return
+
+        del self._possible_cards[card]
+        self.possible_counts.remove(card)
+
+        # a draw makes the hand on the next street if the dealt card and the draw made it on this street
+        self._outs = {
+            key: [
+                [out_card for out_card in out if out_card != card]
+                for out in outs
+                if card in out
+            ]
+            for key, outs in self._outs.items()
+            if key[1] == OutsCalculationMethod.ExplicitFull and self.draws_remaining
+        }
+        self._outs_counts.clear()
+
+    def remove_possible_card(self, card: Card) -> None:
+        """
+        remove a card from the possible cards, e.g. a burnt or exposed card. explicit outs already found only lose the
+        outs holding the removed card, implicit outs and outs counts are found again when next asked for.
+
+        :param card: card object that can no longer be drawn
+        """
+
+        if card not in self._possible_cards:
+            raise OutsError(f"Card '{card.name}' is not one of the possible cards")
+
+        del self._possible_cards[card]
+        self.possible_counts.remove(card)
+
+        self._outs = {
+            key: [out for out in outs if card not in out]
+            for key, outs in self._outs.items()
+            if key[1] != OutsCalculationMethod.Implicit
+        }
+        self._outs_counts.clear()
+
+    def get_outs(
+        self,
+        hand_type: TexasHoldemHandType,
+        method: OutsCalculationMethod = OutsCalculationMethod.ExplicitPartial,
+    ) -> List[List[Card]]:
+        """
+        find the players outs to make the hand type with the current board and possible cards, see
+        TexasHoldemPokerEngine.find_player_outs
+
+        :param hand_type: hand type enum used for determining the type of hand to find outs for.
+        :param method: OutsCalculationMethod enum of how the outs are represented.
+        :return: list of each combination of cards that would give the player this type of hand
+        """
+
+        key = (hand_type, method)
+        if key not in self._outs:
+            self._outs[key] = self.engine.find_outs(
+                hand_type,
+                self.current_cards,
+                self.possible_cards,
+                self.draws_remaining,
+                method=method,
+            )
+
+        return [list(out) for out in self._outs[key]]
+
+    def count_outs(self, hand_type: TexasHoldemHandType) -> OutsCount:
+        """
+        count the draws that would give the player the hand type from the tracked card counts
+
+        :param hand_type: hand type enum used for determining the type of hand to count outs for.
+        :return: OutsCount of the draws making the hand type out of every possible draw
+        """
+
+        if hand_type not in self._outs_counts:
+            self._outs_counts[hand_type] = self.engine.find_outs(
+                hand_type,
+                self.current_counts,
+                self.possible_counts,
+                self.draws_remaining,
+                count_only=True,
+            )
+
+        outs_count = self._outs_counts[hand_type]
+        return OutsCount(outs_count.hits, outs_count.combinations)
@@ -0,0 +1,360 @@
+"""
+pypoker.engine.preflop module
+-----------------------------
+
+precomputed preflop equity of the 169 texas holdem starting hand classes.
+starting hands are grouped into classes by the value of each hole card and whether they are suited (e.g. AKs, T9o, 77).
+each class is indexed on a 13 x 13 grid, rows and columns ordered Ace to Two. pairs sit on the diagonal, suited hands
+above it (row = high card) and offsuit hands below it (row = low card).
+
+the table is stored in a binary file that is opened with mmap, so lookups only read the few bytes they need:
+    header:  magic (8 bytes), number of classes (uint16), max opponents (uint16), number of deals (uint32),
+             number of boards (uint32). all values are little endian.
+    section 1: float32 equity of each class against 1 to max opponents random hands, one row per class
+    section 2: float32 equity of each class against every other class heads-up, one row per class
+
+the bundled table is generated by generate_preflop_equity_table (python -m pypoker.engine.preflop), which requires
+numpy (pip install pypoker[numpy]). the generator samples random deals with a fixed seed, so the bundled values are
+estimates with a standard error of roughly 0.3%.
+"""
+
+import mmap
+import os
+import struct
+from itertools import combinations
+from typing import List, Optional
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from pypoker.constants import CARD_INT_SUIT_BITS, CARD_INT_SUIT_MASK
+from pypoker.engine.evaluator import evaluate_card_int_array
+from pypoker.exceptions import EquityError
+
+NUM_STARTING_HAND_CLASSES = 169
+MAX_PREFLOP_OPPONENTS = 9
+STARTING_HAND_VALUE_NAMES = "AKQJT98765432"
+
+PREFLOP_TABLE_MAGIC = b"PYPKPF01"
+PREFLOP_TABLE_HEADER = struct.Struct("<8sHHII")
+PREFLOP_TABLE_VALUE = struct.Struct("<f")
+PREFLOP_TABLE_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "preflop_equity.bin"
+)
+
+DEFAULT_PREFLOP_DEALS = 24000
+DEFAULT_PREFLOP_BOARDS = 20000
+
+_DEFAULT_TABLE = None
+
+
+def get_starting_hand_class(hole_card_ints: List[int]) -> int:
+    """
+    find the starting hand class index of two integer encoded hole cards
+
+    :param hole_card_ints: list of the two integer encoded hole cards
+    :return: class index between 0 and 168
+    """
+
+    row_a = 12 - (hole_card_ints[0] >> CARD_INT_SUIT_BITS)
+    row_b = 12 - (hole_card_ints[1] >> CARD_INT_SUIT_BITS)
+    row_high, row_low = min(row_a, row_b), max(row_a, row_b)
+
+    suited = (hole_card_ints[0] & CARD_INT_SUIT_MASK) == (
+        hole_card_ints[1] & CARD_INT_SUIT_MASK
+    )
+    if suited:
+        return row_high * 13 + row_low
+
+    return row_low * 13 + row_high
+
+
+def get_starting_hand_class_name(hand_class: int) -> str:
+    """
+    find the name of a starting hand class, e.g. AA, AKs or 72o
+
+    :param hand_class: class index between 0 and 168
+    :return: name of the class
+    """
+
+    row, column = divmod(hand_class, 13)
+    if row == column:
+        return STARTING_HAND_VALUE_NAMES[row] * 2
+    if row < column:
+        return f"{STARTING_HAND_VALUE_NAMES[row]}{STARTING_HAND_VALUE_NAMES[column]}s"
+
+    return f"{STARTING_HAND_VALUE_NAMES[column]}{STARTING_HAND_VALUE_NAMES[row]}o"
+
+
+class PreflopEquityTable(object):
+    """
+    read only view of a preflop equity table file. the file is memory mapped and each lookup unpacks a single value.
+    """
+
+    def __init__(self, path: str = PREFLOP_TABLE_PATH):
+        self.path = path
+        with open(path, "rb") as table_file:
+            self._map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < PREFLOP_TABLE_HEADER.size:
+            self.close()
+            raise EquityError(f"{path} is not a valid preflop equity table")
+
+        (
+            magic,
+            self.num_classes,
+            self.max_opponents,
+            self.num_deals,
+            self.num_boards,
+        ) = PREFLOP_TABLE_HEADER.unpack_from(self._map, 0)
+
+        self._opponents_offset = PREFLOP_TABLE_HEADER.size
+        self._matrix_offset = (
+            self._opponents_offset
+            + self.num_classes * self.max_opponents * PREFLOP_TABLE_VALUE.size
+        )
+        expected_size = (
+            self._matrix_offset
+            + self.num_classes * self.num_classes * PREFLOP_TABLE_VALUE.size
+        )
+        if (
+            magic != PREFLOP_TABLE_MAGIC
+            or self.num_classes != NUM_STARTING_HAND_CLASSES
+            or len(self._map) != expected_size
+        ):
+            self.close()
+            raise EquityError(f"{path} is not a valid preflop equity table")
+
+    def __enter__(self) -> "PreflopEquityTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        close the memory map of the table file
+        """
+
+        self._map.close()
+
+    def equity_vs_opponents(self, hand_class: int, opponents: int = 1) -> float:
+        """
+        find the equity of a starting hand class against a number of random opponent hands
+
+        :param hand_class: class index between 0 and 168
+        :param opponents: number of opponents between 1 and the tables max opponents
+        :return: share of the pot won on average
+        """
+
+        if not 0 <= hand_class < self.num_classes:
+            raise EquityError(
+                f"Starting hand class must be between 0 and {self.num_classes - 1}"
+            )
+        if not 1 <= opponents <= self.max_opponents:
+            raise EquityError(
+                f"Number of opponents must be between 1 and {self.max_opponents}"
+            )
+
+        offset = self._opponents_offset + PREFLOP_TABLE_VALUE.size * (
+            hand_class * self.max_opponents + opponents - 1
+        )
+        return PREFLOP_TABLE_VALUE.unpack_from(self._map, offset)[0]
+
+    def equity_vs_class(self, hand_class: int, opponent_class: int) -> float:
+        """
+        find the heads-up equity of a starting hand class against an opponents starting hand class. the equity is the
+        average over every combination of the two classes that do not share a card.
+
+        :param hand_class: class index between 0 and 168
+        :param opponent_class: class index between 0 and 168
+        :return: share of the pot won on average
+        """
+
+        for index in (hand_class, opponent_class):
+            if not 0 <= index < self.num_classes:
+                raise EquityError(
+                    f"Starting hand class must be between 0 and {self.num_classes - 1}"
+                )
+
+        offset = self._matrix_offset + PREFLOP_TABLE_VALUE.size * (
+            hand_class * self.num_classes + opponent_class
+        )
+        return PREFLOP_TABLE_VALUE.unpack_from(self._map, offset)[0]
+
+
+def get_preflop_equity_table() -> PreflopEquityTable:
+    """
+    get the bundled preflop equity table, opening it the first time it is requested
+
+    :return: PreflopEquityTable of the bundled table file
+    """
+
+    global _DEFAULT_TABLE
+    if _DEFAULT_TABLE is None:
+        _DEFAULT_TABLE = PreflopEquityTable()
+
+    return _DEFAULT_TABLE
+
+
+def generate_preflop_equity_table(
+    path: str = PREFLOP_TABLE_PATH,
+    num_deals: int = DEFAULT_PREFLOP_DEALS,
+    num_boards: int = DEFAULT_PREFLOP_BOARDS,
+    seed: Optional[int] = 0,
+) -> None:
+    """
+    generate a preflop equity table file. requires numpy.
+
+    equity against random opponents is sampled by dealing num_deals random boards and opponent hands to each class,
+    spread evenly over the combinations of the class. the first k opponents of each deal are used for the k opponent
+    equity. the heads-up matrix is sampled by ranking every starting hand on num_boards random boards and comparing
+    every pair of hands that do not share a card.
+
+    :param path: path of the file to write
+    :param num_deals: number of random deals per starting hand class
+    :param num_boards: number of random boards for the heads-up matrix
+    :param seed: seed for the random deals and boards
+    """
+
+    if numpy is None:
+        raise ImportError(
+            "numpy is required to generate the preflop equity table, install it with pip install pypoker[numpy]"
+        )
+
+    rng = numpy.random.default_rng(seed)
+    combos = numpy.asarray(list(combinations(range(52), 2)), dtype=numpy.int64)
+    combo_classes = numpy.asarray(
+        [get_starting_hand_class(combo) for combo in combos.tolist()]
+    )
+
+    opponent_equities = _sample_opponent_equities(rng, combos, combo_classes, num_deals)
+    matrix_equities = _sample_matrix_equities(rng, combos, combo_classes, num_boards)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as table_file:
+        table_file.write(
+            PREFLOP_TABLE_HEADER.pack(
+                PREFLOP_TABLE_MAGIC,
+                NUM_STARTING_HAND_CLASSES,
+                MAX_PREFLOP_OPPONENTS,
+                num_deals,
+                num_boards,
+            )
+        )
+        table_file.write(opponent_equities.astype("<f4").tobytes())
+        table_file.write(matrix_equities.astype("<f4").tobytes())
+
+
+# Private generator functions
+# ---------------------------
+def _sample_opponent_equities(
+    rng: "numpy.random.Generator",
+    combos: "numpy.ndarray",
+    combo_classes: "numpy.ndarray",
+    num_deals: int,
+) -> "numpy.ndarray":
+    """
+    private function to sample the equity of every class against 1 to MAX_PREFLOP_OPPONENTS random opponents
+
+    :param rng: numpy random generator
+    :param combos: (1326, 2) array of every pair of hole cards
+    :param combo_classes: class index of each combo
+    :param num_deals: number of random deals per class
+    :return: (169, MAX_PREFLOP_OPPONENTS) array of equities
+    """
+
+    dealt_size = 5 + 2 * MAX_PREFLOP_OPPONENTS
+    equities = numpy.zeros((NUM_STARTING_HAND_CLASSES, MAX_PREFLOP_OPPONENTS))
+
+    for hand_class in range(NUM_STARTING_HAND_CLASSES):
+        class_combos = combos[combo_classes == hand_class]
+        deals_per_combo = -(-num_deals // len(class_combos))
+
+        shares = []
+        for hole_cards in class_combos:
+            remaining = numpy.setdiff1d(numpy.arange(52), hole_cards)
+            order = rng.random((deals_per_combo, len(remaining))).argsort(axis=1)
+            dealt = remaining[order[:, :dealt_size]]
+            board = dealt[:, :5]
+
+            hands = [
+                numpy.hstack([numpy.tile(hole_cards, (deals_per_combo, 1)), board])
+            ]
+            for opponent in range(MAX_PREFLOP_OPPONENTS):
+                opponent_cards = dealt[:, 5 + 2 * opponent : 7 + 2 * opponent]
+                hands.append(numpy.hstack([opponent_cards, board]))
+            ranks, _ = evaluate_card_int_array(numpy.vstack(hands))
+            ranks = ranks.reshape(MAX_PREFLOP_OPPONENTS + 1, deals_per_combo)
+
+            hero_ranks, opponent_ranks = ranks[0][:, None], ranks[1:].T
+            best_opponent = numpy.maximum.accumulate(opponent_ranks, axis=1)
+            tied_opponents = numpy.cumsum(opponent_ranks == hero_ranks, axis=1)
+            shares.append(
+                numpy.where(
+                    hero_ranks > best_opponent,
+                    1.0,
+                    numpy.where(
+                        hero_ranks == best_opponent, 1.0 / (1 + tied_opponents), 0.0
+                    ),
+                )
+            )
+
+        equities[hand_class] = numpy.vstack(shares).mean(axis=0)
+
+    return equities
+
+
+def _sample_matrix_equities(
+    rng: "numpy.random.Generator",
+    combos: "numpy.ndarray",
+    combo_classes: "numpy.ndarray",
+    num_boards: int,
+) -> "numpy.ndarray":
+    """
+    private function to sample the heads-up equity of every class against every other class
+
+    :param rng: numpy random generator
+    :param combos: (1326, 2) array of every pair of hole cards
+    :param combo_classes: class index of each combo
+    :param num_boards: number of random boards to sample
+    :return: (169, 169) array of equities
+    """
+
+    combo_masks = (numpy.int64(1) << combos).sum(axis=1)
+    disjoint = (combo_masks[:, None] & combo_masks[None, :]) == 0
+    class_grouping = numpy.zeros(
+        (len(combos), NUM_STARTING_HAND_CLASSES), dtype=numpy.float32
+    )
+    class_grouping[numpy.arange(len(combos)), combo_classes] = 1
+
+    points = numpy.zeros((NUM_STARTING_HAND_CLASSES, NUM_STARTING_HAND_CLASSES))
+    matchups = numpy.zeros((NUM_STARTING_HAND_CLASSES, NUM_STARTING_HAND_CLASSES))
+    for _ in range(num_boards):
+        board = rng.choice(52, 5, replace=False)
+        board_mask = int(sum(1 << int(card) for card in board))
+        live = (combo_masks & board_mask) == 0
+
+        ranks = numpy.zeros(len(combos), dtype=numpy.int32)
+        ranks[live], _ = evaluate_card_int_array(
+            numpy.hstack([combos[live], numpy.tile(board, (int(live.sum()), 1))])
+        )
+        valid = disjoint & live[:, None] & live[None, :]
+
+        # a win scores two points and a tie one, halved once all boards are summed
+        board_points = (ranks[:, None] > ranks[None, :]).astype(numpy.float32) * 2
+        board_points += ranks[:, None] == ranks[None, :]
+        board_points *= valid
+        points += class_grouping.T @ board_points @ class_grouping
+        matchups += class_grouping.T @ valid.astype(numpy.float32) @ class_grouping
+
+    # class pairs that never met on a sampled board are treated as a coin flip
+    return numpy.divide(
+        points, 2 * matchups, out=numpy.full_like(points, 0.5), where=matchups > 0
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    generate_preflop_equity_table()
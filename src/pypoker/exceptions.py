@@ -42,3 +42,9 @@ class OutsError(PyPokerError):
     """
     Error thrown when trying to find outs for a player
     """
+
+
+class EquityError(PyPokerError):
+    """
+    Error thrown when trying to calculate the equity of players but an error occurs, usually a card being used twice
+    """
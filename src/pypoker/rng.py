@@ -0,0 +1,64 @@
+"""
+pypoker.rng module
+------------------
+
+helpers for the random number generators used to shuffle and deal decks.
+any object with the random.Random interface (shuffle and randrange) or the numpy Generator interface (shuffle and
+integers) can be used, so simulations can give every worker process its own reproducible stream.
+
+counter based streams require numpy (pip install pypoker[numpy]).
+"""
+
+import random
+from typing import List, Union, Any
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+RNG = Union[random.Random, "numpy.random.Generator", Any]
+
+
+def random_below(rng: RNG, upper: int) -> int:
+    """
+    draw a random integer from 0 up to but not including upper
+
+    :param rng: random.Random or numpy Generator like object, the random module is used if None
+    :param upper: exclusive upper bound
+    :return: random integer
+    """
+
+    if rng is None:
+        return random.randrange(upper)
+
+    if hasattr(rng, "integers"):
+        return int(rng.integers(upper))
+
+    return rng.randrange(upper)
+
+
+def spawn_rngs(seed: int, count: int, counter_based: bool = False) -> List[RNG]:
+    """
+    create independent random number generators from a single seed, e.g. one per worker process.
+    the same seed always gives the same streams, whichever process they are created in.
+
+    :param seed: seed shared by every stream
+    :param count: number of streams to create
+    :param counter_based: Boolean indicating if numpy Generators backed by the counter based Philox bit generator
+        should be created instead of random.Random objects. Requires numpy.
+    :return: list of random number generators
+    """
+
+    if not counter_based:
+        return [random.Random(f"{seed}:{index}") for index in range(count)]
+
+    if numpy is None:
+        raise ImportError(
+            "numpy is required for counter based streams, install it with pip install pypoker[numpy]"
+        )
+
+    return [
+        numpy.random.Generator(numpy.random.Philox(child_seed))
+        for child_seed in numpy.random.SeedSequence(seed).spawn(count)
+    ]
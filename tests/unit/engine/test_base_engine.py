@@ -3,7 +3,7 @@ from typing import List
 from pytest import fixture, mark
 
 from pypoker.constants import HandType
-from pypoker.constructs import Card, Deck
+from pypoker.constructs import Card, Deck, AnyCard, AnySuitCard, CardSet
 from pypoker.engine import BasePokerEngine
 from pypoker.player import BasePlayer
 
@@ -22,6 +22,9 @@ def base_engine():
         def find_player_outs(self, player: BasePlayer, hand_type: HandType, board: List[Card], deck: Deck) -> List[List[Card]]:
             pass
 
+        def calculate_equity(self, players: List[BasePlayer], board: List[Card], dead_cards: List[Card]):
+            pass
+
     return FakePokerEngine()
 
 
@@ -74,6 +77,61 @@ def test_when_group_cards_by_value_then_empty_list_in_returned_dict(
     assert result[14] == [cards[8]]
 
 
+def test_when_group_cards_by_suit_and_integer_cards_then_correct_dict_returned(
+    base_engine, get_test_cards
+):
+    cards = [card.to_int() for card in get_test_cards("D5|H8|D6|C2")]
+
+    result = base_engine.group_cards_by_suit(cards)
+    assert result["Diamonds"] == [cards[0], cards[2]]
+    assert result["Hearts"] == [cards[1]]
+    assert result["Clubs"] == [cards[3]]
+    assert result["Spades"] == []
+
+
+def test_when_group_cards_by_value_and_integer_cards_then_correct_dict_returned(
+    base_engine, get_test_cards
+):
+    cards = [card.to_int() for card in get_test_cards("D5|H8|D6|S5|C8")]
+
+    result = base_engine.group_cards_by_value(cards)
+
+    assert result[5] == [cards[0], cards[3]]
+    assert result[6] == [cards[2]]
+    assert result[8] == [cards[1], cards[4]]
+    assert all(result[value] == [] for value in [2, 3, 4, 7, 9, 10, 11, 12, 13, 14])
+
+
+def test_when_find_consecutive_value_cards_and_integer_cards_then_correct_lists_returned(
+    base_engine, get_test_cards
+):
+    cards = [card.to_int() for card in get_test_cards("D4|D8|S3|HT|C2|SJ|HA")]
+
+    result = base_engine.find_consecutive_value_cards(
+        cards, treat_ace_low=True, run_size=3
+    )
+
+    assert result == [[cards[6], cards[4], cards[2]], [cards[4], cards[2], cards[0]]]
+
+
+@mark.parametrize("cards, values_unique, values_match, suits_unique, suits_match, consecutive", [
+    ("D4|C6|H7|SK", True, False, True, False, False),
+    ("C4|D4|S4|H4", False, True, True, False, False),
+    ("C4|C8|CK|C2", True, False, False, True, False),
+    ("H4|H5|D2|SA|C3", True, False, False, False, True),
+])
+def test_when_check_card_utilities_and_integer_cards_then_correct_values_returned(
+    base_engine, get_test_cards, cards, values_unique, values_match, suits_unique, suits_match, consecutive
+):
+    cards = [card.to_int() for card in get_test_cards(cards)]
+
+    assert base_engine.check_all_card_values_unique(cards) == values_unique
+    assert base_engine.check_all_card_values_match(cards) == values_match
+    assert base_engine.check_all_card_suits_unique(cards) == suits_unique
+    assert base_engine.check_all_card_suits_match(cards) == suits_match
+    assert base_engine.check_cards_consecutive(cards) == consecutive
+
+
 def test_when_find_consecutive_value_cards_and_no_run_size_and_single_values_then_correct_lists_returned(
     base_engine, get_test_cards
 ):
@@ -281,3 +339,53 @@ def test_when_deduplicate_card_sets_then_correct_sets_returned(base_engine, get_
     actual = base_engine.deduplicate_card_sets(raw_sets)
 
     assert actual == expected_sets
+
+
+@mark.parametrize("raw_sets, expected_sets", [
+    (["S7|DK", "C2|H3", "SK|S7", "DK|S7"], ["DK|S7", "H3|C2", "SK|S7"]),
+    (["CA|H2", "H2|CA", "SK|S7"], ["CA|H2", "SK|S7"]),
+])
+def test_when_deduplicate_card_sets_and_keep_order_then_first_seen_order_returned(base_engine, get_test_cards, raw_sets, expected_sets):
+    raw_sets = [get_test_cards(card_set) for card_set in raw_sets]
+    expected_sets = [get_test_cards(card_set) for card_set in expected_sets]
+
+    actual = base_engine.deduplicate_card_sets(raw_sets, keep_order=True)
+
+    assert actual == expected_sets
+
+
+def test_when_deduplicate_card_sets_with_special_cards_then_special_cards_compared_by_name(base_engine, get_test_cards):
+    raw_sets = [
+        get_test_cards("SK") + [AnyCard("")],
+        [AnyCard("")] + get_test_cards("SK"),
+        get_test_cards("SK") + [AnyCard(""), AnyCard("")],
+        get_test_cards("SK") + [AnySuitCard("9")],
+    ]
+
+    actual = base_engine.deduplicate_card_sets(raw_sets, keep_order=True)
+
+    assert actual == [raw_sets[0], raw_sets[2], raw_sets[3]]
+
+
+@mark.parametrize("first_set, second_set, expected_equal", [
+    ("SK|S7", "S7|SK", True),
+    ("SK|S7", "SK|S8", False),
+])
+def test_when_get_card_set_key_then_key_ignores_card_order(base_engine, get_test_cards, first_set, second_set, expected_equal):
+    first_key = base_engine.get_card_set_key(get_test_cards(first_set))
+    second_key = base_engine.get_card_set_key(get_test_cards(second_set))
+
+    assert (first_key == second_key) == expected_equal
+
+
+def test_when_get_card_set_key_of_card_set_then_key_matches_card_list(base_engine, get_test_cards):
+    cards = get_test_cards("SK|S7|HA")
+
+    assert base_engine.get_card_set_key(CardSet.from_cards(cards)) == base_engine.get_card_set_key(cards)
+
+
+def test_when_group_cards_by_suit_of_card_set_then_cards_grouped(base_engine, get_test_cards):
+    suit_groups = base_engine.group_cards_by_suit(CardSet.from_cards(get_test_cards("SK|S7|HA")))
+
+    assert suit_groups["Spades"] == get_test_cards("S7|SK")
+    assert suit_groups["Hearts"] == get_test_cards("HA")
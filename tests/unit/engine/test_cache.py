@@ -0,0 +1,233 @@
+from pytest import fixture, mark, raises
+
+from pypoker.constants import TexasHoldemHandType, OutsCalculationMethod, EquityCalculationMethod
+from pypoker.constructs import Card, OutsCount, PlayerEquity
+from pypoker.engine.cache import CachedPokerEngine, LRUResultStore, CacheStats, freeze_result, copy_result, estimate_size
+from pypoker.engine.texas_holdem import TexasHoldemPokerEngine
+from pypoker.player.human import HumanPlayer
+
+
+@fixture
+def engine():
+    return TexasHoldemPokerEngine()
+
+
+@fixture
+def cached_engine(engine):
+    return CachedPokerEngine(engine)
+
+
+def test_when_get_or_compute_then_result_computed_once():
+    store = LRUResultStore()
+    computed = []
+
+    first = store.get_or_compute("key", lambda: computed.append(1) or [1, [2, 3]])
+    second = store.get_or_compute("key", lambda: computed.append(1) or [4])
+
+    assert computed == [1]
+    assert first == second == (1, (2, 3))
+    assert store.get_stats() == CacheStats(1, 1, 0, 1, estimate_size("key") + estimate_size((1, (2, 3))))
+
+
+def test_when_store_over_max_entries_then_least_recently_used_evicted():
+    store = LRUResultStore(max_entries=2)
+    store.get_or_compute("first", lambda: 1)
+    store.get_or_compute("second", lambda: 2)
+    store.get_or_compute("first", lambda: 1)
+
+    store.get_or_compute("third", lambda: 3)
+
+    assert store.get_or_compute("first", lambda: 10) == 1
+    assert store.get_or_compute("second", lambda: 20) == 20
+    assert (store.evictions, len(store)) == (2, 2)
+
+
+def test_when_store_over_max_bytes_then_least_recently_used_evicted():
+    entry_size = estimate_size("key_1") + estimate_size((1, 2, 3))
+    store = LRUResultStore(max_entries=None, max_bytes=entry_size * 2)
+
+    for index in range(5):
+        store.get_or_compute(f"key_{index}", lambda: [1, 2, 3])
+
+    assert store.get_stats() == CacheStats(0, 5, 3, 2, entry_size * 2)
+
+
+def test_when_result_larger_than_max_bytes_then_result_not_stored():
+    store = LRUResultStore(max_bytes=1)
+
+    result = store.get_or_compute("key", lambda: [1, 2, 3])
+
+    assert result == (1, 2, 3)
+    assert len(store) == 0
+
+
+@mark.parametrize("max_entries, max_bytes, message", [
+    (0, None, "max_entries must be at least 1"),
+    (None, 0, "max_bytes must be at least 1"),
+])
+def test_when_store_limits_invalid_then_raise_error(max_entries, max_bytes, message):
+    with raises(ValueError, match=message):
+        LRUResultStore(max_entries, max_bytes)
+
+
+def test_when_clear_then_results_and_counters_reset():
+    store = LRUResultStore(max_entries=1)
+    store.get_or_compute("first", lambda: 1)
+    store.get_or_compute("second", lambda: 2)
+
+    store.clear()
+
+    assert store.get_stats() == CacheStats()
+
+
+def test_when_copy_result_then_mutable_objects_copied_and_cards_shared():
+    cards = (Card("HA"), Card("SK"))
+    equity = PlayerEquity(wins=1)
+    result = freeze_result([[Card("HA"), Card("SK")], equity])
+
+    copied = copy_result(result)
+
+    assert copied == (cards, equity)
+    assert copied[0] is result[0]
+    assert copied[1] is not equity
+
+
+@mark.parametrize("hits, misses, expected", [
+    (0, 0, 0.0),
+    (3, 1, 0.75),
+])
+def test_when_cache_stats_hit_rate_then_share_of_hits_returned(hits, misses, expected):
+    assert CacheStats(hits, misses).hit_rate == expected
+
+
+def test_when_cached_engine_not_given_engine_then_raise_error():
+    with raises(ValueError, match="engine must be a BasePokerEngine object"):
+        CachedPokerEngine("engine")
+
+
+def test_when_cached_find_player_best_hand_then_cards_in_any_order_hit_cache(engine, cached_engine, get_test_cards):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA"))
+    reordered = HumanPlayer("Greg", hole_cards=get_test_cards("SA|HA"))
+    board = get_test_cards("DJ|D2|S7|CA")
+
+    first = cached_engine.find_player_best_hand(player, board)
+    second = cached_engine.find_player_best_hand(reordered, board[::-1])
+    assert second[0].cards == first[0].cards
+    second[0].cards.clear()
+
+    assert first == tuple(engine.find_player_best_hand(player, board))
+    assert cached_engine.find_player_best_hand(player, board)[0].cards == first[0].cards
+    assert cached_engine.get_cache_stats().hits == 2
+
+
+def test_when_cached_find_player_best_hand_with_kwargs_then_kwargs_keyed(cached_engine, get_test_cards):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA"))
+    board = get_test_cards("DJ|D2|S7|CA")
+
+    cached_engine.find_player_best_hand(player, board)
+    cached_engine.find_player_best_hand(player, board, use_lookup_tables=True)
+
+    assert cached_engine.get_cache_stats().misses == 2
+
+
+@mark.parametrize("kwargs", [
+    {},
+    {"method": OutsCalculationMethod.Implicit},
+    {"count_only": True},
+])
+def test_when_cached_find_player_outs_then_frozen_outs_returned(engine, cached_engine, get_test_cards, get_deck_minus_set, kwargs):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|HK"))
+    board = get_test_cards("H7|H8|C9")
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+    expected = engine.find_player_outs(player, TexasHoldemHandType.Flush, board, possible_cards, **kwargs)
+
+    first = cached_engine.find_player_outs(player, TexasHoldemHandType.Flush, board, possible_cards, **kwargs)
+    second = cached_engine.find_player_outs(player, TexasHoldemHandType.Flush, board, possible_cards, **kwargs)
+
+    if isinstance(expected, OutsCount):
+        assert first == second == expected
+        assert first is not second
+    else:
+        assert first == second == tuple(tuple(out) for out in expected)
+    assert (cached_engine.get_cache_stats().hits, cached_engine.get_cache_stats().misses) == (1, 1)
+
+
+def test_when_cached_calculate_equity_then_exact_equity_cached(engine, cached_engine, get_test_cards):
+    players = [
+        HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA")),
+        HumanPlayer("Greg", hole_cards=get_test_cards("D9|DT")),
+    ]
+    board = get_test_cards("DJ|D2|S7|CQ")
+
+    first = cached_engine.calculate_equity(players, board)
+    first[0].wins = 0
+    second = cached_engine.calculate_equity(players, board, workers=2)
+
+    assert second == tuple(engine.calculate_equity(players, board))
+    assert cached_engine.get_cache_stats().hits == 1
+
+
+def test_when_cached_calculate_equity_and_monte_carlo_then_equity_not_cached(cached_engine, get_test_cards):
+    players = [
+        HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA")),
+        HumanPlayer("Greg", hole_cards=get_test_cards("D9|DT")),
+    ]
+    board = get_test_cards("DJ|D2|S7")
+
+    cached_engine.calculate_equity(players, board, method=EquityCalculationMethod.MonteCarlo, seed=1, max_samples=100)
+    cached_engine.calculate_equity(players, board, None, EquityCalculationMethod.MonteCarlo, 1, max_samples=100)
+
+    assert len(cached_engine.store) == 0
+
+
+def test_when_cached_engine_method_not_cached_then_wrapped_engine_method_used(engine, cached_engine, get_test_cards):
+    assert cached_engine.find_preflop_equity(get_test_cards("HA|SA")) == engine.find_preflop_equity(get_test_cards("HA|SA"))
+
+
+def test_when_cached_engine_options_passed_positionally_then_same_results_as_engine(engine, cached_engine, get_test_cards, get_deck_minus_set):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|HK"))
+    board = get_test_cards("H7|H8|C9")
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    outs = cached_engine.find_player_outs(player, TexasHoldemHandType.Flush, board, possible_cards, True)
+    best_hands = cached_engine.find_player_best_hand(player, board, True)
+
+    assert outs == engine.find_player_outs(player, TexasHoldemHandType.Flush, board, possible_cards, True)
+    assert best_hands == tuple(engine.find_player_best_hand(player, board, True))
+
+
+def test_when_cached_engine_options_default_or_explicit_then_results_share_key(cached_engine, get_test_cards, get_deck_minus_set):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|HK"))
+    board = get_test_cards("H7|H8|C9")
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    cached_engine.find_player_outs(player, TexasHoldemHandType.Flush, board, possible_cards)
+    cached_engine.find_player_outs(
+        player, TexasHoldemHandType.Flush, board, possible_cards, method=OutsCalculationMethod.ExplicitPartial
+    )
+    cached_engine.find_player_outs(
+        player, TexasHoldemHandType.Flush, board, possible_cards, False, OutsCalculationMethod.ExplicitPartial
+    )
+    cached_engine.find_player_best_hand(player, board, use_lookup_tables=False)
+    cached_engine.find_player_best_hand(player, board)
+
+    assert (cached_engine.get_cache_stats().hits, cached_engine.get_cache_stats().misses) == (3, 2)
+    assert len(cached_engine.store) == 2
+
+
+def test_when_cached_engine_bad_arguments_then_raise_same_error_as_engine(cached_engine, get_test_cards):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|HK"))
+
+    with raises(TypeError):
+        cached_engine.find_player_best_hand(player, [], True, True)
+    with raises(TypeError):
+        cached_engine.find_player_best_hand(player, [], use_tables=True)
+
+
+def test_when_store_freeze_false_then_results_stored_as_computed():
+    store = LRUResultStore(freeze=False)
+
+    result = store.get_or_compute("key", lambda: [[1, 2]])
+
+    assert result == [[1, 2]]
+    assert store.get_or_compute("key", lambda: None) is result
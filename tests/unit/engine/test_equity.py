@@ -0,0 +1,243 @@
+from itertools import combinations
+
+from pytest import mark, importorskip
+
+from pypoker.constants import HAND_KEY_STRENGTH_SHIFT
+from pypoker.constructs import PlayerEquity
+from pypoker.engine.equity import (
+    calculate_exact_equity,
+    calculate_range_equity,
+    calculate_sampled_equity,
+    merge_equities,
+    sample_runouts,
+    tally_runouts,
+    tally_draw_hand_strengths,
+)
+from pypoker.engine.evaluator import evaluate_card_ints
+
+
+def _to_ints(cards):
+    return [card.to_int() for card in cards]
+
+
+def _available_ints(*used_cards):
+    used = [card for cards in used_cards for card in cards]
+    return [card_int for card_int in range(52) if card_int not in used]
+
+
+def test_when_calculate_exact_equity_and_one_card_to_come_then_correct_counts_returned(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK"))]
+    board = _to_ints(get_test_cards("C2|D7|H9|SK"))
+
+    result = calculate_exact_equity(hole_cards, board, _available_ints(board, *hole_cards))
+
+    assert [(equity.wins, equity.ties, equity.losses) for equity in result] == [(2, 0, 42), (42, 0, 2)]
+    assert result[0].equity == 2 / 44
+    assert result[1].equity == 42 / 44
+
+
+def test_when_calculate_exact_equity_and_board_plays_then_all_runouts_tied(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("H2|D3")), _to_ints(get_test_cards("C2|H3"))]
+    board = _to_ints(get_test_cards("ST|SJ|SQ|SK"))
+
+    result = calculate_exact_equity(hole_cards, board, _available_ints(board, *hole_cards))
+
+    for equity in result:
+        assert (equity.wins, equity.ties, equity.losses) == (0, 44, 0)
+        assert equity.tie_counts == {2: 44}
+        assert equity.equity == 0.5
+
+
+@mark.parametrize("hole_cards, board", [
+    (["HA|SA", "DK|CK", "C7|C8"], "C9|CT|D2"),
+    (["H5|H6", "S5|S6", "D9|C9"], "H7|H8|S9"),
+    (["DA|DK", "C2|C3"], "DQ|D2|S3|H3"),
+])
+def test_when_calculate_exact_equity_then_counts_match_brute_force(get_test_cards, hole_cards, board):
+    hole_cards = [_to_ints(get_test_cards(cards)) for cards in hole_cards]
+    board = _to_ints(get_test_cards(board))
+    available = _available_ints(board, *hole_cards)
+
+    result = calculate_exact_equity(hole_cards, board, available)
+
+    expected = [[0, 0, 0] for _ in hole_cards]
+    for runout in combinations(available, 5 - len(board)):
+        ranks = [evaluate_card_ints(cards + board + list(runout)) for cards in hole_cards]
+        winners = [player for player, rank in enumerate(ranks) if rank == max(ranks)]
+        for player in range(len(hole_cards)):
+            if player not in winners:
+                expected[player][2] += 1
+            elif len(winners) == 1:
+                expected[player][0] += 1
+            else:
+                expected[player][1] += 1
+
+    assert [[equity.wins, equity.ties, equity.losses] for equity in result] == expected
+    assert abs(sum(equity.equity for equity in result) - 1) < 1e-9
+
+
+def test_when_tally_runouts_and_no_runouts_then_empty_equity_returned(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK"))]
+
+    result = tally_runouts(hole_cards, _to_ints(get_test_cards("C2|D7|H9|SK|S2")), [])
+
+    assert [(equity.total, equity.equity) for equity in result] == [(0, 0.0), (0, 0.0)]
+
+
+def test_when_calculate_sampled_equity_and_same_seed_then_same_result_returned(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK")), _to_ints(get_test_cards("C7|C8"))]
+    available = _available_ints(*hole_cards)
+
+    result_a = calculate_sampled_equity(hole_cards, [], available, seed=42, max_samples=3000, batch_size=1000)
+    result_b = calculate_sampled_equity(hole_cards, [], available, seed=42, max_samples=3000, batch_size=1000)
+    result_c = calculate_sampled_equity(hole_cards, [], available, seed=43, max_samples=3000, batch_size=1000)
+
+    assert result_a == result_b
+    assert result_a != result_c
+    assert all(equity.total == 3000 for equity in result_a)
+
+
+def test_when_calculate_sampled_equity_then_within_confidence_interval_of_exact_equity(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("D9|DT")), _to_ints(get_test_cards("C7|H7"))]
+    board = _to_ints(get_test_cards("DJ|D2|S7"))
+    available = _available_ints(board, *hole_cards)
+
+    exact = calculate_exact_equity(hole_cards, board, available)
+    sampled = calculate_sampled_equity(hole_cards, board, available, seed=7, max_samples=5000)
+
+    for exact_equity, sampled_equity in zip(exact, sampled):
+        lower, upper = sampled_equity.confidence_interval(0.999)
+        assert lower <= exact_equity.equity <= upper
+
+
+def test_when_calculate_sampled_equity_and_target_standard_error_then_stop_early(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK"))]
+    available = _available_ints(*hole_cards)
+
+    result = calculate_sampled_equity(
+        hole_cards, [], available, seed=1, target_standard_error=0.01, max_samples=100000, batch_size=500
+    )
+
+    assert result[0].total == 1500
+    assert all(equity.standard_error <= 0.01 for equity in result)
+
+
+def test_when_calculate_sampled_equity_and_time_budget_used_then_stop_early(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK"))]
+    available = _available_ints(*hole_cards)
+
+    result = calculate_sampled_equity(hole_cards, [], available, seed=1, time_budget=0, batch_size=100)
+
+    assert result[0].total == 100
+
+
+def test_when_calculate_sampled_equity_and_no_draws_then_exact_equity_returned(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK"))]
+    board = _to_ints(get_test_cards("C2|D7|H9|SK|S2"))
+
+    result = calculate_sampled_equity(hole_cards, board, _available_ints(board, *hole_cards), seed=1)
+
+    assert [(equity.wins, equity.ties, equity.losses) for equity in result] == [(0, 0, 1), (1, 0, 0)]
+
+
+def test_when_sample_runouts_then_batches_are_reproducible_and_valid():
+    available = list(range(10, 40))
+
+    batch_a = list(sample_runouts(available, 3, 5, 0, 50))
+    batch_b = list(sample_runouts(available, 3, 5, 0, 50))
+    batch_c = list(sample_runouts(available, 3, 5, 1, 50))
+
+    assert batch_a == batch_b
+    assert batch_a != batch_c
+    assert all(len(set(runout)) == 3 and set(runout) <= set(available) for runout in batch_a)
+
+
+def test_when_merge_equities_then_counts_summed():
+    equities_a = [PlayerEquity(1, 2, 3, {2: 2}), PlayerEquity(3, 2, 1, {2: 1, 3: 1})]
+    equities_b = [PlayerEquity(4, 1, 0, {3: 1}), PlayerEquity(0, 1, 4, {3: 1})]
+
+    result = merge_equities(equities_a, equities_b)
+
+    assert result == [PlayerEquity(5, 3, 3, {2: 2, 3: 1}), PlayerEquity(3, 3, 5, {2: 1, 3: 2})]
+
+
+def test_when_calculate_exact_equity_and_workers_then_same_result_as_single_process(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK")), _to_ints(get_test_cards("C7|C8"))]
+    available = _available_ints(*hole_cards)[:20]
+
+    result = calculate_exact_equity(hole_cards, [], available, workers=2)
+
+    assert result == calculate_exact_equity(hole_cards, [], available)
+    assert result[0].total == 15504
+
+
+def test_when_calculate_sampled_equity_and_workers_then_same_result_as_single_process(get_test_cards):
+    hole_cards = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("DK|CK"))]
+    available = _available_ints(*hole_cards)
+
+    result = calculate_sampled_equity(
+        hole_cards, [], available, seed=11, target_standard_error=0.01, batch_size=500, workers=3
+    )
+    expected = calculate_sampled_equity(
+        hole_cards, [], available, seed=11, target_standard_error=0.01, batch_size=500
+    )
+
+    assert result == expected
+
+
+@mark.parametrize("range_a, range_b, board", [
+    ("HA|SA,DK|CK,C7|C8,D9|DT", "HK|SK,DA|CA,H7|H8,D9|DT,S2|S3", "DJ|D2|S7|C9"),
+    ("HA|HK,C5|C6,S9|D9", "SA|SK,HQ|HJ,C5|C6,D2|C2", "H2|H7|S9"),
+])
+def test_when_calculate_range_equity_then_counts_match_weighted_exact_equity(get_test_cards, range_a, range_b, board):
+    importorskip("numpy")
+    range_a = [_to_ints(get_test_cards(cards)) for cards in range_a.split(",")]
+    range_b = [_to_ints(get_test_cards(cards)) for cards in range_b.split(",")]
+    weights_a = [1, 0.5, 2, 1][:len(range_a)]
+    weights_b = [0.25, 1, 3, 1, 2][:len(range_b)]
+    board = _to_ints(get_test_cards(board))
+
+    expected = PlayerEquity(0, 0, 0, {})
+    for combo_a, weight_a in zip(range_a, weights_a):
+        for combo_b, weight_b in zip(range_b, weights_b):
+            if set(combo_a) & set(combo_b) or set(combo_a + combo_b) & set(board):
+                continue
+            equity = calculate_exact_equity([combo_a, combo_b], board, _available_ints(combo_a, combo_b, board))[0]
+            expected.wins += weight_a * weight_b * equity.wins
+            expected.ties += weight_a * weight_b * equity.ties
+            expected.losses += weight_a * weight_b * equity.losses
+
+    result = calculate_range_equity([range_a, range_b], [weights_a, weights_b], board, _available_ints(board))
+
+    assert (result[0].wins, result[0].ties, result[0].losses) == (expected.wins, expected.ties, expected.losses)
+    assert (result[1].wins, result[1].ties, result[1].losses) == (expected.losses, expected.ties, expected.wins)
+    assert result[0].tie_counts == {2: expected.ties}
+
+
+def test_when_calculate_range_equity_and_combos_hold_board_cards_then_combos_removed(get_test_cards):
+    importorskip("numpy")
+    board = _to_ints(get_test_cards("HA|D2|S7"))
+    range_a = [_to_ints(get_test_cards("HA|SA")), _to_ints(get_test_cards("CA|DA"))]
+    range_b = [_to_ints(get_test_cards("HK|SK"))]
+
+    result = calculate_range_equity([range_a, range_b], [[1, 1], [1]], board, _available_ints(board))
+
+    assert result[0].total == 990
+    assert result[0].equity == calculate_exact_equity(
+        [range_a[1], range_b[0]], board, _available_ints(board, range_a[1], range_b[0])
+    )[0].equity
+
+
+@mark.parametrize("card_ids, draws", [
+    ("HA|H9|H7|H8|C9", 2),
+    ("SK|CK|D7|S7|C2|HQ", 1),
+    ("HA|SA|DA|CA|H2|H3|H4", 0),
+])
+def test_when_tally_draw_hand_strengths_then_best_hand_strengths_counted(get_test_cards, card_ids, draws):
+    card_ints = [card.to_int() for card in get_test_cards(card_ids)]
+    available_ints = [card_int for card_int in range(52) if card_int not in card_ints]
+    expected = [0] * 10
+    for draw in combinations(available_ints, draws):
+        expected[evaluate_card_ints(card_ints + list(draw)) >> HAND_KEY_STRENGTH_SHIFT] += 1
+
+    assert tally_draw_hand_strengths(card_ints, available_ints, draws) == expected
@@ -0,0 +1,199 @@
+from pytest import mark, raises, importorskip
+
+from pypoker.constants import TexasHoldemHandType
+from pypoker.engine.evaluator import (
+    pack_rank,
+    unpack_rank,
+    evaluate_cards,
+    evaluate_card_ints,
+    evaluate_card_int_array,
+    select_hand_cards,
+    get_rank_mask,
+    find_straight_windows,
+    find_straight_draws,
+    STRAIGHT_HIGHS,
+    STRAIGHT_COMPLETIONS,
+    RANK_BITS,
+)
+from pypoker.exceptions import InvalidHandError
+
+
+@mark.parametrize("hand_type, tiebreakers", [
+    (TexasHoldemHandType.StraightFlush, [5]),
+    (TexasHoldemHandType.Quads, [9, None]),
+    (TexasHoldemHandType.FullHouse, [14, 13]),
+    (TexasHoldemHandType.Flush, [13, 12, 7, 4, 3]),
+    (TexasHoldemHandType.Trips, [4, 13, None]),
+    (TexasHoldemHandType.TwoPair, [4, 3, 13]),
+    (TexasHoldemHandType.Pair, [4, None, None, None]),
+    (TexasHoldemHandType.HighCard, [14, 9, 7, 4, 2]),
+])
+def test_when_pack_rank_and_unpack_rank_then_values_round_trip(hand_type, tiebreakers):
+    actual = unpack_rank(pack_rank(hand_type, tiebreakers))
+
+    assert actual == (hand_type, tiebreakers)
+
+
+@mark.parametrize("stronger, weaker", [
+    ((TexasHoldemHandType.StraightFlush, [5]), (TexasHoldemHandType.Quads, [14, 13])),
+    ((TexasHoldemHandType.Straight, [6]), (TexasHoldemHandType.Straight, [5])),
+    ((TexasHoldemHandType.Pair, [7, 13, 2, None]), (TexasHoldemHandType.Pair, [7, 13, None, None])),
+    ((TexasHoldemHandType.HighCard, [3, None, None, None, None]), (TexasHoldemHandType.HighCard, [2, None, None, None, None])),
+])
+def test_when_pack_rank_then_stronger_hands_have_higher_ranks(stronger, weaker):
+    assert pack_rank(*stronger) > pack_rank(*weaker)
+
+
+@mark.parametrize("values, expected", [
+    ([14, 13, 12, 11, 10], 14),
+    ([14, 2, 3, 4, 5], 5),
+    ([14, 2, 3, 4, 5, 6], 6),
+    ([14, 13, 12, 11, 9], 0),
+    ([2, 3, 4, 5], 0),
+])
+def test_when_straight_highs_then_correct_high_card_returned(values, expected):
+    mask = sum(RANK_BITS[value] for value in values)
+
+    assert STRAIGHT_HIGHS[mask] == expected
+
+
+@mark.parametrize("values, expected", [
+    ([14, 2, 3, 4, 5, 6, 7], [(7, (3, 4, 5, 6, 7)), (6, (2, 3, 4, 5, 6)), (5, (14, 2, 3, 4, 5))]),
+    ([14, 13, 12, 11, 10, 10], [(14, (10, 11, 12, 13, 14))]),
+    ([14, 13, 12, 11, 9], []),
+])
+def test_when_find_straight_windows_then_every_straight_returned_best_first(values, expected):
+    windows = find_straight_windows(get_rank_mask(values))
+
+    assert [(high, window_values) for high, _, window_values in windows] == expected
+
+
+@mark.parametrize("values, expected", [
+    ([6, 7, 8, 9], [5, 10]),
+    ([6, 7, 9, 10], [8]),
+    ([14, 2, 3, 4], [5]),
+    ([2, 3, 4, 5, 6], [7, 14]),
+    ([2, 3, 9, 13], []),
+])
+def test_when_straight_completions_then_completing_values_returned(values, expected):
+    completing = STRAIGHT_COMPLETIONS[get_rank_mask(values)]
+
+    assert completing == get_rank_mask(expected)
+
+
+@mark.parametrize("current_values, available_values, draws, expected", [
+    ([6, 7, 8, 9], [5, 10, 14], 1, [[5], [10]]),
+    ([6, 7, 8, 9], [10, 14], 1, [[10]]),
+    ([2, 3, 4, 5, 6], [7, 8], 1, [[], [7]]),
+    ([7, 8, 11], [9, 10, 12], 2, [[9, 10]]),
+    ([5, 6, 7], [3, 4, 8, 9], 2, [[3, 4], [4, 8], [8, 9]]),
+    ([5, 6, 7], [3, 4, 8, 9], 3, [[3, 4], [4, 8], [8, 9]]),
+    ([14, 2, 3], [4, 5, 6], 3, [[4, 5], [4, 5, 6]]),
+])
+def test_when_find_straight_draws_then_missing_values_returned(current_values, available_values, draws, expected):
+    actual = find_straight_draws(get_rank_mask(current_values), get_rank_mask(available_values), draws)
+
+    assert actual == [get_rank_mask(values) for values in expected]
+
+
+@mark.parametrize("current_mask", range(0, 1 << 13, 37))
+def test_when_find_straight_draws_with_one_draw_then_lookup_matches_window_search(current_mask):
+    available_mask = ~current_mask & 0x1FFF
+    expected = [
+        missing for missing in find_straight_draws(current_mask, available_mask, 2)
+        if bin(missing).count("1") <= 1
+    ]
+
+    assert find_straight_draws(current_mask, available_mask, 1) == expected
+
+
+@mark.parametrize("cards, hand_type, tiebreakers", [
+    ("D4|D5|D7|H6|D6|C3|D3", TexasHoldemHandType.StraightFlush, [7]),
+    ("DA|D2|D3|D4|D5|H5|S5", TexasHoldemHandType.StraightFlush, [5]),
+    ("D4|D5|C5|H6|DA|H5|S5", TexasHoldemHandType.Quads, [5, 14]),
+    ("D4|D5|C5|H6|DA|H5|S6", TexasHoldemHandType.FullHouse, [5, 6]),
+    ("D4|H5|D7|H6|DK|D3|DQ", TexasHoldemHandType.Flush, [13, 12, 7, 4, 3]),
+    ("D4|H5|S7|H6|C3|SK", TexasHoldemHandType.Straight, [7]),
+    ("D4|H5|S4|H4|C3|SK", TexasHoldemHandType.Trips, [4, 13, 5]),
+    ("D4|H5|S4|H3|C3|SK", TexasHoldemHandType.TwoPair, [4, 3, 13]),
+    ("D4|H5|S4|H3|C9|SK", TexasHoldemHandType.Pair, [4, 13, 9, 5]),
+    ("D4|H5|SJ|H3|C9|SK", TexasHoldemHandType.HighCard, [13, 11, 9, 5, 4]),
+    ("D4|S4", TexasHoldemHandType.Pair, [4, None, None, None]),
+    ("D4|SK", TexasHoldemHandType.HighCard, [13, 4, None, None, None]),
+    ("D4|S4|C4|H4", TexasHoldemHandType.Quads, [4, None]),
+])
+def test_when_evaluate_cards_then_correct_rank_returned(get_test_cards, cards, hand_type, tiebreakers):
+    actual = evaluate_cards(get_test_cards(cards))
+
+    assert unpack_rank(actual) == (hand_type, tiebreakers)
+
+
+@mark.parametrize("cards", [
+    "D4|D5|D7|H6|D6|C3|D3",
+    "D4|D5|C5|H6|DA|H5|S6",
+    "D4|H5|S4|H3|C9|SK",
+    "D4|SK",
+])
+def test_when_evaluate_card_ints_then_same_rank_as_card_objects_returned(get_test_cards, cards):
+    cards = get_test_cards(cards)
+
+    assert evaluate_card_ints([card.to_int() for card in cards]) == evaluate_cards(cards)
+
+
+@mark.parametrize("cards", ["", "D2|D3|D4|D5|D6|D7|D8|D9"])
+def test_when_evaluate_cards_and_bad_number_of_cards_then_raise_error(get_test_cards, cards):
+    cards = get_test_cards(cards) if cards else []
+
+    with raises(InvalidHandError, match="Lookup evaluator requires between 1 and 7 cards"):
+        evaluate_cards(cards)
+
+
+@mark.parametrize("cards, hand_type, tiebreakers, expected", [
+    ("DA|D2|D3|D4|D5|H5|S5", TexasHoldemHandType.StraightFlush, [5], "DA|D2|D3|D4|D5"),
+    ("D9|SK|S9|C9|HK|H9|C7", TexasHoldemHandType.Quads, [9, 13], "D9|S9|C9|H9|SK"),
+    ("D4|H5|D7|H6|DK|D3|DQ", TexasHoldemHandType.Flush, [13, 12, 7, 4, 3], "DK|DQ|D7|D4|D3"),
+    ("D4|H5|S4|H3|C3|SK", TexasHoldemHandType.TwoPair, [4, 3, 13], "D4|S4|H3|C3|SK"),
+])
+def test_when_select_hand_cards_then_correct_cards_returned(get_test_cards, cards, hand_type, tiebreakers, expected):
+    actual = select_hand_cards(get_test_cards(cards), hand_type, tiebreakers)
+
+    assert actual == get_test_cards(expected)
+
+
+@mark.parametrize("num_cards", [7, 6, 5, 3, 1])
+def test_when_evaluate_card_int_array_then_same_ranks_as_evaluate_card_ints_returned(num_cards):
+    numpy = importorskip("numpy")
+    generator = numpy.random.default_rng(7)
+    card_ints = numpy.argsort(generator.random((500, 52)), axis=1)[:, :num_cards]
+
+    ranks, hand_types = evaluate_card_int_array(card_ints)
+
+    assert ranks.shape == (500,)
+    assert hand_types.shape == (500,)
+    assert ranks.tolist() == [evaluate_card_ints(row) for row in card_ints.tolist()]
+    assert hand_types.tolist() == [rank >> 20 for rank in ranks.tolist()]
+
+
+def test_when_evaluate_card_int_array_then_hand_type_codes_match_hand_strengths(get_test_cards):
+    numpy = importorskip("numpy")
+    hands = ["D4|D5|D7|D6|D3|C3|H3", "D4|D5|C5|H6|DA|H5|S5", "D4|H5|D7|H6|DK|D3|DQ", "D4|H5|SJ|H3|C9|SK|C2"]
+    card_ints = numpy.array([[card.to_int() for card in get_test_cards(hand)] for hand in hands])
+
+    ranks, hand_types = evaluate_card_int_array(card_ints)
+
+    assert hand_types.tolist() == [9, 8, 6, 1]
+    assert ranks.tolist() == [evaluate_cards(get_test_cards(hand)) for hand in hands]
+
+
+@mark.parametrize("card_ints, error, message", [
+    ([[1, 2, 3, 4, 5, 6, 7, 8]], InvalidHandError, "Lookup evaluator requires an"),
+    ([1, 2, 3, 4, 5], InvalidHandError, "Lookup evaluator requires an"),
+    ([[1, 2, 3, 4, 52]], ValueError, "Card integers must be integers between 0 and 51"),
+    ([[1, 2, 3, 4, -1]], ValueError, "Card integers must be integers between 0 and 51"),
+    ([[1.0, 2.0]], ValueError, "Card integers must be integers between 0 and 51"),
+])
+def test_when_evaluate_card_int_array_and_bad_array_then_raise_error(card_ints, error, message):
+    numpy = importorskip("numpy")
+
+    with raises(error, match=message):
+        evaluate_card_int_array(numpy.array(card_ints))
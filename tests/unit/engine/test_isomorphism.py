@@ -0,0 +1,142 @@
+from itertools import permutations
+
+from pytest import mark
+
+from pypoker.constructs import Card, Hand, AnyCard, AnySuitCard, AnyValueCard
+from pypoker.constants import GameTypes, TexasHoldemHandType
+from pypoker.engine.cache import CacheStats, DEFAULT_MAX_ENTRIES
+from pypoker.engine.isomorphism import (
+    canonicalise_suits,
+    invert_suit_permutation,
+    permute_card_ints,
+    permute_cards,
+    permute_hands,
+    IsomorphicResultCache,
+    get_shared_result_cache,
+)
+
+
+def _get_card_int_groups(get_test_cards, card_groups):
+    return [[card.to_int() for card in get_test_cards(cards)] if cards else [] for cards in card_groups]
+
+
+@mark.parametrize("first_groups, second_groups", [
+    (["HA|HK", "H7|H8|C2", ""], ["SA|SK", "S7|S8|D2", ""]),
+    (["DA|CK", "D7|C8|S2", "H3"], ["HA|SK", "H7|S8|C2", "D3"]),
+    (["C9|D9", "", ""], ["S9|H9", "", ""]),
+])
+def test_when_canonicalise_suits_of_isomorphic_situations_then_same_key_returned(get_test_cards, first_groups, second_groups):
+    first_key, _ = canonicalise_suits(_get_card_int_groups(get_test_cards, first_groups))
+    second_key, _ = canonicalise_suits(_get_card_int_groups(get_test_cards, second_groups))
+
+    assert first_key == second_key
+
+
+@mark.parametrize("first_groups, second_groups", [
+    (["HA|HK", "H7|H8|C2", ""], ["HA|HK", "H7|C8|C2", ""]),
+    (["DA|CK", "D7|C8|S2", ""], ["DA|CK", "D7|C8|S2", "H3"]),
+    (["HA|HK", "H7", ""], ["H7|HK", "HA", ""]),
+])
+def test_when_canonicalise_suits_of_different_situations_then_different_key_returned(get_test_cards, first_groups, second_groups):
+    first_key, _ = canonicalise_suits(_get_card_int_groups(get_test_cards, first_groups))
+    second_key, _ = canonicalise_suits(_get_card_int_groups(get_test_cards, second_groups))
+
+    assert first_key != second_key
+
+
+def test_when_canonicalise_suits_then_permutation_maps_to_canonical_situation(get_test_cards):
+    card_int_groups = _get_card_int_groups(get_test_cards, ["DA|CK", "D7|C8|S2", "H3"])
+    key, permutation = canonicalise_suits(card_int_groups)
+
+    canonical_groups = [permute_card_ints(card_ints, permutation) for card_ints in card_int_groups]
+
+    assert canonicalise_suits(canonical_groups) == (key, (0, 1, 2, 3))
+    for suit_permutation in permutations(range(4)):
+        relabelled_groups = [permute_card_ints(card_ints, suit_permutation) for card_ints in card_int_groups]
+        assert canonicalise_suits(relabelled_groups)[0] == key
+
+
+@mark.parametrize("permutation, expected", [
+    ((0, 1, 2, 3), (0, 1, 2, 3)),
+    ((1, 2, 3, 0), (3, 0, 1, 2)),
+    ((3, 2, 0, 1), (2, 3, 1, 0)),
+])
+def test_when_invert_suit_permutation_then_inverse_returned(permutation, expected):
+    assert invert_suit_permutation(permutation) == expected
+
+
+def test_when_permute_cards_then_suits_relabelled():
+    cards = [Card("CA"), Card("H7"), AnyValueCard("D"), AnySuitCard("9"), AnyCard("")]
+
+    actual = permute_cards(cards, (3, 2, 0, 1))
+
+    assert actual == [Card("SA"), Card("C7"), AnyValueCard("H"), AnySuitCard("9"), AnyCard("")]
+
+
+def test_when_permute_hands_then_hand_cards_relabelled(get_test_cards):
+    hand = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("CA|DA|H9|H7|H4"), [14, 9, 7, 4])
+
+    actual = permute_hands([hand], (1, 0, 3, 2))
+
+    assert actual[0] == hand
+    assert actual[0].cards == get_test_cards("DA|CA|S9|S7|S4")
+
+
+def test_when_get_or_compute_then_result_found_once_per_isomorphic_situation(get_test_cards):
+    cache = IsomorphicResultCache()
+    computed = []
+
+    def compute(card_int_groups):
+        computed.append(card_int_groups)
+        return [[Card.from_int(card_ints[0])] for card_ints in card_int_groups]
+
+    def unpermute(result, permutation):
+        return [permute_cards(cards, permutation) for cards in result]
+
+    first = cache.get_or_compute("query", [get_test_cards("HA|HK"), get_test_cards("H7|C2")], compute, unpermute)
+    second = cache.get_or_compute("query", [get_test_cards("SA|SK"), get_test_cards("S7|D2")], compute, unpermute)
+
+    assert len(computed) == 1
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert first == [get_test_cards("HK"), get_test_cards("C2")]
+    assert second == [get_test_cards("SK"), get_test_cards("D2")]
+
+
+def test_when_get_or_compute_without_unpermute_then_copy_of_result_returned(get_test_cards):
+    cache = IsomorphicResultCache()
+
+    first = cache.get_or_compute("query", [get_test_cards("HA|HK")], lambda card_int_groups: {"value": 1})
+    first["value"] = 2
+    second = cache.get_or_compute("query", [get_test_cards("SA|SK")], lambda card_int_groups: {"value": 3})
+
+    assert second == {"value": 1}
+
+
+def test_when_clear_then_results_and_counts_removed(get_test_cards):
+    cache = IsomorphicResultCache()
+    cache.get_or_compute("query", [get_test_cards("HA|HK")], lambda card_int_groups: 1)
+    cache.get_or_compute("query", [get_test_cards("HA|HK")], lambda card_int_groups: 1)
+
+    cache.clear()
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_when_cache_over_max_entries_then_least_recently_used_evicted(get_test_cards):
+    cache = IsomorphicResultCache(max_entries=2)
+    situations = ["HA|HK", "HQ|HJ", "HT|H9"]
+
+    for cards in situations:
+        cache.get_or_compute(cards, [get_test_cards(cards)], lambda card_int_groups: 1)
+    cache.get_or_compute("HA|HK", [get_test_cards("HA|HK")], lambda card_int_groups: 1)
+
+    assert len(cache) == 2
+    assert cache.get_stats() == CacheStats(hits=0, misses=4, evictions=2, entries=2, size_bytes=cache.get_stats().size_bytes)
+
+
+def test_when_cache_default_limits_then_cache_bounded():
+    assert IsomorphicResultCache().store.max_entries == DEFAULT_MAX_ENTRIES
+
+
+def test_when_get_shared_result_cache_then_same_cache_returned():
+    assert get_shared_result_cache() is get_shared_result_cache()
@@ -0,0 +1,116 @@
+import re
+
+from mock import patch
+from pytest import fixture, mark, raises
+
+from pypoker.constants import TexasHoldemHandType, OutsCalculationMethod
+from pypoker.constructs import Card, OutsCount
+from pypoker.engine.outs_tracker import OutsTracker
+from pypoker.engine.texas_holdem import TexasHoldemPokerEngine
+from pypoker.exceptions import OutsError
+from pypoker.player.human import HumanPlayer
+
+
+@fixture
+def engine():
+    return TexasHoldemPokerEngine()
+
+
+@fixture
+def player(get_test_cards):
+    return HumanPlayer("Matt", hole_cards=get_test_cards("HA|H9"))
+
+
+@fixture
+def tracker(player, get_test_cards, get_deck_minus_set, engine):
+    board = get_test_cards("H7|H8|C9")
+    return OutsTracker(player, board, get_deck_minus_set(player.hole_cards + board), engine)
+
+
+def _sorted_outs(outs):
+    return sorted(sorted(card.name for card in out) for out in outs)
+
+
+def test_when_outs_tracker_built_then_cards_tracked(tracker, get_test_cards):
+    assert tracker.current_cards == get_test_cards("HA|H9|H7|H8|C9")
+    assert len(tracker.possible_cards) == 47
+    assert tracker.draws_remaining == 2
+    assert tracker.current_counts.by_suit == [1, 0, 4, 0]
+    assert tracker.possible_counts.by_suit == [12, 13, 9, 13]
+
+
+@mark.parametrize("hand_type", [hand_type for hand_type in TexasHoldemHandType if hand_type != TexasHoldemHandType.HighCard])
+@mark.parametrize("method", list(OutsCalculationMethod))
+def test_when_outs_tracker_cards_change_then_outs_match_engine(engine, player, tracker, get_test_cards, hand_type, method):
+    for update, card in [(None, None), ("remove", "D9"), ("add", "S7"), ("remove", "HK"), ("add", "HT")]:
+        if update == "remove":
+            tracker.remove_possible_card(Card(card))
+        elif update == "add":
+            tracker.add_board_card(Card(card))
+
+        expected = engine.find_player_outs(player, hand_type, tracker.board, tracker.possible_cards, method=method)
+        expected_count = engine.find_player_outs(player, hand_type, tracker.board, tracker.possible_cards, count_only=True)
+
+        assert _sorted_outs(tracker.get_outs(hand_type, method)) == _sorted_outs(expected)
+        assert tracker.count_outs(hand_type) == expected_count
+
+
+def test_when_outs_tracker_remove_possible_card_then_outs_needing_card_removed(tracker):
+    flush_outs = tracker.get_outs(TexasHoldemHandType.Flush)
+
+    tracker.remove_possible_card(Card("HK"))
+
+    assert tracker.get_outs(TexasHoldemHandType.Flush) == [out for out in flush_outs if Card("HK") not in out]
+    assert tracker.count_outs(TexasHoldemHandType.Flush) == OutsCount(1035 - 703, 1035)
+
+
+def test_when_outs_tracker_add_board_card_then_explicit_full_outs_carried_to_next_street(tracker):
+    flush_outs = tracker.get_outs(TexasHoldemHandType.Flush, OutsCalculationMethod.ExplicitFull)
+
+    tracker.add_board_card(Card("HK"))
+    with patch.object(tracker.engine, "find_outs") as find_outs:
+        actual = tracker.get_outs(TexasHoldemHandType.Flush, OutsCalculationMethod.ExplicitFull)
+
+    find_outs.assert_not_called()
+    assert actual == [[card for card in out if card != Card("HK")] for out in flush_outs if Card("HK") in out]
+
+
+def test_when_outs_tracker_board_card_not_possible_then_possible_cards_unchanged(tracker):
+    tracker.remove_possible_card(Card("D2"))
+
+    tracker.add_board_card(Card("D2"))
+
+    assert len(tracker.possible_cards) == 46
+    assert tracker.draws_remaining == 1
+
+
+def test_when_outs_tracker_get_outs_then_stored_outs_cannot_be_changed(tracker):
+    tracker.get_outs(TexasHoldemHandType.Straight).clear()
+
+    assert tracker.get_outs(TexasHoldemHandType.Straight) != []
+
+
+@mark.parametrize("update, card, message", [
+    ("add", "H7", "Card 'Seven of Hearts' is already held by the player or board"),
+    ("add", "HA", "Card 'Ace of Hearts' is already held by the player or board"),
+    ("remove", "H7", "Card 'Seven of Hearts' is not one of the possible cards"),
+])
+def test_when_outs_tracker_bad_card_then_raise_error(tracker, update, card, message):
+    with raises(OutsError, match=re.escape(message)):
+        if update == "add":
+            tracker.add_board_card(Card(card))
+        else:
+            tracker.remove_possible_card(Card(card))
+
+
+def test_when_outs_tracker_board_full_then_raise_error(tracker):
+    tracker.add_board_card(Card("S2"))
+    tracker.add_board_card(Card("S3"))
+
+    with raises(OutsError, match="The board cannot hold more than 5 cards"):
+        tracker.add_board_card(Card("S4"))
+
+
+def test_when_outs_tracker_high_card_outs_then_raise_error(tracker):
+    with raises(OutsError, match="Cannot find outs for hand type HighCard"):
+        tracker.count_outs(TexasHoldemHandType.HighCard)
@@ -0,0 +1,94 @@
+import re
+from collections import Counter
+from itertools import combinations
+
+from pytest import mark, raises, importorskip
+
+from pypoker.engine.preflop import (
+    get_starting_hand_class,
+    get_starting_hand_class_name,
+    get_preflop_equity_table,
+    generate_preflop_equity_table,
+    PreflopEquityTable,
+    PREFLOP_TABLE_MAGIC,
+    PREFLOP_TABLE_HEADER,
+)
+from pypoker.exceptions import EquityError
+
+
+@mark.parametrize("hole_cards, expected_class, expected_name", [
+    ("HA|SA", 0, "AA"),
+    ("SK|SA", 1, "AKs"),
+    ("HA|DK", 13, "AKo"),
+    ("C2|C3", 155, "32s"),
+    ("D7|C2", 12 * 13 + 7, "72o"),
+    ("H2|S2", 168, "22"),
+])
+def test_when_get_starting_hand_class_then_correct_class_returned(get_test_cards, hole_cards, expected_class, expected_name):
+    hole_card_ints = [card.to_int() for card in get_test_cards(hole_cards)]
+
+    assert get_starting_hand_class(hole_card_ints) == expected_class
+    assert get_starting_hand_class(hole_card_ints[::-1]) == expected_class
+    assert get_starting_hand_class_name(expected_class) == expected_name
+
+
+def test_when_get_starting_hand_class_of_every_combo_then_169_classes_found():
+    class_sizes = Counter(get_starting_hand_class(combo) for combo in combinations(range(52), 2))
+
+    assert len(class_sizes) == 169
+    assert Counter(class_sizes.values()) == {6: 13, 4: 78, 12: 78}
+
+
+def test_when_generate_preflop_equity_table_then_table_can_be_read(tmp_path):
+    importorskip("numpy")
+    path = str(tmp_path / "preflop.bin")
+
+    generate_preflop_equity_table(path, num_deals=12, num_boards=2, seed=1)
+
+    with PreflopEquityTable(path) as table:
+        assert (table.num_classes, table.max_opponents, table.num_deals, table.num_boards) == (169, 9, 12, 2)
+        assert all(0 <= table.equity_vs_opponents(hand_class, 9) <= 1 for hand_class in range(169))
+        assert abs(table.equity_vs_class(0, 1) + table.equity_vs_class(1, 0) - 1) < 1e-6
+
+
+def test_when_preflop_equity_table_file_invalid_then_raise_error(tmp_path):
+    path = tmp_path / "preflop.bin"
+    path.write_bytes(PREFLOP_TABLE_HEADER.pack(PREFLOP_TABLE_MAGIC, 169, 9, 1, 1))
+
+    with raises(EquityError, match="is not a valid preflop equity table"):
+        PreflopEquityTable(str(path))
+
+
+@mark.parametrize("hand_class, opponents, message", [
+    (169, 1, "Starting hand class must be between 0 and 168"),
+    (-1, 1, "Starting hand class must be between 0 and 168"),
+    (0, 0, "Number of opponents must be between 1 and 9"),
+    (0, 10, "Number of opponents must be between 1 and 9"),
+])
+def test_when_equity_vs_opponents_and_bad_args_then_raise_error(hand_class, opponents, message):
+    with raises(EquityError, match=re.escape(message)):
+        get_preflop_equity_table().equity_vs_opponents(hand_class, opponents)
+
+
+@mark.parametrize("hand_class, opponents, expected", [
+    (0, 1, 0.852),
+    (0, 9, 0.312),
+    (12 * 13 + 7, 1, 0.346),
+    (1, 1, 0.670),
+])
+def test_when_equity_vs_opponents_then_bundled_table_equity_returned(hand_class, opponents, expected):
+    assert abs(get_preflop_equity_table().equity_vs_opponents(hand_class, opponents) - expected) < 0.01
+
+
+@mark.parametrize("hand_class, opponent_class, expected", [
+    (0, 14, 0.820),
+    (1, 28, 0.460),
+    (168, 13, 0.525),
+])
+def test_when_equity_vs_class_then_bundled_table_equity_returned(hand_class, opponent_class, expected):
+    table = get_preflop_equity_table()
+
+    result = table.equity_vs_class(hand_class, opponent_class)
+
+    assert abs(result - expected) < 0.01
+    assert abs(table.equity_vs_class(opponent_class, hand_class) + result - 1) < 1e-6
@@ -1,12 +1,16 @@
 import re
+from itertools import combinations, product
+from math import comb
+from typing import Iterator
 
-from pytest import fixture, mark, raises
+from pytest import fixture, mark, raises, importorskip
 from mock import patch
 
-from pypoker.constants import GameTypes, TexasHoldemHandType, OutsCalculationMethod
-from pypoker.constructs import Hand, Deck, Card
+from pypoker.constants import GameTypes, TexasHoldemHandType, OutsCalculationMethod, EquityCalculationMethod
+from pypoker.constructs import Hand, Deck, Card, AnyCard, AnySuitCard, AnyValueCard, SpecialCard, OutsCount, CardSet
+from pypoker.engine.isomorphism import IsomorphicResultCache
 from pypoker.engine.texas_holdem import TexasHoldemPokerEngine
-from pypoker.exceptions import RankingError, OutsError
+from pypoker.exceptions import RankingError, OutsError, EquityError
 from pypoker.player.human import HumanPlayer
 
 
@@ -65,6 +69,209 @@ def test_when_find_player_best_hand_and_multiple_hands_with_identical_tiebreaker
     assert result[1].cards == get_test_cards("D9|S9|C9|H9|HK")
 
 
+@mark.parametrize("hole_cards, board_cards, expected_hand_type, expected_tiebreakers",[
+    ("D4|D5", "D7|H6|D6|C3|D3", TexasHoldemHandType.StraightFlush, [7]),
+    ("D4|D5", "C5|H6|DA|H5|S5", TexasHoldemHandType.Quads, [5, 14]),
+    ("D4|D5", "C5|H6|DA|H5|S6", TexasHoldemHandType.FullHouse, [5, 6]),
+    ("D4|H5", "D7|H6|DK|D3|DQ", TexasHoldemHandType.Flush, [13, 12, 7, 4, 3]),
+    ("D4|H5", "S7|H6|C3|SK", TexasHoldemHandType.Straight, [7]),
+    ("D4|H5", "S4|H4|C3|SK", TexasHoldemHandType.Trips, [4, 13, 5]),
+    ("D4|H5", "S4|H3|C3|SK", TexasHoldemHandType.TwoPair, [4, 3, 13]),
+    ("D4|H5", "S4|H3|C9|SK", TexasHoldemHandType.Pair, [4, 13, 9, 5]),
+    ("D4|H5", "SJ|H3|C9|SK", TexasHoldemHandType.HighCard, [13, 11, 9, 5, 4]),
+    ("D4|H5", "", TexasHoldemHandType.HighCard, [5, 4, None, None, None]),
+])
+def test_when_find_player_best_hand_and_use_lookup_tables_then_matching_hand_returned(
+        engine, get_test_cards, hole_cards, board_cards, expected_hand_type, expected_tiebreakers
+):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+    board = get_test_cards(board_cards) if board_cards else []
+
+    result = engine.find_player_best_hand(player, board, use_lookup_tables=True)
+    expected = engine.find_player_best_hand(player, board)
+
+    assert isinstance(result, list)
+    assert len(result) == 1
+    assert result[0].type == expected_hand_type
+    assert result[0].tiebreakers == expected_tiebreakers
+    assert result[0] == expected[0]
+    assert sorted(card.name for card in result[0].cards) in [
+        sorted(card.name for card in hand.cards) for hand in expected
+    ]
+
+
+def test_when_find_best_hand_ranks_then_ranks_match_best_hand_keys(engine, get_test_cards):
+    numpy = importorskip("numpy")
+    hands = ["D4|D5|D7|H6|D6|C3|D3", "D4|H5|S4|H4|C3|SK|C9", "D4|H5|SJ|H3|C9|SK|C2"]
+    card_ints = numpy.array([[card.to_int() for card in get_test_cards(hand)] for hand in hands])
+
+    ranks, hand_types = engine.find_best_hand_ranks(card_ints)
+
+    for hand, rank, hand_type in zip(hands, ranks.tolist(), hand_types.tolist()):
+        cards = get_test_cards(hand)
+        best_hand = engine.find_player_best_hand(HumanPlayer("Matt", hole_cards=cards[:2]), cards[2:])[0]
+        assert rank == best_hand.key
+        assert hand_type == best_hand.strength
+
+
+def test_when_calculate_equity_then_counts_match_ranked_best_hands(engine, get_test_cards):
+    players = [
+        HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA")),
+        HumanPlayer("Greg", hole_cards=get_test_cards("D9|DT")),
+        HumanPlayer("Sarah", hole_cards=get_test_cards("C7|H7")),
+    ]
+    board = get_test_cards("DJ|D2|S7|CQ")
+    dead_cards = get_test_cards("S3|H4")
+
+    result = engine.calculate_equity(players, board, dead_cards)
+
+    expected = {player.name: [0, 0, 0] for player in players}
+    used_cards = board + dead_cards + [card for player in players for card in player.hole_cards]
+    for card in [card for card in Deck().cards_available if card not in used_cards]:
+        for player in players:
+            player.hand = engine.find_player_best_hand(player, board + [card])[0]
+        ranked = engine.rank_player_hands(players)
+        for player in players:
+            if player not in ranked[1]:
+                expected[player.name][2] += 1
+            elif len(ranked[1]) == 1:
+                expected[player.name][0] += 1
+            else:
+                expected[player.name][1] += 1
+
+    assert [[equity.wins, equity.ties, equity.losses] for equity in result] == [
+        expected[player.name] for player in players
+    ]
+    assert all(equity.total == 40 for equity in result)
+
+
+def test_when_calculate_equity_and_monte_carlo_then_sampled_equity_returned(engine, get_test_cards):
+    players = [
+        HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA")),
+        HumanPlayer("Greg", hole_cards=get_test_cards("D9|DT")),
+    ]
+    board = get_test_cards("DJ|D2|S7")
+
+    result = engine.calculate_equity(
+        players, board, method=EquityCalculationMethod.MonteCarlo, seed=3, max_samples=2000
+    )
+    repeat = engine.calculate_equity(
+        players, board, method=EquityCalculationMethod.MonteCarlo, seed=3, max_samples=2000
+    )
+    exact = engine.calculate_equity(players, board)
+
+    assert result == repeat
+    assert all(equity.total == 2000 for equity in result)
+    for sampled_equity, exact_equity in zip(result, exact):
+        lower, upper = sampled_equity.confidence_interval(0.999)
+        assert lower <= exact_equity.equity <= upper
+
+
+@mark.parametrize("players, board, dead_cards, message", [
+    ([("Matt", "HA|SA"), "Greg"], "", "", "All values of players list must be of BasePlayer Type"),
+    ([("Matt", "HA|SA")], "", "", "At least two players are required to calculate equity"),
+    ([("Matt", "HA|SA"), ("Greg", None)], "", "", "All players must have two hole cards set to calculate equity."),
+    ([("Matt", "HA|SA"), ("Greg", "D2")], "", "", "All players must have two hole cards set to calculate equity."),
+    ([("Matt", "HA|SA"), ("Greg", "D2|D3")], "C2|C3|C4|C5|C6|C7", "", "The board cannot hold more than 5 cards"),
+    ([("Matt", "HA|SA"), ("Greg", "D2|SA")], "", "", "Each card can only be used once to calculate equity"),
+    ([("Matt", "HA|SA"), ("Greg", "D2|D3")], "C2|D3|C4", "", "Each card can only be used once to calculate equity"),
+    ([("Matt", "HA|SA"), ("Greg", "D2|D3")], "C2|C3|C4", "C4", "Each card can only be used once to calculate equity"),
+])
+def test_when_calculate_equity_and_bad_args_then_raise_error(engine, get_test_cards, players, board, dead_cards, message):
+    players = [
+        player if isinstance(player, str) else HumanPlayer(
+            player[0], hole_cards=get_test_cards(player[1]) if player[1] else None
+        )
+        for player in players
+    ]
+    board = get_test_cards(board) if board else []
+    dead_cards = get_test_cards(dead_cards) if dead_cards else []
+
+    with raises(EquityError, match=re.escape(message)):
+        engine.calculate_equity(players, board, dead_cards)
+
+
+def test_when_calculate_range_equity_then_weighted_equity_returned(engine, get_test_cards):
+    importorskip("numpy")
+    ranges = [
+        [(get_test_cards("HA|SA"), 1), (get_test_cards("D9|DT"), 0.5)],
+        [(get_test_cards("HK|SK"), 1), (get_test_cards("CA|DA"), 2)],
+    ]
+    board = get_test_cards("DJ|D2|S7")
+    dead_cards = get_test_cards("C3")
+
+    result = engine.calculate_range_equity(ranges, board, dead_cards)
+
+    expected_wins = 0
+    for cards_a, weight_a in ranges[0]:
+        for cards_b, weight_b in ranges[1]:
+            players = [HumanPlayer("Matt", hole_cards=cards_a), HumanPlayer("Greg", hole_cards=cards_b)]
+            if set(cards_a) & set(cards_b):
+                continue
+            expected_wins += weight_a * weight_b * engine.calculate_equity(players, board, dead_cards)[0].wins
+    assert result[0].wins == expected_wins
+    assert result[1].losses == expected_wins
+
+
+@mark.parametrize("ranges, board, dead_cards, message", [
+    (["HA|SA"], "", "", "Exactly two ranges are required to calculate equity"),
+    (["HA|SA", "D2", ], "", "", "Each range combo must hold two different hole cards"),
+    (["HA|SA", "D2|D2", ], "", "", "Each range combo must hold two different hole cards"),
+    (["HA|SA", "D2|D3"], "C2|C3|C4|C5|C6|C7", "", "The board cannot hold more than 5 cards"),
+    (["HA|SA", "D2|D3"], "C2|C3|C4", "C4", "Each card can only be used once to calculate equity"),
+])
+def test_when_calculate_range_equity_and_bad_args_then_raise_error(engine, get_test_cards, ranges, board, dead_cards, message):
+    ranges = [[(get_test_cards(cards), 1)] for cards in ranges]
+    board = get_test_cards(board) if board else []
+    dead_cards = get_test_cards(dead_cards) if dead_cards else []
+
+    with raises(EquityError, match=re.escape(message)):
+        engine.calculate_range_equity(ranges, board, dead_cards)
+
+
+def test_when_calculate_range_equity_and_negative_weight_then_raise_error(engine, get_test_cards):
+    ranges = [[(get_test_cards("HA|SA"), 1)], [(get_test_cards("D2|D3"), -1)]]
+
+    with raises(EquityError, match=re.escape("Range combo weights cannot be negative")):
+        engine.calculate_range_equity(ranges, [])
+
+
+@mark.parametrize("hole_cards, opponents, expected", [
+    ("HA|SA", 1, 0.852),
+    ("DA|CA", 9, 0.312),
+    ("D7|C2", 1, 0.346),
+])
+def test_when_find_preflop_equity_then_table_equity_returned(engine, get_test_cards, hole_cards, opponents, expected):
+    result = engine.find_preflop_equity(get_test_cards(hole_cards), opponents)
+
+    assert abs(result - expected) < 0.01
+
+
+def test_when_find_preflop_matchup_equity_then_close_to_exact_equity(engine, get_test_cards):
+    players = [
+        HumanPlayer("Matt", hole_cards=get_test_cards("HA|SA")),
+        HumanPlayer("Greg", hole_cards=get_test_cards("DK|CK")),
+    ]
+
+    result = engine.find_preflop_matchup_equity(players[0].hole_cards, players[1].hole_cards)
+    repeat = engine.find_preflop_matchup_equity(players[1].hole_cards, players[0].hole_cards)
+
+    # the table holds the average of every AA vs KK combo, so it only approximates these exact suits
+    assert abs(result - engine.calculate_equity(players, [])[0].equity) < 0.02
+    assert abs(result + repeat - 1) < 1e-6
+
+
+@mark.parametrize("hole_cards, opponents, message", [
+    ("HA", 1, "Preflop equity requires two different hole cards"),
+    ("HA|HA", 1, "Preflop equity requires two different hole cards"),
+    ("HA|SA", 0, "Number of opponents must be between 1 and 9"),
+    ("HA|SA", 10, "Number of opponents must be between 1 and 9"),
+])
+def test_when_find_preflop_equity_and_bad_args_then_raise_error(engine, get_test_cards, hole_cards, opponents, message):
+    with raises(EquityError, match=re.escape(message)):
+        engine.find_preflop_equity(get_test_cards(hole_cards), opponents)
+
+
 def test_when_rank_player_hands_and_not_all_players_are_player_objects_then_raise_error(engine):
     player_a = HumanPlayer("Matt")
     player_b = "Greg"
@@ -213,7 +420,7 @@ def test_when_find_player_outs_and_straight_flush_then_correct_calls_made(engine
     with patch.object(engine, "find_outs_straight_flush") as find_outs_straight_flush:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_straight_flush.assert_called_once_with(get_test_cards("SK|SQ|S7|ST|C2"), possible_cards, 2)
+    find_outs_straight_flush.assert_called_once_with(get_test_cards("SK|SQ|S7|ST|C2"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_straight_flush()
 
 
@@ -226,7 +433,7 @@ def test_when_find_player_outs_and_quads_then_correct_calls_made(engine, get_tes
     with patch.object(engine, "find_outs_quads") as find_outs_quads:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_quads.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_quads.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_quads()
 
 
@@ -239,7 +446,7 @@ def test_when_find_player_outs_and_full_house_then_correct_calls_made(engine, ge
     with patch.object(engine, "find_outs_full_house") as find_outs_full_house:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_full_house.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_full_house.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_full_house()
 
 
@@ -252,7 +459,7 @@ def test_when_find_player_outs_and_flush_then_correct_calls_made(engine, get_tes
     with patch.object(engine, "find_outs_flush") as find_outs_flush:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_flush.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_flush.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_flush()
 
 
@@ -265,7 +472,7 @@ def test_when_find_player_outs_and_straight_then_correct_calls_made(engine, get_
     with patch.object(engine, "find_outs_straight") as find_outs_straight:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_straight.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_straight.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_straight()
 
 
@@ -278,7 +485,7 @@ def test_when_find_player_outs_and_trips_then_correct_calls_made(engine, get_tes
     with patch.object(engine, "find_outs_trips") as find_outs_trips:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_trips.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_trips.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_trips()
 
 
@@ -291,7 +498,7 @@ def test_when_find_player_outs_and_two_pair_then_correct_calls_made(engine, get_
     with patch.object(engine, "find_outs_two_pair") as find_outs_two_pair:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_two_pair.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_two_pair.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_two_pair()
     
     
@@ -304,10 +511,116 @@ def test_when_find_player_outs_and_pair_then_correct_calls_made(engine, get_test
     with patch.object(engine, "find_outs_pair") as find_outs_pair:
         result = engine.find_player_outs(player, hand_type, board, possible_cards)
 
-    find_outs_pair.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    find_outs_pair.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2, OutsCalculationMethod.ExplicitPartial)
     assert result == find_outs_pair()
 
 
+def test_when_find_player_outs_and_count_only_then_correct_calls_made(engine, get_test_cards, get_deck_minus_set):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("SK|CK"))
+    hand_type = TexasHoldemHandType.Trips
+    board = get_test_cards("S7|ST|DK")
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    with patch.object(engine, "count_outs_trips", return_value=10) as count_outs_trips:
+        result = engine.find_player_outs(player, hand_type, board, possible_cards, count_only=True)
+
+    count_outs_trips.assert_called_once_with(get_test_cards("SK|CK|S7|ST|DK"), possible_cards, 2)
+    assert result == OutsCount(10, 1081)
+
+
+@mark.parametrize("hole_cards, board, possible_cards", [
+    ("SK|SQ", "S7|ST|C2", "SJ|S9|SA|S2|H9|DJ|CQ|HA|D3|C7|H8|D5"),
+    ("SK|CK", "S7|ST|DK", "HK|S2|H7|D7|C7|HT|DT|CT|H5|D5|C4"),
+    ("D4|H5", "C6|S7|DK", "H3|C3|D8|H8|DA|SA|C2|H2|H6|D6|HK|CK"),
+    ("HA|H2", "H3|H9|SJ|C4", "H4|H5|D5|S5|HT|HK|CA|DA|C2|S3|C9"),
+    ("D2|D3", "", "D4|D5|D6|DA|C4|H5|S6|C2|H3|SA"),
+    ("HJ|SJ", "DJ|CJ|H2|H3|H4", ""),
+])
+def test_when_find_player_outs_and_count_only_then_count_matches_outs(engine, get_test_cards, hole_cards, board, possible_cards):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+    board = get_test_cards(board) if board else []
+    possible_cards = get_test_cards(possible_cards) if possible_cards else []
+    draws = list(combinations(possible_cards, 5 - len(board)))
+
+    for hand_type in [hand_type for hand_type in TexasHoldemHandType if hand_type != TexasHoldemHandType.HighCard]:
+        outs = engine.find_player_outs(player, hand_type, board, possible_cards)
+        required_cards = [set(card for card in out if not isinstance(card, AnyCard)) for out in outs]
+        expected_hits = sum(1 for draw in draws if any(cards <= set(draw) for cards in required_cards))
+
+        result = engine.find_player_outs(player, hand_type, board, possible_cards, count_only=True)
+
+        assert result == OutsCount(expected_hits, len(draws))
+
+
+def _get_out_draws(outs, possible_cards):
+    """test helper to find every explicit set of cards matched by a list of outs"""
+    draws = set()
+    for out in outs:
+        candidates = [card.to_explicit(possible_cards) if isinstance(card, SpecialCard) else [card] for card in out]
+        draws.update(frozenset(cards) for cards in product(*candidates) if len(set(cards)) == len(cards))
+    return draws
+
+
+@mark.parametrize("hole_cards, board", [
+    ("SK|SQ", "S7|ST|C2"),
+    ("SK|CK", "S7|ST|DK"),
+    ("D4|H5", "C6|S7|DK|D8"),
+    ("HA|H2", "H3|H9|SJ|C4"),
+])
+def test_when_find_player_outs_and_each_method_then_same_draws_matched(engine, get_test_cards, get_deck_minus_set, hole_cards, board):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+    board = get_test_cards(board)
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    for hand_type in [hand_type for hand_type in TexasHoldemHandType if hand_type != TexasHoldemHandType.HighCard]:
+        partial_outs = engine.find_player_outs(player, hand_type, board, possible_cards)
+        implicit_outs = engine.find_player_outs(
+            player, hand_type, board, possible_cards, method=OutsCalculationMethod.Implicit
+        )
+        full_outs = engine.find_player_outs(
+            player, hand_type, board, possible_cards, method=OutsCalculationMethod.ExplicitFull
+        )
+
+        assert len(implicit_outs) <= len(partial_outs)
+        assert all(not isinstance(card, SpecialCard) for out in full_outs for card in out)
+        assert len(set(frozenset(out) for out in full_outs)) == len(full_outs)
+        assert _get_out_draws(implicit_outs, possible_cards) == _get_out_draws(partial_outs, possible_cards)
+        assert set(frozenset(out) for out in full_outs) == _get_out_draws(partial_outs, possible_cards)
+
+
+def test_when_find_player_outs_and_implicit_then_special_cards_returned(engine, get_test_cards, get_deck_minus_set):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|HK"))
+    board = get_test_cards("H2|H7|S9")
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    flush_outs = engine.find_player_outs(
+        player, TexasHoldemHandType.Flush, board, possible_cards, method=OutsCalculationMethod.Implicit
+    )
+    trips_outs = engine.find_player_outs(
+        player,
+        TexasHoldemHandType.Trips,
+        board + [Card("DA")],
+        [card for card in possible_cards if card != Card("DA")],
+        method=OutsCalculationMethod.Implicit,
+    )
+
+    assert flush_outs == [[AnyValueCard("H"), AnyCard("")]]
+    assert trips_outs == [[AnySuitCard("A")]]
+
+
+def test_when_find_player_outs_and_explicit_full_then_surplus_draws_expanded(engine, get_test_cards, get_deck_minus_set):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards("HA|HK"))
+    board = get_test_cards("H2|H7|S9")
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    result = engine.find_player_outs(
+        player, TexasHoldemHandType.Flush, board, possible_cards, method=OutsCalculationMethod.ExplicitFull
+    )
+
+    # 9 hearts with any of the other 46 cards, less the 36 pairs of hearts counted twice
+    assert len(result) == 9 * 46 - 36
+
+
 # Public "Hand Maker" method tests
 # --------------------------------
 def test_when_make_straight_flush_hands_and_too_few_cards_then_empty_list_returned(
@@ -1354,6 +1667,47 @@ def test_when_make_high_card_hands_and_only_single_card_combos_available_then_re
     assert result[2].cards == get_test_cards("H4")
 
 
+@mark.parametrize("method, cards, kwargs, tiebreakers, num_hands", [
+    ("make_quads_hands", "C9|S9|H9|D9|HA|SA|C2", {}, [9, 14], 2),
+    ("make_full_house_hands", "C9|S9|H9|DK|SK|HK|C2", {}, [13, 9], 3),
+    ("make_flush_hands", "C9|C3|C7|CK|CJ|C4|C2", {}, [13, 11, 9, 7, 4], 1),
+    ("make_straight_hands", "C9|ST|HJ|DQ|SK|HK|C2", {}, [13], 2),
+    ("make_straight_flush_hands", "C9|CT|CJ|CQ|CK|CA|H2", {}, [14], 1),
+    ("make_trips_hands", "C9|S9|H9|DK|S4|HK|C2", {}, [9, 13, 4], 2),
+    ("make_trips_hands", "C9|S9|H9|DK|S4|HK|C2", {"include_kickers": False}, [9, None, None], 1),
+    ("make_trips_hands", "C9|S9|H9|DK|S4|HK|C4|DA", {}, [9, 14, 13], 2),
+    ("make_two_pair_hands", "C9|S9|H4|DK|S4|HK|C2", {}, [13, 9, 4], 2),
+    ("make_two_pair_hands", "C9|S9|H4|DK|S4|HK|CA", {}, [13, 9, 14], 1),
+    ("make_pair_hands", "C9|S9|H4|DK|S4|HQ|C2", {}, [9, 13, 12, 4], 2),
+    ("make_pair_hands", "C9|S9|H9|DK|SK", {}, [13, 9, None, None], 3),
+    ("make_pair_hands", "C9|S9|DK|HK|S4|H5|C4|D2", {}, [13, 9, 5, 4], 4),
+    ("make_high_card_hands", "C9|S3|H4|DK|S7|HQ|C2", {}, [13, 12, 9, 7, 4], 1),
+    ("make_high_card_hands", "DJ|CQ|DA|DK|H2|DT", {}, [14, 13, 12, 11, 2], 1),
+    ("make_high_card_hands", "C6|C7|C8|C9|CT", {}, [10, 9, 8, 7, None], 1),
+])
+def test_when_make_hands_and_best_only_then_return_best_hands(engine, get_test_cards, method, cards, kwargs, tiebreakers, num_hands):
+    cards = get_test_cards(cards)
+    all_hands = getattr(engine, method)(cards, **kwargs)
+
+    result = getattr(engine, method)(cards, best_only=True, **kwargs)
+
+    assert len(result) == num_hands
+    assert all(hand.tiebreakers == tiebreakers for hand in result)
+    assert [hand.cards for hand in result] == [hand.cards for hand in all_hands[:num_hands]]
+
+
+@mark.parametrize("method", [
+    "make_straight_flush_hands", "make_quads_hands", "make_full_house_hands", "make_flush_hands",
+    "make_straight_hands", "make_trips_hands", "make_two_pair_hands", "make_pair_hands",
+])
+def test_when_make_hands_and_best_only_and_no_hands_then_return_empty_list(engine, get_test_cards, method):
+    cards = get_test_cards("C9|S3|H4|DK|S7|HQ|C2")
+
+    result = getattr(engine, method)(cards, best_only=True)
+
+    assert result == []
+
+
 def test_when_find_outs_straight_flush_and_no_eligible_suits_then_return_empty_list(engine, get_test_cards):
     current_cards = get_test_cards("D7|D9|ST|SJ|C6|C5")
     available_cards = get_test_cards("D8|DT|SQ|SK|C2|C4")
@@ -1388,6 +1742,19 @@ def test_when_find_outs_straight_flush_and_one_draw_inside_then_correct_values_r
     assert get_test_cards("D8") in result
 
 
+@mark.parametrize("count_only, expected", [
+    (False, [[Card("D8")]]),
+    (True, OutsCount(1, 6)),
+])
+def test_when_find_outs_with_card_sets_then_same_outs_as_card_lists(engine, get_test_cards, count_only, expected):
+    current_cards = CardSet.from_cards(get_test_cards("D7|D9|DT|D6|C6"))
+    available_cards = CardSet.from_cards(get_test_cards("D5|D4|DJ|D8|C2|C4"))
+
+    result = engine.find_outs(TexasHoldemHandType.StraightFlush, current_cards, available_cards, 1, count_only)
+
+    assert result == expected
+
+
 def test_when_find_outs_straight_flush_and_one_draw_open_ended_then_correct_values_returned(engine, get_test_cards):
     current_cards = get_test_cards("D7|D9|DT|D8|C6")
     available_cards = get_test_cards("D6|D4|DJ|C2|C4")
@@ -2242,3 +2609,158 @@ def test_when_find_outs_pair_and_five_draws_then_return_outs(engine, get_test_ca
     assert get_test_cards("H8|D8|ANY_CARD|ANY_CARD|ANY_CARD") in result
     assert get_test_cards("H8|C8|ANY_CARD|ANY_CARD|ANY_CARD") in result
     assert get_test_cards("D8|C8|ANY_CARD|ANY_CARD|ANY_CARD") in result
+
+
+@mark.parametrize("hand_type", [
+    "straight_flush", "quads", "full_house", "flush", "straight", "trips", "two_pair", "pair"
+])
+@mark.parametrize("current_cards, remaining_draws", [
+    ("SK|SQ|S7|ST|C2", 2),
+    ("SK|CK|S7|ST|DK", 2),
+    ("H8|S9|DT|CJ", 3),
+    ("HA|H2|H3|H9|SJ|C4", 1),
+])
+def test_when_iter_outs_then_same_outs_as_find_outs_yielded_lazily(engine, get_test_cards, get_deck_minus_set, hand_type, current_cards, remaining_draws):
+    current_cards = get_test_cards(current_cards)
+    available_cards = get_deck_minus_set(current_cards)
+
+    result = getattr(engine, f"iter_outs_{hand_type}")(current_cards, available_cards, remaining_draws)
+    expected = getattr(engine, f"find_outs_{hand_type}")(current_cards, available_cards, remaining_draws)
+
+    assert isinstance(result, Iterator)
+    result = list(result)
+    assert len(result) == len(expected)
+    assert engine.deduplicate_card_sets(result) == engine.deduplicate_card_sets(expected)
+    assert list(getattr(engine, f"iter_outs_{hand_type}")(current_cards, available_cards, remaining_draws)) == result
+
+
+def test_when_iter_outs_and_explicit_full_then_unique_draws_yielded(engine, get_test_cards, get_deck_minus_set):
+    current_cards = get_test_cards("H8|S9|DT|CJ|H2")
+    available_cards = get_deck_minus_set(current_cards)
+
+    result = list(engine.iter_outs_straight(
+        current_cards, available_cards, 2, OutsCalculationMethod.ExplicitFull
+    ))
+
+    # every draw of two from the 47 available cards that holds at least one of the eight 7s and queens
+    assert len(result) == len(set(frozenset(out) for out in result))
+    assert len(result) == comb(47, 2) - comb(39, 2)
+
+
+def test_when_find_player_best_hand_with_result_cache_then_isomorphic_hands_found_once(engine, get_test_cards):
+    cache = IsomorphicResultCache()
+    cached_engine = TexasHoldemPokerEngine(result_cache=cache)
+    situations = [("HA|HK", "H7|H8|C2|HQ|D9"), ("SA|SK", "S7|S8|D2|SQ|C9")]
+
+    for hole_cards, board in situations:
+        player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+        expected = engine.find_player_best_hand(player, get_test_cards(board))
+
+        actual = cached_engine.find_player_best_hand(player, get_test_cards(board))
+
+        assert actual == expected
+        assert [hand.cards for hand in actual] == [hand.cards for hand in expected]
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@mark.parametrize("use_lookup_tables", [False, True])
+def test_when_find_player_best_hand_with_result_cache_then_cards_in_callers_order(engine, get_test_cards, use_lookup_tables):
+    cached_engine = TexasHoldemPokerEngine(result_cache=IsomorphicResultCache())
+    situations = [("H9|S9", "D9|C4|H4|SK|D2"), ("S9|H9", "C4|H4|D9|D2|SK"), ("C4|S9", "H9|D9|DK|H4|S2")]
+
+    for hole_cards, board in situations:
+        player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+        expected = engine.find_player_best_hand(player, get_test_cards(board), use_lookup_tables)
+
+        actual = cached_engine.find_player_best_hand(player, get_test_cards(board), use_lookup_tables)
+
+        assert [hand.cards for hand in actual] == [hand.cards for hand in expected]
+
+
+@mark.parametrize("hand_type, count_only, method", [
+    (TexasHoldemHandType.Flush, False, OutsCalculationMethod.ExplicitPartial),
+    (TexasHoldemHandType.Flush, False, OutsCalculationMethod.Implicit),
+    (TexasHoldemHandType.Straight, False, OutsCalculationMethod.ExplicitFull),
+    (TexasHoldemHandType.FullHouse, True, OutsCalculationMethod.ExplicitPartial),
+])
+def test_when_find_player_outs_with_result_cache_then_relabelled_outs_returned(engine, get_deck_minus_set, get_test_cards, hand_type, count_only, method):
+    cache = IsomorphicResultCache()
+    cached_engine = TexasHoldemPokerEngine(result_cache=cache)
+    situations = [("HA|HK", "H7|H8|C9"), ("DA|DK", "D7|D8|S9")]
+
+    for hole_cards, board in situations:
+        player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+        board = get_test_cards(board)
+        possible_cards = get_deck_minus_set(player.hole_cards + board)
+        expected = engine.find_player_outs(player, hand_type, board, possible_cards, count_only, method)
+
+        actual = cached_engine.find_player_outs(player, hand_type, board, possible_cards, count_only, method)
+
+        if count_only:
+            assert actual == expected
+        else:
+            assert actual == engine.deduplicate_card_sets(expected)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_when_calculate_equity_with_result_cache_then_isomorphic_equity_found_once(engine, get_test_cards):
+    cache = IsomorphicResultCache()
+    cached_engine = TexasHoldemPokerEngine(result_cache=cache)
+    situations = [("HA|HK", "C9|D9", "H7|H8|C2"), ("CA|CK", "S9|H9", "C7|C8|S2")]
+
+    for first_hole_cards, second_hole_cards, board in situations:
+        players = [
+            HumanPlayer("Matt", hole_cards=get_test_cards(first_hole_cards)),
+            HumanPlayer("Greg", hole_cards=get_test_cards(second_hole_cards)),
+        ]
+        expected = engine.calculate_equity(players, get_test_cards(board))
+
+        actual = cached_engine.calculate_equity(players, get_test_cards(board))
+        actual[0].wins += 1
+
+        assert cached_engine.calculate_equity(players, get_test_cards(board)) == expected
+
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+@mark.parametrize("hole_cards, board", [
+    ("HA|H9", "H7|H8|C9"),
+    ("SK|CK", "D7|S7|C2|HQ"),
+    ("D4|H5", "S6|C7"),
+])
+@mark.parametrize("count_only", [False, True])
+def test_when_find_player_outs_all_then_every_hand_type_found(engine, get_deck_minus_set, get_test_cards, hole_cards, board, count_only):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+    board = get_test_cards(board)
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+
+    actual = engine.find_player_outs_all(player, board, possible_cards, count_only)
+
+    assert list(actual.outs) == [hand_type for hand_type in TexasHoldemHandType if hand_type != TexasHoldemHandType.HighCard]
+    for hand_type, outs in actual.outs.items():
+        assert outs == engine.find_player_outs(player, hand_type, board, possible_cards, count_only)
+    assert actual.at_least == {}
+
+
+@mark.parametrize("hole_cards, board", [
+    ("HA|H9", "H7|H8|C9"),
+    ("SK|CK", "D7|S7|C2|HQ"),
+])
+def test_when_find_player_outs_all_then_at_least_counts_match_best_hands(engine, get_deck_minus_set, get_test_cards, hole_cards, board):
+    player = HumanPlayer("Matt", hole_cards=get_test_cards(hole_cards))
+    board = get_test_cards(board)
+    possible_cards = get_deck_minus_set(player.hole_cards + board)
+    draws = list(combinations(possible_cards, 5 - len(board)))
+    hand_types = list(TexasHoldemHandType)
+    best_hand_types = [
+        engine.find_player_best_hand(player, board + list(draw), use_lookup_tables=True)[0].type for draw in draws
+    ]
+
+    actual = engine.find_player_outs_all(player, board, possible_cards, count_only=True, include_at_least=True)
+
+    for index, hand_type in enumerate(hand_types):
+        expected_hits = sum(best_hand_type in hand_types[:index + 1] for best_hand_type in best_hand_types)
+        assert actual.at_least[hand_type] == OutsCount(expected_hits, len(draws))
+    assert actual.at_least[TexasHoldemHandType.HighCard].probability == 1.0
@@ -0,0 +1,29 @@
+from pytest import mark
+
+from pypoker.constants import (
+    GameTypes,
+    GameHandTypes,
+    GameHandStrengths,
+    GameHandNumCards,
+    GameHandTiebreakerArgs,
+    HAND_TYPE_CODES,
+    GAME_HAND_TYPES,
+    GAME_HAND_NUM_CARDS,
+    GAME_HAND_TIEBREAKER_ARGS,
+)
+
+
+@mark.parametrize("game", list(GameTypes))
+def test_when_flat_hand_type_constants_then_match_game_enums(game):
+    hand_types = GameHandTypes[game.name].value
+
+    assert set(GAME_HAND_TYPES[game][1:]) == set(hand_types)
+    assert GAME_HAND_TYPES[game][0] is None
+
+    for hand_type in hand_types:
+        code = HAND_TYPE_CODES[hand_type]
+
+        assert code == GameHandStrengths[game.name].value[hand_type.name].value
+        assert GAME_HAND_TYPES[game][code] is hand_type
+        assert GAME_HAND_NUM_CARDS[game][code] == GameHandNumCards[game.name].value[hand_type.name].value
+        assert GAME_HAND_TIEBREAKER_ARGS[game][code] == GameHandTiebreakerArgs[game.name].value[hand_type.name].value
@@ -1,9 +1,13 @@
+import pickle
+import random
+from copy import copy, deepcopy
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch, call
 
 from pytest import mark, raises, fixture
 
 from pypoker.constants import CardRank, CardSuit, TexasHoldemHandType, GameTypes
-from pypoker.constructs import Card, Deck, Hand, AnyValueCard, AnySuitCard, AnyCard
+from pypoker.constructs import Card, Deck, Hand, AnyValueCard, AnySuitCard, AnyCard, PlayerEquity, OutsCount, CardCounts, ArrayDeck, CardSet
 from pypoker.exceptions import InvalidGameError, InvalidHandTypeError, GameMismatchError
 
 
@@ -324,6 +328,62 @@ def test_when_any_card_to_explict_then_correct_cards_returned(get_test_cards):
 
 
 
+@mark.parametrize("card_id, card_int", [("C2", 0), ("D2", 1), ("H2", 2), ("S2", 3), ("C3", 4), ("HT", 34), ("SA", 51)])
+def test_when_card_to_int_then_correct_value_returned(card_id, card_int):
+    assert Card(card_id).to_int() == card_int
+
+
+def test_when_card_to_int_and_from_int_then_all_cards_round_trip():
+    for card in Deck().cards_all:
+        assert Card.from_int(card.to_int()) == card
+
+    assert sorted(card.to_int() for card in Deck().cards_all) == list(range(52))
+
+
+@mark.parametrize("card", [AnyCard(""), AnyValueCard("H"), AnySuitCard("7")])
+def test_when_special_card_to_int_then_raise_error(card):
+    with raises(ValueError, match="Cannot encode cards of type SpecialCard as an integer"):
+        card.to_int()
+
+
+@mark.parametrize("card_int", [-1, 52, "4", 4.0])
+def test_when_card_from_int_and_bad_value_then_raise_error(card_int):
+    with raises(ValueError, match="Card integer must be an integer between 0 and 51"):
+        Card.from_int(card_int)
+
+
+@mark.parametrize("card_class, card_id", [(Card, "HA"), (AnyValueCard, "D"), (AnySuitCard, "9"), (AnyCard, "")])
+def test_when_card_init_twice_then_same_object_returned(card_class, card_id):
+    assert card_class(card_id) is card_class(card_id)
+
+
+def test_when_card_from_int_then_interned_card_returned():
+    assert Card.from_int(51) is Card("SA")
+    assert Deck().cards_all[0] is Card("H2")
+
+
+def test_when_card_attribute_set_then_raise_error():
+    card = Card("HA")
+
+    with raises(FrozenInstanceError):
+        card.value = 2
+
+    assert Card("HA").value == 14
+
+
+@mark.parametrize("card", [Card("C5"), AnyValueCard("S"), AnySuitCard("Q"), AnyCard("")])
+def test_when_card_copied_or_pickled_then_same_object_returned(card):
+    assert copy(card) is card
+    assert deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
+
+def test_when_card_compared_to_special_card_then_not_equal():
+    assert Card("H7") == Card("H7")
+    assert Card("H7") != Card("D7")
+    assert AnySuitCard("7") != Card("H7")
+
+
 """
 Deck Construct Tests
 """
@@ -361,6 +421,62 @@ def test_when_deck_shuffle_then_shuffle_command_used():
     random_mock.assert_has_calls([call.shuffle(deck.cards_available)])
 
 
+def test_when_deck_shuffle_and_rng_given_then_rng_used():
+    deck = Deck(rng=random.Random(3))
+    expected = Deck().cards_available
+    random.Random(3).shuffle(expected)
+
+    deck.shuffle()
+
+    assert deck.cards_available == expected
+
+
+@mark.parametrize("deck_class", [Deck, ArrayDeck])
+def test_when_deck_deal_and_same_seed_then_same_cards_dealt(deck_class):
+    first = deck_class(rng=random.Random(3))
+    second = deck_class(rng=random.Random(3))
+
+    first_cards = first.deal(5) + first.deal(4)
+    second_cards = second.deal(9)
+
+    assert first_cards == second_cards
+    assert len(set(first_cards)) == 9
+    assert first.cards_used == first_cards
+    assert len(first.cards_available) == 43
+
+
+@mark.parametrize("deck_class", [Deck, ArrayDeck])
+def test_when_deck_deal_then_only_dealt_cards_shuffled(deck_class):
+    deck = deck_class(rng=random.Random(3))
+    cards = deck.cards_available
+
+    dealt = deck.deal(2)
+
+    assert set(dealt + deck.cards_available) == set(cards)
+    assert sum(card != original for card, original in zip(deck.cards_available, cards[2:])) <= 2
+
+
+@mark.parametrize("deck_class", [Deck, ArrayDeck])
+def test_when_deck_deal_and_not_enough_cards_available_then_raise_error(deck_class):
+    deck = deck_class()
+
+    with raises(ValueError, match="Not enough cards left in the deck!"):
+        deck.deal(53)
+
+
+def test_when_array_deck_deal_then_removed_cards_not_dealt(get_test_cards):
+    deck = ArrayDeck(rng=random.Random(3))
+    removed = get_test_cards("HA|SA|D9")
+    deck.remove(removed)
+
+    dealt = deck.deal(49)
+
+    assert not set(removed) & set(dealt)
+    deck.reset()
+    deck.remove(get_test_cards("C2"))
+    assert Card("C2") in deck.cards_removed
+
+
 def test_when_deck_draw_single_card_then_correct_card_returned(cards_five):
     deck = Deck()
     deck.cards_available = cards_five.copy()
@@ -510,6 +626,136 @@ def test_when_deck_order_cards_and_non_card_passed_then_raise_error():
         deck.order_cards(cards)
 
 
+"""
+ArrayDeck Construct Tests
+"""
+
+
+def test_when_array_deck_init_then_all_cards_available():
+    deck = ArrayDeck()
+
+    assert sorted(card.to_int() for card in deck.cards_available) == list(range(52))
+    assert deck.cards_used == []
+    assert deck.cards_removed == []
+    assert len(deck) == 52
+
+
+def test_when_array_deck_draw_then_cards_drawn_in_order():
+    deck = ArrayDeck()
+    expected = deck.cards_available[:5]
+
+    first = deck.draw()
+    rest = deck.draw(num=4)
+
+    assert first + rest == expected
+    assert deck.cards_used == expected
+    assert len(deck) == 47
+    assert not set(expected) & set(deck.cards_available)
+
+
+def test_when_array_deck_draw_ints_then_integer_encoded_cards_returned():
+    deck = ArrayDeck()
+    expected = [card.to_int() for card in deck.cards_available[:3]]
+
+    assert deck.draw_ints(3) == expected
+
+
+@mark.parametrize("num", [53, 49])
+def test_when_array_deck_draw_and_not_enough_cards_available_then_raise_error(get_test_cards, num):
+    deck = ArrayDeck()
+    deck.remove(get_test_cards("HA|SA|DA|CA")[: 53 - num])
+
+    with raises(ValueError, match="Not enough cards left in the deck!"):
+        deck.draw(num)
+
+
+def test_when_array_deck_remove_then_cards_not_drawn(get_test_cards):
+    deck = ArrayDeck()
+    removed = get_test_cards("HA|SA|D9")
+
+    deck.remove(removed)
+    deck.shuffle()
+    drawn = deck.draw(49)
+
+    assert sorted(deck.cards_removed, key=Card.to_int) == sorted(removed, key=Card.to_int)
+    assert not set(removed) & set(drawn)
+    assert len(deck) == 0
+
+
+@mark.parametrize("card_id, message", [
+    ("HA", "Card 'Ace of Hearts' has already been removed"),
+    ("DK", "Card 'King of Diamonds' has already been drawn"),
+])
+def test_when_array_deck_remove_unavailable_card_then_raise_error(card_id, message):
+    deck = ArrayDeck()
+    deck.remove([Card("HA")])
+    while Card("DK") not in deck.cards_used:
+        deck.draw()
+
+    with raises(ValueError, match=message):
+        deck.remove([Card(card_id)])
+
+
+@mark.parametrize("cards, message", [
+    ("SA|HA|HA", "Card 'Ace of Hearts' has already been removed"),
+    ("SA|HA|DK", "Card 'King of Diamonds' has already been drawn"),
+    ("SA|HA|ANY_CARD", "Cannot encode cards of type SpecialCard as an integer"),
+])
+def test_when_array_deck_remove_fails_then_deck_unchanged(get_test_cards, cards, message):
+    deck = ArrayDeck()
+    while Card("DK") not in deck.cards_used:
+        deck.draw()
+    available = deck.cards_available
+
+    with raises(ValueError, match=message):
+        deck.remove(get_test_cards(cards))
+
+    assert deck.cards_available == available
+    assert deck.cards_removed == []
+
+
+def test_when_array_deck_reset_then_drawn_cards_returned_and_removed_cards_kept(get_test_cards):
+    deck = ArrayDeck()
+    deck.remove(get_test_cards("HA|SA"))
+    deck.shuffle()
+    drawn = deck.draw(5)
+
+    deck.reset()
+
+    assert deck.cards_used == []
+    assert deck.draw(5) == drawn
+    assert len(deck.cards_removed) == 2
+    assert len(deck) == 45
+
+
+def test_when_array_deck_restore_then_all_cards_available(get_test_cards):
+    deck = ArrayDeck()
+    deck.remove(get_test_cards("HA|SA"))
+    deck.draw(5)
+
+    deck.restore()
+
+    assert sorted(card.to_int() for card in deck.cards_available) == list(range(52))
+    assert deck.cards_removed == []
+
+
+def test_when_array_deck_shuffle_then_only_live_cards_moved(get_test_cards):
+    deck = ArrayDeck()
+    deck.remove(get_test_cards("HA"))
+    drawn = deck.draw(3)
+    live = deck.cards_available
+
+    with patch("pypoker.constructs.random") as random_mock:
+        random_mock.shuffle.side_effect = lambda cards: cards.reverse()
+        deck.shuffle()
+
+    assert deck.cards_used == drawn
+    assert deck.cards_available == live[::-1]
+    assert deck.cards_removed == get_test_cards("HA")
+    deck.remove([live[0]])
+    assert deck.cards_available == live[:0:-1]
+
+
 """
 Hand Construct Tests
 """
@@ -595,6 +841,24 @@ def test_when_hand_and_incorrect_num_tiebreakers_then_raise_error(get_test_cards
         Hand(game, hand_type, cards, tiebreakers)
 
 
+def test_when_hand_and_validate_false_then_bad_arguments_not_checked(get_test_cards):
+    cards = get_test_cards("C4|C5|C6|C7|C8")
+
+    hand = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.StraightFlush, cards, [8, 7], validate=False)
+
+    assert hand.tiebreakers == [8, 7]
+    assert hand.strength == 9
+
+
+def test_when_hand_and_validate_false_then_same_hand_as_validated(get_test_cards):
+    cards = get_test_cards("C4|S4|HA|DA|D6")
+
+    validated = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.TwoPair, cards, [14, 4, 6])
+    trusted = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.TwoPair, cards, [14, 4, 6], validate=False)
+
+    assert vars(trusted) == vars(validated)
+
+
 @mark.parametrize("game, hand_type, cards, tiebreakers, strength", [
     (GameTypes.TexasHoldem, TexasHoldemHandType.StraightFlush, "C4|C5|C6|C7|C8", [8], 9),
     (GameTypes.TexasHoldem, TexasHoldemHandType.Quads, "C4|S4|H4|D4|HA", [4, 14], 8),
@@ -623,6 +887,59 @@ def test_when_hand_then_correct_values_set(get_test_cards, game, hand_type, card
     assert hand.strength == strength
 
 
+@mark.parametrize("strength, tiebreakers, key", [
+    (8, [4, None], 0x840000),
+    (5, [8], 0x580000),
+    (2, [4, 14, 10, 9], 0x24EA90),
+    (1, [14, 10, 9, None, None], 0x1EA900),
+])
+def test_when_hand_pack_key_then_correct_key_returned(strength, tiebreakers, key):
+    assert Hand.pack_key(strength, tiebreakers) == key
+
+
+def test_when_hands_sorted_by_key_then_same_order_as_comparisons(get_test_cards):
+    hands = [
+        Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D5|H5|H9"), [5, 9, None, None]),
+        Hand(GameTypes.TexasHoldem, TexasHoldemHandType.TwoPair, get_test_cards("D5|H5|H9|C9"), [9, 5, None]),
+        Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D5|H5|H9|C2"), [5, 9, 2, None]),
+        Hand(GameTypes.TexasHoldem, TexasHoldemHandType.HighCard, get_test_cards("SA"), [14, None, None, None, None]),
+        Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D6|H6"), [6, None, None, None]),
+    ]
+
+    by_key = sorted(hands, key=lambda hand: hand.key)
+
+    assert by_key == sorted(hands)
+    assert [hand.tiebreakers for hand in by_key] == [
+        [14, None, None, None, None], [5, 9, None, None], [5, 9, 2, None], [6, None, None, None], [9, 5, None]
+    ]
+
+
+@mark.parametrize("attribute, value", [
+    ("type", TexasHoldemHandType.Quads),
+    ("tiebreakers", [14, None]),
+    ("strength", 8),
+    ("key", 0x8E0000),
+])
+def test_when_hand_key_fields_set_then_raise_error(get_test_cards, attribute, value):
+    hand = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D5|H5"), [5, None, None, None])
+
+    with raises(AttributeError):
+        setattr(hand, attribute, value)
+
+    assert hand.key == 0x250000
+
+
+def test_when_hand_tiebreakers_list_changed_then_hand_unchanged(get_test_cards):
+    hand_a = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D5|H5"), [5, None, None, None])
+    hand_b = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D6|H6"), [6, None, None, None])
+
+    hand_a.tiebreakers[0] = 14
+
+    assert hand_a.tiebreakers == [5, None, None, None]
+    assert hand_a.key == 0x250000
+    assert hand_a < hand_b
+
+
 def test_when_hand_equality_and_diff_games_then_raise_error(get_test_cards):
     hand_a = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D5|H5|H9|CJ|SA"), [5, 14, 11, 9])
     hand_b = Hand(GameTypes.TexasHoldem, TexasHoldemHandType.Pair, get_test_cards("D5|H5|H9|CJ|SA"), [5, 14, 11, 9])
@@ -909,3 +1226,155 @@ def test_when_hand_less_than_and_equal_with_nones_then_return_true(get_test_card
 
     result = hand_b <= hand_a
     assert result is True
+
+
+"""
+PlayerEquity Construct Tests
+"""
+
+
+def test_when_player_equity_then_shares_and_equity_correct():
+    equity = PlayerEquity(wins=5, ties=3, losses=2, tie_counts={2: 2, 3: 1})
+
+    assert equity.total == 10
+    assert equity.win_share == 0.5
+    assert equity.tie_share == 0.3
+    assert equity.loss_share == 0.2
+    assert equity.equity == (5 + 2 / 2 + 1 / 3) / 10
+
+
+def test_when_player_equity_and_no_outcomes_then_zero_shares_returned():
+    equity = PlayerEquity()
+
+    assert equity.total == 0
+    assert (equity.win_share, equity.tie_share, equity.loss_share, equity.equity) == (0.0, 0.0, 0.0, 0.0)
+
+
+def test_when_player_equity_standard_error_then_correct_value_returned():
+    equity = PlayerEquity(wins=30, ties=20, losses=50, tie_counts={2: 20})
+
+    # outcomes are 30 x 1, 20 x 0.5 and 50 x 0, giving a mean of 0.4 and a variance of 0.19
+    assert abs(equity.equity - 0.4) < 1e-12
+    assert abs(equity.standard_error - (0.19 / 100) ** 0.5) < 1e-12
+
+
+def test_when_player_equity_confidence_interval_then_interval_clipped_to_valid_range():
+    equity = PlayerEquity(wins=99, ties=0, losses=1)
+
+    lower, upper = equity.confidence_interval(0.95)
+
+    assert lower < equity.equity < upper == 1.0
+    assert abs((equity.equity - lower) - 1.959964 * equity.standard_error) < 1e-6
+
+
+@mark.parametrize("confidence", [0, 1, 1.5])
+def test_when_player_equity_confidence_interval_and_bad_confidence_then_raise_error(confidence):
+    with raises(ValueError, match="confidence must be between 0 and 1"):
+        PlayerEquity(wins=1, losses=1).confidence_interval(confidence)
+
+
+"""
+OutsCount Construct Tests
+"""
+
+
+def test_when_outs_count_then_probability_and_misses_correct():
+    outs_count = OutsCount(hits=9, combinations=46)
+
+    assert outs_count.misses == 37
+    assert outs_count.probability == 9 / 46
+
+
+def test_when_outs_count_has_no_combinations_then_probability_is_zero():
+    assert OutsCount().probability == 0.0
+
+
+"""
+CardCounts Construct Tests
+"""
+
+
+def test_when_card_counts_built_then_cards_counted_by_value_and_suit(get_test_cards):
+    card_counts = CardCounts(get_test_cards("HA|SA|H7|C2"))
+
+    assert card_counts.by_value == [1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 2]
+    assert card_counts.by_suit == [1, 0, 2, 1]
+    assert card_counts.by_suit_value[2] == [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 1]
+    assert len(card_counts) == 4
+
+
+def test_when_card_counts_add_and_remove_then_counts_updated(get_test_cards):
+    card_counts = CardCounts(get_test_cards("HA|SA"))
+
+    card_counts.add(Card("D7"))
+    card_counts.remove(Card("SA"))
+
+    assert card_counts.by_value == CardCounts(get_test_cards("HA|D7")).by_value
+    assert card_counts.by_suit == [0, 1, 1, 0]
+    assert card_counts.by_suit_value[3] == [0] * 13
+    assert len(card_counts) == 2
+
+
+"""
+CardSet Construct Tests
+"""
+
+
+def test_when_card_set_from_cards_then_cards_iterated_in_canonical_order(get_test_cards):
+    card_set = CardSet.from_cards(get_test_cards("HA|C2|S7|H7|C2"))
+
+    assert card_set.to_cards() == get_test_cards("C2|H7|S7|HA")
+    assert card_set.to_ints() == [0, 22, 23, 50]
+    assert card_set == CardSet.from_ints([50, 23, 22, 0])
+    assert len(card_set) == 4
+
+
+@mark.parametrize("first_set, second_set, operation, expected_set", [
+    ("HA|SA|H7", "SA|D2", "union", "HA|SA|H7|D2"),
+    ("HA|SA|H7", "SA|D2", "intersection", "SA"),
+    ("HA|SA|H7", "SA|D2", "difference", "HA|H7"),
+    ("HA|SA", "D2", "intersection", ""),
+])
+def test_when_card_set_algebra_then_correct_card_set_returned(get_test_cards, first_set, second_set, operation, expected_set):
+    first = CardSet.from_cards(get_test_cards(first_set))
+    second = CardSet.from_cards(get_test_cards(second_set))
+    expected = CardSet.from_cards(get_test_cards(expected_set) if expected_set else [])
+
+    result = {
+        "union": lambda: first | second,
+        "intersection": lambda: first & second,
+        "difference": lambda: first - second,
+    }[operation]()
+
+    assert result == expected
+    assert bool(result) == bool(expected_set)
+
+
+def test_when_card_set_membership_then_correct_result(get_test_cards):
+    card_set = CardSet.from_cards(get_test_cards("HA|S7"))
+
+    assert Card("HA") in card_set
+    assert Card("SA") not in card_set
+    assert AnyCard("*") not in card_set
+    assert CardSet.from_cards(get_test_cards("S7")).issubset(card_set)
+    assert card_set.isdisjoint(CardSet.from_cards(get_test_cards("SA|D7")))
+
+
+def test_when_card_set_then_immutable_and_hashable(get_test_cards):
+    card_set = CardSet.from_cards(get_test_cards("HA|S7"))
+
+    with raises(FrozenInstanceError):
+        card_set.mask = 0
+
+    assert {card_set: 1}[CardSet.from_cards(get_test_cards("S7|HA"))] == 1
+
+
+def test_when_card_set_from_special_card_then_raise_error():
+    with raises(ValueError, match="Cannot add cards of type SpecialCard to a CardSet"):
+        CardSet.from_cards([AnyValueCard("H")])
+
+
+@mark.parametrize("mask", [-1, 1 << 52, "1"])
+def test_when_card_set_bad_mask_then_raise_error(mask):
+    with raises(ValueError, match="CardSet mask must be an integer between 0 and"):
+        CardSet(mask)
@@ -0,0 +1,37 @@
+import random
+
+from pytest import mark, importorskip
+
+from pypoker.rng import random_below, spawn_rngs
+
+
+def test_when_random_below_and_no_rng_then_random_module_used():
+    random.seed(4)
+    expected = random.Random(4).randrange(10)
+
+    assert random_below(None, 10) == expected
+
+
+def test_when_random_below_and_random_rng_then_randrange_used():
+    assert random_below(random.Random(4), 10) == random.Random(4).randrange(10)
+
+
+def test_when_random_below_and_numpy_generator_then_integers_used():
+    numpy = importorskip("numpy")
+
+    actual = random_below(numpy.random.default_rng(4), 10)
+
+    assert isinstance(actual, int)
+    assert actual == int(numpy.random.default_rng(4).integers(10))
+
+
+@mark.parametrize("counter_based", [False, True])
+def test_when_spawn_rngs_then_streams_reproducible_and_independent(counter_based):
+    if counter_based:
+        importorskip("numpy")
+
+    first = [random_below(rng, 1 << 30) for rng in spawn_rngs(7, 3, counter_based)]
+    second = [random_below(rng, 1 << 30) for rng in spawn_rngs(7, 3, counter_based)]
+
+    assert first == second
+    assert len(set(first)) == 3